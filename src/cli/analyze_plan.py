@@ -7,12 +7,15 @@ Analyzes terraform plan JSON files to categorize resource changes.
 import argparse
 import html
 import json
-import json5
+import os
 import sys
+from collections import Counter, defaultdict
 from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple, Set, Any, Optional
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Tuple, Set, Any, Optional
 
 # Import shared HTML/CSS generation utilities
 import src.lib.html_generation
@@ -20,30 +23,217 @@ from src.lib.diff_utils import (
     highlight_char_diff,
     highlight_json_diff as highlight_json_diff_util,
 )
+from src.lib.json_utils import load_json_file
 
-try:
+if TYPE_CHECKING:
     from src.core.hcl_value_resolver import HCLValueResolver
-except ImportError:
-    HCLValueResolver = None  # Optional dependency
 
 try:
-    from src.security.salt_manager import (
-        generate_salt,
-        generate_position_seed,
-        store_salt,
-        load_salt,
-    )
-    from src.security.sensitive_obfuscator import traverse_and_obfuscate
-except ImportError as e:
-    print(
-        f"Warning: Obfuscate subcommand dependencies not available: {e}",
-        file=sys.stderr,
+    import orjson
+except ImportError:
+    orjson = None  # Optional dependency, speeds up JSON encoding
+
+
+# Static legend block for the single-plan HTML report
+_REPORT_LEGEND_HTML = """        <div class="legend">
+            <h2 onclick="toggleLegend()"><span id="legend-icon">▶</span> Report Guide</h2>
+            <div class="legend-content hidden" id="legend-content">
+                <div class="legend-section">
+                    <h3>📊 Value Indicators</h3>
+                    <div class="legend-item">
+                        <span class="legend-symbol">⚙️</span>
+                        <span class="legend-description"><strong>From Terraform config</strong> - Value resolved from .tf files, not from plan. May contain unresolved variable references like <code>${...}</code>. Shows yellow background.</span>
+                    </div>
+                    <div class="legend-item">
+                        <span class="legend-symbol">⚠️</span>
+                        <span class="legend-description"><strong>Computed at apply</strong> - Value will only be known when Terraform applies the changes. No HCL definition found. Shows yellow background.</span>
+                    </div>
+                    <div class="legend-item">
+                        <span class="legend-symbol" style="color: #2b8a3e;">●</span>
+                        <span class="legend-description"><strong>Known value</strong> - Value is known from the plan. Shows green background for additions.</span>
+                    </div>
+                </div>
+                
+                <div class="legend-section">
+                    <h3>ℹ️ Comparison Rules</h3>
+                    <div class="legend-item">
+                        <span class="legend-symbol">🔗</span>
+                        <span class="legend-description"><strong>Resource IDs are case-insensitive</strong> - Azure resource IDs like <code>/providers/Microsoft.IotHub</code> are compared without case sensitivity, so changes only in casing (e.g., <code>IotHub</code> vs <code>Iothub</code>) are filtered out as noise.</span>
+                    </div>
+                </div>
+                
+                <div class="legend-section">
+                    <h3>🎨 Color Coding</h3>
+                    <div class="legend-item">
+                        <span class="legend-symbol" style="background: #d3f9d8; padding: 4px 8px; border-radius: 3px;">Green</span>
+                        <span class="legend-description">Added values or normal changes from the plan</span>
+                    </div>
+                    <div class="legend-item">
+                        <span class="legend-symbol" style="background: #ffe0e0; padding: 4px 8px; border-radius: 3px;">Red</span>
+                        <span class="legend-description">Removed values</span>
+                    </div>
+                    <div class="legend-item">
+                        <span class="legend-symbol" style="background: #fff4e6; padding: 4px 8px; border-radius: 3px;">Yellow</span>
+                        <span class="legend-description">Values from Terraform config or computed at apply (not final)</span>
+                    </div>
+                    <div class="legend-item">
+                        <span class="legend-symbol" style="color: #666;">Gray</span>
+                        <span class="legend-description">Unchanged values (shown for context)</span>
+                    </div>
+                </div>
+                
+                <div class="legend-section">
+                    <h3>📑 Report Sections</h3>
+                    <div class="legend-item">
+                        <span class="legend-symbol">📝</span>
+                        <span class="legend-description"><strong>Created Resources</strong> - New resources being added to your infrastructure</span>
+                    </div>
+                    <div class="legend-item">
+                        <span class="legend-symbol">🔄</span>
+                        <span class="legend-description"><strong>Updated Resources</strong> - Existing resources with configuration changes (click to expand/collapse)</span>
+                    </div>
+                    <div class="legend-item">
+                        <span class="legend-symbol">🏷️</span>
+                        <span class="legend-description"><strong>Tag-Only Updates</strong> - Resources with only tag changes</span>
+                    </div>
+                    <div class="legend-item">
+                        <span class="legend-symbol">🔽</span>
+                        <span class="legend-description"><strong>Ignored Changes</strong> - Changes filtered out based on ignore configuration (at bottom)</span>
+                    </div>
+                </div>
+                
+                <div class="legend-section">
+                    <h3>🔒 Security & Privacy</h3>
+                    <div class="legend-item">
+                        <span class="legend-symbol">🔒</span>
+                        <span class="legend-description"><strong>Sensitive Values</strong> - Fields marked as sensitive by Terraform are redacted and shown as <code>&lt;REDACTED&gt;</code>. Use <code>--show-sensitive</code> flag to override (not recommended for shared reports).</span>
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+"""
+
+# Common Terraform provider and reference prefixes that start a direct HCL
+# reference such as azurerm_resource.name.attribute
+_HCL_REFERENCE_PREFIXES = (
+    "azurerm_",
+    "aws_",
+    "google_",
+    "azuread_",
+    "data.",
+    "var.",
+    "local.",
+    "module.",
+)
+
+# Badge appended to attribute names whose values are (partly) sensitive
+_SENSITIVE_BADGE_HTML = ' <span class="sensitive-badge">🔒 SENSITIVE</span>'
+
+# Toggle scripts for the legend, created resources and resource changes
+_REPORT_SCRIPT_HTML = """    <script>
+        function toggleLegend() {
+            const content = document.getElementById('legend-content');
+            const icon = document.getElementById('legend-icon');
+            content.classList.toggle('hidden');
+            icon.textContent = content.classList.contains('hidden') ? '▶' : '▼';
+        }
+        
+        function toggleCreatedResources() {
+            const content = document.getElementById('created-resources');
+            const icon = document.getElementById('created-icon');
+            content.classList.toggle('hidden');
+            icon.textContent = content.classList.contains('hidden') ? '▶' : '▼';
+        }
+        
+        function toggleResource(icon) {
+            icon.classList.toggle('collapsed');
+            const header = icon.parentElement;
+            const content = header.nextElementSibling;
+            content.classList.toggle('hidden');
+        }
+        
+        function toggleAll() {
+            const icons = document.querySelectorAll('.toggle-icon');
+            const firstIcon = icons[0];
+            const shouldExpand = firstIcon.classList.contains('collapsed');
+            
+            icons.forEach(icon => {
+                const header = icon.parentElement;
+                const content = header.nextElementSibling;
+                if (shouldExpand) {
+                    icon.classList.remove('collapsed');
+                    content.classList.remove('hidden');
+                } else {
+                    icon.classList.add('collapsed');
+                    content.classList.add('hidden');
+                }
+            });
+        }
+    </script>
+"""
+
+# Closing markup for the single-plan HTML report, assembled once at import
+_REPORT_FOOTER_HTML = (
+    """
+    </div>
+    
+"""
+    + _REPORT_SCRIPT_HTML
+    + """</body>
+</html>
+"""
+)
+
+
+def _canonical_json(value: Any) -> Any:
+    """Encode a value with sorted keys for use as a cache key.
+
+    Uses orjson when available, falling back to the standard library for
+    values orjson cannot encode (e.g. integers wider than 64 bits). Both
+    encodings are compact, as the keys are only compared, never displayed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _write_json_file(data: Any, output_path: str, ensure_ascii: bool = True) -> None:
+    """Write data as indented JSON, using orjson when available.
+
+    Encodes in one pass and writes once; json.dump would issue a write per
+    token. The data is a tree built from parsed JSON, so it cannot contain
+    cycles and the stdlib encoder's circular reference tracking is skipped.
+    orjson always writes UTF-8 without escaping non-ASCII characters.
+    """
+    if orjson is not None:
+        try:
+            serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            with open(output_path, "wb") as f:
+                f.write(serialized)
+            return
+
+    serialized = json.dumps(
+        data, indent=2, ensure_ascii=ensure_ascii, check_circular=False
     )
-    generate_salt = None
-    generate_position_seed = None
-    store_salt = None
-    load_salt = None
-    traverse_and_obfuscate = None
+    with open(output_path, "w") as f:
+        f.write(serialized)
+
+
+@lru_cache(maxsize=10000)
+def _escape_name(text: str) -> str:
+    """HTML-escape a resource address, type, field name or ignore reason.
+
+    These strings repeat across the report (an address is listed under every
+    field ignored on it), so the escaped form is memoized.
+    """
+    return html.escape(text)
 
 
 class TerraformPlanAnalyzer:
@@ -76,19 +266,33 @@ class TerraformPlanAnalyzer:
         self.resource_changes = []
 
         # Combine default and custom ignore fields (global)
-        self.ignore_fields = self.DEFAULT_IGNORE_FIELDS.copy()
-        if custom_ignore_fields:
-            self.ignore_fields.update(custom_ignore_fields)
+        self.custom_ignore_fields = set(custom_ignore_fields or ())
+        self.ignore_fields = self.DEFAULT_IGNORE_FIELDS | self.custom_ignore_fields
 
         # Resource-type-specific ignores
         self.resource_specific_ignores = resource_specific_ignores or {}
 
+        # Combined (global + resource-specific) ignore set per resource type,
+        # built on first use so each resource only needs a dict lookup
+        self._ignore_sets: Dict[str, FrozenSet[str]] = {}
+
         # Reasons for ignores
         self.global_ignore_reasons = global_ignore_reasons or {}
         self.resource_ignore_reasons = resource_ignore_reasons or {}
+        self._effective_ignore_reasons = self._build_effective_ignore_reasons()
 
         # Track what was actually ignored during analysis
-        self.ignored_changes = {}
+        # Maps resource_type -> field -> list of resource addresses
+        self.ignored_changes: Dict[str, Dict[str, List[str]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        # Running count of addresses recorded in ignored_changes
+        self.ignored_total = 0
+        # Field-grouped view of ignored_changes shared by the HTML and JSON
+        # reports, stored with the ignored_total it was built at
+        self._ignored_by_field_cache: Optional[
+            Tuple[int, Dict[str, List[Tuple[str, str]]]]
+        ] = None
 
         # HCL resolver for "known after apply" values
         self.hcl_resolver = hcl_resolver
@@ -99,10 +303,31 @@ class TerraformPlanAnalyzer:
         # Whether to show sensitive values (default: redact them)
         self.show_sensitive = show_sensitive
 
+        # Processed config changes shared by the HTML and JSON reports,
+        # stored with the results dict they were built from
+        self._updated_changes_cache: Optional[Tuple[Dict, List[Dict[str, Any]]]] = None
+
+        # Memoized JSON diff HTML keyed by canonical (before, after, values_changed)
+        self._json_diff_cache: Dict[
+            Tuple[Any, Any, Optional[bool]], Tuple[str, str, bool]
+        ] = {}
+
+    def _build_effective_ignore_reasons(self) -> Dict[str, str]:
+        """Flatten ignore reasons into a single field -> reason lookup.
+
+        Global reasons take precedence; otherwise the first resource type that
+        gives a reason for the field wins.
+        """
+        reasons: Dict[str, str] = {}
+        for fields in self.resource_ignore_reasons.values():
+            for field, reason in fields.items():
+                reasons.setdefault(field, reason)
+        reasons.update(self.global_ignore_reasons)
+        return reasons
+
     def load_plan(self) -> None:
         """Load the terraform plan JSON file."""
-        with open(self.plan_file, "r") as f:
-            self.plan_data = json.load(f)
+        self.plan_data = load_json_file(self.plan_file)
         self.resource_changes = self.plan_data.get("resource_changes", [])
 
     def analyze(self) -> Dict[str, List]:
@@ -205,10 +430,15 @@ class TerraformPlanAnalyzer:
             resource_address.split(".")[0] if "." in resource_address else ""
         )
 
-        # Build combined ignore set (global + resource-specific)
-        ignore_set = self.ignore_fields.copy()
-        if resource_type in self.resource_specific_ignores:
-            ignore_set.update(self.resource_specific_ignores[resource_type])
+        # Combined ignore set (global + resource-specific)
+        ignore_set = self._ignore_sets.get(resource_type)
+        if ignore_set is None:
+            ignore_set = frozenset(
+                self.ignore_fields.union(
+                    self.resource_specific_ignores.get(resource_type, ())
+                )
+            )
+            self._ignore_sets[resource_type] = ignore_set
 
         # Filter out ignored values and track what was ignored
         real_changes = {}
@@ -218,11 +448,8 @@ class TerraformPlanAnalyzer:
                 continue
             elif k in ignore_set:
                 # Track this ignored change
-                if resource_type not in self.ignored_changes:
-                    self.ignored_changes[resource_type] = {}
-                if k not in self.ignored_changes[resource_type]:
-                    self.ignored_changes[resource_type][k] = []
                 self.ignored_changes[resource_type][k].append(resource_address)
+                self.ignored_total += 1
             else:
                 # This is a real change (including fields that will be "known after apply")
                 real_changes[k] = v
@@ -241,6 +468,26 @@ class TerraformPlanAnalyzer:
         else:
             return str(value)
 
+    @staticmethod
+    def _contains_hcl_interp(value: Any) -> bool:
+        """Check if a value contains a ${...} interpolation anywhere in its strings.
+
+        Walks nested dicts and lists directly instead of serializing the whole
+        structure to JSON just to search it.
+        """
+        if isinstance(value, str):
+            return "${" in value
+        if isinstance(value, dict):
+            return any(
+                "${" in key or TerraformPlanAnalyzer._contains_hcl_interp(val)
+                for key, val in value.items()
+            )
+        if isinstance(value, (list, tuple)):
+            return any(
+                TerraformPlanAnalyzer._contains_hcl_interp(item) for item in value
+            )
+        return False
+
     @staticmethod
     def _is_azure_resource_id(value: Any) -> bool:
         """Check if a value is an Azure resource ID."""
@@ -447,18 +694,7 @@ class TerraformPlanAnalyzer:
             return True
 
         # Direct reference patterns: azurerm_resource.name.attribute or resource["key"].attribute
-        # Common Terraform provider prefixes
-        provider_prefixes = [
-            "azurerm_",
-            "aws_",
-            "google_",
-            "azuread_",
-            "data.",
-            "var.",
-            "local.",
-            "module.",
-        ]
-        if any(value.startswith(prefix) for prefix in provider_prefixes):
+        if value.startswith(_HCL_REFERENCE_PREFIXES):
             # Must have dots or brackets to be a reference
             if "." in value or "[" in value:
                 return True
@@ -529,6 +765,52 @@ class TerraformPlanAnalyzer:
         # Not sensitive
         return value, False
 
+    @staticmethod
+    def _values_differ(before_value: Any, after_value: Any) -> bool:
+        """Check if two raw values differ, avoiding deep compares where possible.
+
+        Identical objects are equal without inspection, and containers of
+        different lengths are rejected before falling back to a full compare.
+        """
+        if before_value is after_value:
+            return False
+        if (
+            isinstance(before_value, (dict, list))
+            and type(before_value) is type(after_value)
+            and len(before_value) != len(after_value)
+        ):
+            return True
+        return before_value != after_value
+
+    def _has_sensitive_fields(self, value: Any, sensitivity_map: Any) -> bool:
+        """Check if any part of a value is marked sensitive.
+
+        Gives the same answer as the sensitivity info of _redact_sensitive_fields
+        but is driven by the sensitivity map, which is usually far smaller than
+        the value: only mapped keys and indexes are visited, unmarked entries
+        are skipped, and the walk stops at the first sensitive field.
+        """
+        if sensitivity_map is True:
+            return True
+        if not sensitivity_map:
+            return False
+
+        if isinstance(value, dict) and isinstance(sensitivity_map, dict):
+            return any(
+                field_sensitivity
+                and key in value
+                and self._has_sensitive_fields(value[key], field_sensitivity)
+                for key, field_sensitivity in sensitivity_map.items()
+            )
+
+        if isinstance(value, list) and isinstance(sensitivity_map, list):
+            return any(
+                elem_sensitivity and self._has_sensitive_fields(val, elem_sensitivity)
+                for val, elem_sensitivity in zip(value, sensitivity_map)
+            )
+
+        return False
+
     def _redact_with_change_detection(
         self,
         before_value: Any,
@@ -551,11 +833,10 @@ class TerraformPlanAnalyzer:
         before_is_sensitive = self._is_value_sensitive(before_sensitivity)
         after_is_sensitive = self._is_value_sensitive(after_sensitivity)
 
-        # Compare the actual values BEFORE redaction
-        values_changed = before_value != after_value
-
         # Now handle redaction
         if before_is_sensitive or after_is_sensitive:
+            # Compare the actual values BEFORE redaction
+            values_changed = self._values_differ(before_value, after_value)
             if self.show_sensitive:
                 return before_value, after_value, values_changed
             else:
@@ -650,27 +931,40 @@ class TerraformPlanAnalyzer:
             return redacted_before, redacted_after, any_changed
 
         # Not sensitive - return as is
-        return before_value, after_value, values_changed
+        return (
+            before_value,
+            after_value,
+            self._values_differ(before_value, after_value),
+        )
 
-    def print_summary(self, results: Dict[str, List]) -> None:
-        """Print a formatted summary of the analysis."""
-        created_count = len(results["created"])
-        imported_count = len(results["imported"])
+    def _summary_stats(self, results: Dict) -> Dict[str, int]:
+        """Count resources in each change category for the report summaries."""
         tag_only_count = len(results["tag_only"])
         config_count = len(results["config_changes"])
-        deleted_count = len(results["deleted"])
-        total = len(self.resource_changes)
+        return {
+            "total": len(self.resource_changes),
+            "created": len(results["created"]),
+            "imported": len(results["imported"]),
+            "updated": tag_only_count + config_count,
+            "tag_only": tag_only_count,
+            "config_changes": config_count,
+            "deleted": len(results["deleted"]),
+        }
+
+    def print_summary(self, results: Dict[str, List]) -> None:
+        """Print a formatted summary of the analysis."""
+        stats = self._summary_stats(results)
 
         print("=" * 60)
         print("TERRAFORM PLAN ANALYSIS SUMMARY")
         print("=" * 60)
-        print(f"Total Resources: {total}")
-        print(f"  Created:       {created_count}")
-        print(f"  Imported:      {imported_count}")
-        print(f"  Updated:       {tag_only_count + config_count}")
-        print(f"    - Tag-only:      {tag_only_count}")
-        print(f"    - Config changes: {config_count}")
-        print(f"  Deleted:       {deleted_count}")
+        print(f"Total Resources: {stats['total']}")
+        print(f"  Created:       {stats['created']}")
+        print(f"  Imported:      {stats['imported']}")
+        print(f"  Updated:       {stats['updated']}")
+        print(f"    - Tag-only:      {stats['tag_only']}")
+        print(f"    - Config changes: {stats['config_changes']}")
+        print(f"  Deleted:       {stats['deleted']}")
         print("=" * 60)
 
     def print_details(self, results: Dict[str, List], verbose: bool = False) -> None:
@@ -691,7 +985,7 @@ class TerraformPlanAnalyzer:
         if results["config_changes"]:
             print(f"\nUPDATED - CONFIG CHANGES ({len(results['config_changes'])})")
             print("-" * 60)
-            for item in sorted(results["config_changes"], key=lambda x: x["address"]):
+            for item in sorted(results["config_changes"], key=itemgetter("address")):
                 changed_attrs = item["changed_attributes"]
 
                 if verbose:
@@ -742,6 +1036,26 @@ class TerraformPlanAnalyzer:
             for r in sorted(results["deleted"]):
                 print(f"  {r}")
 
+    def print_ignore_fields(self) -> None:
+        """Print the configured ignore fields before analysis."""
+        lines = ["=" * 60, "IGNORED FIELDS", "=" * 60]
+        lines.append("\nDefault ignored fields (global):")
+        lines.extend(f"  - {field}" for field in sorted(self.DEFAULT_IGNORE_FIELDS))
+        if self.custom_ignore_fields:
+            lines.append("\nCustom ignored fields (global):")
+            lines.extend(f"  - {field}" for field in sorted(self.custom_ignore_fields))
+        if self.resource_specific_ignores:
+            lines.append("\nResource-specific ignored fields:")
+            for resource_type in sorted(self.resource_specific_ignores):
+                lines.append(f"  {resource_type}:")
+                lines.extend(
+                    f"    - {field}"
+                    for field in sorted(self.resource_specific_ignores[resource_type])
+                )
+        lines.append("=" * 60)
+        print("\n".join(lines))
+        print()
+
     def print_ignore_report(self) -> None:
         """Print a report of what was ignored during analysis."""
         if not self.ignored_changes:
@@ -751,12 +1065,7 @@ class TerraformPlanAnalyzer:
         print("IGNORED CHANGES REPORT")
         print("=" * 60)
 
-        total_ignored = sum(
-            len(resources)
-            for fields in self.ignored_changes.values()
-            for resources in fields.values()
-        )
-        print(f"\nTotal ignored changes: {total_ignored}\n")
+        print(f"\nTotal ignored changes: {self.ignored_total}\n")
 
         for resource_type in sorted(self.ignored_changes.keys()):
             fields = self.ignored_changes[resource_type]
@@ -813,24 +1122,24 @@ class TerraformPlanAnalyzer:
             after: The after value
             values_changed: Optional metadata flag indicating if the actual values changed
                            (used when both display as identical strings like <REDACTED (changed)>)
+
+        Results are memoized on the canonical JSON of both sides, so identical
+        changes shared by many resources (e.g. default tags) are diffed once.
         """
-        # Check if after is "(known after apply)" or contains HCL values
-        is_known_after_apply = after == "(known after apply)"
-
-        # Check if value is from HCL (contains interpolations like ${...})
-        # This applies when we resolved from HCL but it has variable references
-        is_from_hcl = False
-        if isinstance(after, (dict, list, str)):
-            after_json = (
-                json.dumps(after, indent=2, sort_keys=True)
-                if not isinstance(after, str)
-                else after
-            )
-            is_from_hcl = "${" in after_json
+        before_key = _canonical_json(before)
+        after_key = _canonical_json(after)
+        cache_key = (before_key, after_key, values_changed)
+        cached = self._json_diff_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # If it's from HCL, treat like known_after_apply for styling purposes
-        if is_from_hcl:
-            is_known_after_apply = True
+        # Check if after is "(known after apply)" or contains HCL values
+        # (interpolations like ${...}), which are styled the same way. Plain
+        # strings are checked directly; only containers need a deep scan.
+        if isinstance(after, str):
+            is_known_after_apply = after == "(known after apply)" or "${" in after
+        else:
+            is_known_after_apply = self._contains_hcl_interp(after)
 
         # Normalize values to handle case-insensitive Azure resource IDs
         # This ensures resource ID casing differences don't show in the diff
@@ -849,27 +1158,27 @@ class TerraformPlanAnalyzer:
             values_changed=values_changed,
         )
 
-        return before_html, after_html, is_known_after_apply
+        result = (before_html, after_html, is_known_after_apply)
+        self._json_diff_cache[cache_key] = result
+        return result
 
-    def _transform_results_for_html(self, results: Dict) -> Dict[str, Any]:
-        """Transform results dict from analyze() format to HTML-friendly format."""
-        transformed = {
-            "summary": {
-                "total": len(self.resource_changes),
-                "created": len(results["created"]),
-                "imported": len(results["imported"]),
-                "updated": len(results["tag_only"]) + len(results["config_changes"]),
-                "tag_only": len(results["tag_only"]),
-                "config_changes": len(results["config_changes"]),
-                "deleted": len(results["deleted"]),
-            },
-            "created": results["created"],
-            "updated": [],
-        }
+    def _build_updated_changes(self, results: Dict) -> List[Dict[str, Any]]:
+        """Redact and classify every changed attribute of the updated resources.
+
+        This is the per-attribute work shared by the HTML and JSON reports. The
+        result is cached for the given results dict so generating both reports
+        only processes each change once.
+
+        Returns:
+            List of {"address": str, "changes": [change dict]} in analysis order
+        """
+        cached = self._updated_changes_cache
+        if cached is not None and cached[0] is results:
+            return cached[1]
 
-        # Transform config_changes from tuple format to list-of-dicts format
+        updated_resources = []
         for item in results["config_changes"]:
-            changes_list = []
+            changes = []
             for attr_name, (
                 before_val,
                 after_val,
@@ -890,36 +1199,120 @@ class TerraformPlanAnalyzer:
 
                 # If not sensitive at the top level, check nested sensitivity
                 if not has_sensitive:
-                    _, before_sensitivity = self._redact_sensitive_fields(
+                    has_sensitive = self._has_sensitive_fields(
                         before_val, before_sens_map
-                    )
-                    _, after_sensitivity = self._redact_sensitive_fields(
-                        after_val, after_sens_map
-                    )
-                    has_sensitive = bool(before_sensitivity or after_sensitivity)
+                    ) or self._has_sensitive_fields(after_val, after_sens_map)
+
+                # Determine if this is "known after apply" or from HCL
+                # (interpolations or direct references)
+                if isinstance(after_val, str):
+                    if after_val == "(known after apply)":
+                        is_from_hcl = False
+                        is_known_after_apply = True
+                    else:
+                        is_from_hcl = self._is_hcl_reference(after_val)
+                        is_known_after_apply = is_from_hcl
+                else:
+                    is_from_hcl = self._contains_hcl_interp(after_val)
+                    is_known_after_apply = is_from_hcl
+
+                # Also keep raw HCL references for the JSON report
+                before_hcl_ref = None
+                after_hcl_ref = None
+                if isinstance(before_val, str) and self._is_hcl_reference(before_val):
+                    before_hcl_ref = before_val
+                if isinstance(after_val, str) and is_from_hcl:
+                    after_hcl_ref = after_val
 
-                changes_list.append(
+                changes.append(
                     {
                         "attribute": attr_name,
                         "before": display_before,
                         "after": display_after,
                         "is_sensitive": has_sensitive,
                         "values_changed": values_changed,
+                        "is_known_after_apply": is_known_after_apply,
+                        "before_hcl_reference": before_hcl_ref,
+                        "after_hcl_reference": after_hcl_ref,
                     }
                 )
 
+            updated_resources.append({"address": item["address"], "changes": changes})
+
+        self._updated_changes_cache = (results, updated_resources)
+        return updated_resources
+
+    def _ignored_changes_by_field(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Group ignored changes by field instead of resource type.
+
+        The grouping is rebuilt only when new ignored changes have been
+        recorded since it was last computed.
+
+        Returns:
+            Dict mapping field -> list of (resource address, resource type)
+        """
+        cached = self._ignored_by_field_cache
+        if cached is not None and cached[0] == self.ignored_total:
+            return cached[1]
+
+        by_field = defaultdict(list)
+        for resource_type, fields in self.ignored_changes.items():
+            for field, resources in fields.items():
+                # Add resources with their type
+                by_field[field].extend(
+                    (resource, resource_type) for resource in resources
+                )
+
+        self._ignored_by_field_cache = (self.ignored_total, by_field)
+        return by_field
+
+    def _transform_results_for_html(self, results: Dict) -> Dict[str, Any]:
+        """Transform results dict from analyze() format to HTML-friendly format.
+
+        Created and updated resources, and each resource's changes, are returned
+        already sorted in report order.
+        """
+        transformed = {
+            "summary": self._summary_stats(results),
+            "created": sorted(results["created"]),
+            "updated": [],
+        }
+
+        # Config changes share their per-attribute processing with the JSON report
+        by_attribute = itemgetter("attribute")
+        for item in self._build_updated_changes(results):
             transformed["updated"].append(
-                {"name": item["address"], "changes": changes_list}
+                {
+                    "name": item["address"],
+                    "changes": sorted(item["changes"], key=by_attribute),
+                }
             )
+        transformed["updated"].sort(key=itemgetter("name"))
 
         return transformed
 
     def generate_html_report(self, results: Dict, output_path: str) -> None:
-        """Generate an HTML report from the analysis results."""
+        """Generate an HTML report from the analysis results.
+
+        The report is streamed to the output file fragment by fragment so memory
+        stays proportional to a single resource block rather than the whole report.
+        """
         data = self._transform_results_for_html(results)
         current_date = datetime.now().strftime("%B %d, %Y")
 
-        html_content = f"""<!DOCTYPE html>
+        with open(
+            output_path,
+            "w",
+            encoding="utf-8",
+            errors="surrogatepass",
+            buffering=1 << 20,
+        ) as f:
+            write = f.write
+            escape = html.escape
+            escape_name = _escape_name
+
+            write(
+                f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -934,84 +1327,11 @@ class TerraformPlanAnalyzer:
             <p>Generated on {current_date}</p>
         </header>
         
-        <div class="legend">
-            <h2 onclick="toggleLegend()"><span id="legend-icon">▶</span> Report Guide</h2>
-            <div class="legend-content hidden" id="legend-content">
-                <div class="legend-section">
-                    <h3>📊 Value Indicators</h3>
-                    <div class="legend-item">
-                        <span class="legend-symbol">⚙️</span>
-                        <span class="legend-description"><strong>From Terraform config</strong> - Value resolved from .tf files, not from plan. May contain unresolved variable references like <code>${{...}}</code>. Shows yellow background.</span>
-                    </div>
-                    <div class="legend-item">
-                        <span class="legend-symbol">⚠️</span>
-                        <span class="legend-description"><strong>Computed at apply</strong> - Value will only be known when Terraform applies the changes. No HCL definition found. Shows yellow background.</span>
-                    </div>
-                    <div class="legend-item">
-                        <span class="legend-symbol" style="color: #2b8a3e;">●</span>
-                        <span class="legend-description"><strong>Known value</strong> - Value is known from the plan. Shows green background for additions.</span>
-                    </div>
-                </div>
-                
-                <div class="legend-section">
-                    <h3>ℹ️ Comparison Rules</h3>
-                    <div class="legend-item">
-                        <span class="legend-symbol">🔗</span>
-                        <span class="legend-description"><strong>Resource IDs are case-insensitive</strong> - Azure resource IDs like <code>/providers/Microsoft.IotHub</code> are compared without case sensitivity, so changes only in casing (e.g., <code>IotHub</code> vs <code>Iothub</code>) are filtered out as noise.</span>
-                    </div>
-                </div>
-                
-                <div class="legend-section">
-                    <h3>🎨 Color Coding</h3>
-                    <div class="legend-item">
-                        <span class="legend-symbol" style="background: #d3f9d8; padding: 4px 8px; border-radius: 3px;">Green</span>
-                        <span class="legend-description">Added values or normal changes from the plan</span>
-                    </div>
-                    <div class="legend-item">
-                        <span class="legend-symbol" style="background: #ffe0e0; padding: 4px 8px; border-radius: 3px;">Red</span>
-                        <span class="legend-description">Removed values</span>
-                    </div>
-                    <div class="legend-item">
-                        <span class="legend-symbol" style="background: #fff4e6; padding: 4px 8px; border-radius: 3px;">Yellow</span>
-                        <span class="legend-description">Values from Terraform config or computed at apply (not final)</span>
-                    </div>
-                    <div class="legend-item">
-                        <span class="legend-symbol" style="color: #666;">Gray</span>
-                        <span class="legend-description">Unchanged values (shown for context)</span>
-                    </div>
-                </div>
-                
-                <div class="legend-section">
-                    <h3>📑 Report Sections</h3>
-                    <div class="legend-item">
-                        <span class="legend-symbol">📝</span>
-                        <span class="legend-description"><strong>Created Resources</strong> - New resources being added to your infrastructure</span>
-                    </div>
-                    <div class="legend-item">
-                        <span class="legend-symbol">🔄</span>
-                        <span class="legend-description"><strong>Updated Resources</strong> - Existing resources with configuration changes (click to expand/collapse)</span>
-                    </div>
-                    <div class="legend-item">
-                        <span class="legend-symbol">🏷️</span>
-                        <span class="legend-description"><strong>Tag-Only Updates</strong> - Resources with only tag changes</span>
-                    </div>
-                    <div class="legend-item">
-                        <span class="legend-symbol">🔽</span>
-                        <span class="legend-description"><strong>Ignored Changes</strong> - Changes filtered out based on ignore configuration (at bottom)</span>
-                    </div>
-                </div>
-                
-                <div class="legend-section">
-                    <h3>🔒 Security & Privacy</h3>
-                    <div class="legend-item">
-                        <span class="legend-symbol">🔒</span>
-                        <span class="legend-description"><strong>Sensitive Values</strong> - Fields marked as sensitive by Terraform are redacted and shown as <code>&lt;REDACTED&gt;</code>. Use <code>--show-sensitive</code> flag to override (not recommended for shared reports).</span>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="summary">
+"""
+            )
+            write(_REPORT_LEGEND_HTML)
+            write(
+                f"""        <div class="summary">
             <div class="summary-card total">
                 <div class="number">{data['summary'].get('total', 0)}</div>
                 <div class="label">Total Resources</div>
@@ -1030,34 +1350,53 @@ class TerraformPlanAnalyzer:
             </div>
         </div>
 """
+            )
 
-        # Created resources section
-        if data["created"]:
-            html_content += """
+            # Created resources section
+            if data["created"]:
+                write(
+                    """
         <div class="section">
             <h2 class="section-header" onclick="toggleCreatedResources()" style="cursor: pointer;">
                 <span id="created-icon">▶</span> 📦 Created Resources
             </h2>
             <div class="resource-list hidden" id="created-resources">
 """
-            for resource in sorted(data["created"]):
-                html_content += f'                <div class="resource-item">{html.escape(resource)}</div>\n'
+                )
+                for resource in data["created"]:
+                    write(
+                        f'                <div class="resource-item">{escape_name(resource)}</div>\n'
+                    )
 
-            html_content += """            </div>
+                write(
+                    """            </div>
         </div>
 """
+                )
 
-        # Updated resources section
-        if data["updated"]:
-            html_content += """
+            # Updated resources section
+            if data["updated"]:
+                write(
+                    """
         <div class="section">
             <h2 class="section-header">🔄 Updated Resources</h2>
             <button class="toggle-all" onclick="toggleAll()">Expand/Collapse All</button>
 """
+                )
 
-            for resource in sorted(data["updated"], key=lambda x: x["name"]):
-                resource_name = html.escape(resource["name"])
-                html_content += f"""
+                # Every change dict carries the same keys, so unpack them in one call
+                change_fields = itemgetter(
+                    "attribute", "before", "after", "is_sensitive", "values_changed"
+                )
+                highlight_json_diff = self._highlight_json_diff
+
+                for resource in data["updated"]:
+                    # Assemble the resource block in one list and write it once
+                    parts: List[str] = []
+                    append = parts.append
+                    resource_name = escape_name(resource["name"])
+                    append(
+                        f"""
             <div class="resource-change">
                 <div class="resource-change-header">
                     <span class="toggle-icon" onclick="toggleResource(this)">▼</span>
@@ -1065,47 +1404,39 @@ class TerraformPlanAnalyzer:
                 </div>
                 <div class="resource-change-content">
 """
-
-                for change in sorted(resource["changes"], key=lambda x: x["attribute"]):
-                    attr_name = html.escape(change["attribute"])
-                    is_sensitive = change.get("is_sensitive", False)
-                    sensitivity_badge = (
-                        ' <span class="sensitive-badge">🔒 SENSITIVE</span>'
-                        if is_sensitive
-                        else ""
                     )
 
-                    html_content += f"""
-                    <div class="change-item">
-                        <div class="change-attribute">{attr_name}{sensitivity_badge}</div>
-"""
-
-                    before = change.get("before")
-                    after = change.get("after")
+                    for change in resource["changes"]:
+                        attribute, before, after, is_sensitive, values_changed = (
+                            change_fields(change)
+                        )
+                        attr_name = escape_name(attribute)
+                        sensitivity_badge = (
+                            _SENSITIVE_BADGE_HTML if is_sensitive else ""
+                        )
 
-                    # Check if it's a simple value or complex structure
-                    if isinstance(before, (dict, list)) or isinstance(
-                        after, (dict, list)
-                    ):
-                        # Complex structure - use diff highlighting
-                        # Pass values_changed metadata to enable highlighting even when strings are identical
-                        values_changed_metadata = change.get("values_changed", None)
-                        before_html, after_html, is_known_after_apply = (
-                            self._highlight_json_diff(
-                                before, after, values_changed_metadata
+                        # Check if it's a simple value or complex structure
+                        if isinstance(before, (dict, list)) or isinstance(
+                            after, (dict, list)
+                        ):
+                            # Complex structure - use diff highlighting
+                            # Pass values_changed metadata to enable highlighting even when strings are identical
+                            before_html, after_html, is_known_after_apply = (
+                                highlight_json_diff(before, after, values_changed)
                             )
-                        )
-                        # Use ⚙️ for HCL-resolved values, ⚠️ for truly unknown
-                        if is_known_after_apply and after != "(known after apply)":
-                            after_header = "After ⚙️ (from Terraform config, not plan)"
-                            after_class = "after-unknown"
-                        elif is_known_after_apply:
-                            after_header = "After ⚠️ (computed at apply)"
-                            after_class = "after-unknown"
-                        else:
-                            after_header = "After"
-                            after_class = "after"
-                        html_content += f"""
+                            # Use ⚙️ for HCL-resolved values, ⚠️ for truly unknown
+                            if is_known_after_apply and after != "(known after apply)":
+                                after_header = (
+                                    "After ⚙️ (from Terraform config, not plan)"
+                                )
+                                after_class = "after-unknown"
+                            elif is_known_after_apply:
+                                after_header = "After ⚠️ (computed at apply)"
+                                after_class = "after-unknown"
+                            else:
+                                after_header = "After"
+                                after_class = "after"
+                            change_body = f"""
                         <div class="change-diff">
                             <div class="diff-column">
                                 <div class="diff-header before">Before</div>
@@ -1117,286 +1448,164 @@ class TerraformPlanAnalyzer:
                             </div>
                         </div>
 """
-                    else:
-                        # Simple value change
-                        before_str = html.escape(
-                            str(before) if before is not None else "null"
-                        )
-                        after_str = html.escape(
-                            str(after) if after is not None else "null"
-                        )
-                        # Check if from HCL or truly unknown
-                        is_from_hcl = "${" in str(after)
-                        is_known_after_apply = (
-                            after == "(known after apply)" or is_from_hcl
-                        )
-
-                        if is_from_hcl:
-                            emoji = '<span title="Value from Terraform config, not plan">⚙️</span>'
-                        elif after == "(known after apply)":
-                            emoji = '<span title="Computed at apply time">⚠️</span>'
                         else:
-                            emoji = ""
+                            # Simple value change
+                            after_text = str(after)
+                            before_str = escape(
+                                str(before) if before is not None else "null"
+                            )
+                            after_str = escape(
+                                after_text if after is not None else "null"
+                            )
+                            # Check if from HCL or truly unknown
+                            is_from_hcl = "${" in after_text
+                            is_known_after_apply = (
+                                after == "(known after apply)" or is_from_hcl
+                            )
 
-                        after_class = (
-                            "after known-after-apply"
-                            if is_known_after_apply
-                            else "after"
-                        )
-                        html_content += f"""
+                            if is_from_hcl:
+                                emoji = '<span title="Value from Terraform config, not plan">⚙️</span>'
+                            elif after == "(known after apply)":
+                                emoji = '<span title="Computed at apply time">⚠️</span>'
+                            else:
+                                emoji = ""
+
+                            after_class = (
+                                "after known-after-apply"
+                                if is_known_after_apply
+                                else "after"
+                            )
+                            change_body = f"""
                         <div class="simple-change">
                             <span class="before">{before_str}</span> → <span class="{after_class}">{after_str} {emoji}</span>
                         </div>
 """
 
-                    html_content += """
+                        # One fragment per change: attribute header, body, close
+                        append(
+                            f"""
+                    <div class="change-item">
+                        <div class="change-attribute">{attr_name}{sensitivity_badge}</div>
+{change_body}
                     </div>
 """
+                        )
 
-                html_content += """
+                    append(
+                        """
                 </div>
             </div>
 """
+                    )
+                    write("".join(parts))
 
-            html_content += """
+                write(
+                    """
         </div>
 """
+                )
 
-        # Add Ignored Changes section
-        if self.ignored_changes:
-            total_ignored = sum(
-                len(resources)
-                for fields in self.ignored_changes.values()
-                for resources in fields.values()
-            )
+            # Add Ignored Changes section
+            if self.ignored_changes:
+                # Group by field instead of resource type
+                by_field = self._ignored_changes_by_field()
+                by_address = itemgetter(0)
 
-            # Group by field instead of resource type
-            by_field = {}
-            for resource_type, fields in self.ignored_changes.items():
-                for field, resources in fields.items():
-                    if field not in by_field:
-                        by_field[field] = []
-                    # Add resources with their type
-                    for resource in resources:
-                        by_field[field].append((resource, resource_type))
-
-            html_content += f"""
+                write(
+                    f"""
         <div class="section">
-            <h2>Ignored Changes ({total_ignored} total)</h2>
+            <h2>Ignored Changes ({self.ignored_total} total)</h2>
 """
+                )
 
-            for field in sorted(by_field.keys()):
-                resources_with_types = by_field[field]
-                count = len(resources_with_types)
+                for field in sorted(by_field):
+                    resources_with_types = by_field[field]
+                    count = len(resources_with_types)
 
-                # Get reason if available - check all resource types for this field
-                reason = None
-                if field in self.global_ignore_reasons:
-                    reason = self.global_ignore_reasons[field]
-                else:
-                    # Check resource-specific reasons
-                    for resource_type in self.resource_ignore_reasons:
-                        if field in self.resource_ignore_reasons[resource_type]:
-                            reason = self.resource_ignore_reasons[resource_type][field]
-                            break
+                    # Get reason if available (global first, then any resource type)
+                    reason = self._effective_ignore_reasons.get(field)
 
-                reason_str = f" - {html.escape(reason)}" if reason else ""
+                    reason_str = f" - {escape_name(reason)}" if reason else ""
 
-                html_content += f"""
+                    write(
+                        f"""
             <div class="ignored-field">
                 <div class="ignored-field-header">
-                    <strong>{html.escape(field)}</strong>: {count} resource(s){reason_str}
+                    <strong>{escape_name(field)}</strong>: {count} resource(s){reason_str}
                 </div>
                 <ul class="ignored-resources-list">
 """
+                    )
 
-                # Show all resources with their types
-                for resource, resource_type in sorted(resources_with_types):
-                    html_content += f"""
-                    <li>{html.escape(resource)} <span style="color: #868e96;">({html.escape(resource_type)})</span></li>
+                    # Show all resources with their types
+                    # An address determines its type, so ordering by address
+                    # alone matches ordering the (address, type) pairs
+                    for resource, resource_type in sorted(
+                        resources_with_types, key=by_address
+                    ):
+                        write(
+                            f"""
+                    <li>{escape_name(resource)} <span style="color: #868e96;">({escape_name(resource_type)})</span></li>
 """
+                        )
 
-                html_content += """
+                    write(
+                        """
                 </ul>
             </div>
 """
+                    )
 
-            html_content += """
+                write(
+                    """
         </div>
 """
+                )
 
-        # JavaScript for toggling
-        html_content += """
-    </div>
-    
-    <script>
-        function toggleLegend() {
-            const content = document.getElementById('legend-content');
-            const icon = document.getElementById('legend-icon');
-            content.classList.toggle('hidden');
-            icon.textContent = content.classList.contains('hidden') ? '▶' : '▼';
-        }
-        
-        function toggleCreatedResources() {
-            const content = document.getElementById('created-resources');
-            const icon = document.getElementById('created-icon');
-            content.classList.toggle('hidden');
-            icon.textContent = content.classList.contains('hidden') ? '▶' : '▼';
-        }
-        
-        function toggleResource(icon) {
-            icon.classList.toggle('collapsed');
-            const header = icon.parentElement;
-            const content = header.nextElementSibling;
-            content.classList.toggle('hidden');
-        }
-        
-        function toggleAll() {
-            const icons = document.querySelectorAll('.toggle-icon');
-            const firstIcon = icons[0];
-            const shouldExpand = firstIcon.classList.contains('collapsed');
-            
-            icons.forEach(icon => {
-                const header = icon.parentElement;
-                const content = header.nextElementSibling;
-                if (shouldExpand) {
-                    icon.classList.remove('collapsed');
-                    content.classList.remove('hidden');
-                } else {
-                    icon.classList.add('collapsed');
-                    content.classList.add('hidden');
-                }
-            });
-        }
-    </script>
-</body>
-</html>
-"""
-
-        with open(output_path, "w", encoding="utf-8", errors="surrogatepass") as f:
-            f.write(html_content)
+            # JavaScript for toggling
+            write(_REPORT_FOOTER_HTML)
 
     def generate_json_report(self, results: Dict, output_path: str) -> None:
         """Generate a JSON report from the analysis results."""
-        from datetime import datetime
-
         # Build summary statistics
-        summary = {
-            "total": len(self.resource_changes),
-            "created": len(results["created"]),
-            "imported": len(results["imported"]),
-            "updated": len(results["tag_only"]) + len(results["config_changes"]),
-            "tag_only": len(results["tag_only"]),
-            "config_changes": len(results["config_changes"]),
-            "deleted": len(results["deleted"]),
-            "ignored_changes": sum(
-                len(resources)
-                for fields in self.ignored_changes.values()
-                for resources in fields.values()
-            ),
-        }
+        summary = self._summary_stats(results)
+        summary["ignored_changes"] = self.ignored_total
 
         # Transform updated resources with full change details
         updated_resources = []
-        for item in results["config_changes"]:
+        for item in self._build_updated_changes(results):
             changes = []
-            for attr_name, (
-                before_val,
-                after_val,
-                before_sens_map,
-                after_sens_map,
-            ) in item["changed_attributes"].items():
-                # Use change detection to compare before redacting
-                display_before, display_after, values_changed = (
-                    self._redact_with_change_detection(
-                        before_val, after_val, before_sens_map, after_sens_map
-                    )
-                )
-
-                # Check if any part is sensitive
-                before_sensitivity = self._is_value_sensitive(before_sens_map)
-                after_sensitivity = self._is_value_sensitive(after_sens_map)
-                has_sensitive = before_sensitivity or after_sensitivity
-
-                # If not sensitive at the top level, check nested sensitivity
-                if not has_sensitive:
-                    _, before_sensitivity = self._redact_sensitive_fields(
-                        before_val, before_sens_map
-                    )
-                    _, after_sensitivity = self._redact_sensitive_fields(
-                        after_val, after_sens_map
-                    )
-                    has_sensitive = bool(before_sensitivity or after_sensitivity)
-
-                # Determine if this is "known after apply"
-                is_known_after_apply = after_val == "(known after apply)"
-
-                # Check if value is from HCL (contains interpolations or direct references)
-                is_from_hcl = False
-                if isinstance(after_val, (dict, list, str)):
-                    after_json = (
-                        json.dumps(after_val, indent=2, sort_keys=True)
-                        if not isinstance(after_val, str)
-                        else str(after_val)
-                    )
-                    is_from_hcl = self._is_hcl_reference(after_json)
-
-                # Also check before value for HCL references
-                before_hcl_ref = None
-                after_hcl_ref = None
-                if isinstance(before_val, str) and self._is_hcl_reference(before_val):
-                    before_hcl_ref = before_val
-                if isinstance(after_val, str) and self._is_hcl_reference(after_val):
-                    after_hcl_ref = after_val
-
-                if is_from_hcl:
-                    is_known_after_apply = True
-
+            for change in item["changes"]:
                 change_info = {
-                    "attribute": attr_name,
-                    "before": display_before,
-                    "after": display_after,
-                    "is_known_after_apply": is_known_after_apply,
-                    "is_sensitive": has_sensitive,
-                    "value_changed": values_changed,
+                    "attribute": change["attribute"],
+                    "before": change["before"],
+                    "after": change["after"],
+                    "is_known_after_apply": change["is_known_after_apply"],
+                    "is_sensitive": change["is_sensitive"],
+                    "value_changed": change["values_changed"],
                 }
 
                 # Add HCL reference information if available
-                if before_hcl_ref:
-                    change_info["before_hcl_reference"] = before_hcl_ref
-                if after_hcl_ref:
-                    change_info["after_hcl_reference"] = after_hcl_ref
+                if change["before_hcl_reference"]:
+                    change_info["before_hcl_reference"] = change["before_hcl_reference"]
+                if change["after_hcl_reference"]:
+                    change_info["after_hcl_reference"] = change["after_hcl_reference"]
 
                 changes.append(change_info)
 
             updated_resources.append({"address": item["address"], "changes": changes})
 
         # Transform ignored changes - group by field
-        ignored_changes_by_field = {}
-        for resource_type, fields in self.ignored_changes.items():
-            for field, resources in fields.items():
-                if field not in ignored_changes_by_field:
-                    # Get reason if available
-                    reason = None
-                    if field in self.global_ignore_reasons:
-                        reason = self.global_ignore_reasons[field]
-                    else:
-                        # Check resource-specific reasons
-                        for rt in self.resource_ignore_reasons:
-                            if field in self.resource_ignore_reasons[rt]:
-                                reason = self.resource_ignore_reasons[rt][field]
-                                break
-
-                    ignored_changes_by_field[field] = {
-                        "reason": reason,
-                        "resources": [],
-                    }
-
-                # Add resources with their type
-                for resource in resources:
-                    ignored_changes_by_field[field]["resources"].append(
-                        {"address": resource, "resource_type": resource_type}
-                    )
+        ignored_changes_by_field = {
+            field: {
+                "reason": self._effective_ignore_reasons.get(field),
+                "resources": [
+                    {"address": resource, "resource_type": resource_type}
+                    for resource, resource_type in resources_with_types
+                ],
+            }
+            for field, resources_with_types in self._ignored_changes_by_field().items()
+        }
 
         # Build the complete report
         report = {
@@ -1410,18 +1619,19 @@ class TerraformPlanAnalyzer:
             "summary": summary,
             "created_resources": sorted(results["created"]),
             "imported_resources": sorted(results["imported"]),
-            "updated_resources": sorted(updated_resources, key=lambda x: x["address"]),
+            "updated_resources": sorted(updated_resources, key=itemgetter("address")),
             "tag_only_updates": sorted(results["tag_only"]),
             "deleted_resources": sorted(results["deleted"]),
             "ignored_changes": ignored_changes_by_field,
         }
 
-        with open(output_path, "w") as f:
-            json.dump(report, f, indent=2, sort_keys=False)
+        _write_json_file(report, output_path)
 
 
 def load_config(config_file: str) -> Dict:
     """Load configuration from JSON file."""
+    import json5
+
     try:
         with open(config_file, "r") as f:
             return json5.load(f)
@@ -1433,6 +1643,25 @@ def load_config(config_file: str) -> Dict:
         sys.exit(1)
 
 
+def _derive_output_path(plan_file: str, suffix: str) -> str:
+    """Derive a default report path next to a plan file.
+
+    A trailing .json extension is replaced by the suffix; any other name has
+    the suffix appended.
+
+    Args:
+        plan_file: Path to the input plan file
+        suffix: Extension for the output, e.g. ".html" or ".report.json"
+
+    Returns:
+        Output path as a string
+    """
+    plan_path = Path(plan_file)
+    if plan_path.suffix == ".json":
+        plan_path = plan_path.with_suffix("")
+    return str(plan_path) + suffix
+
+
 def handle_report_subcommand(args):
     """Handle the 'report' subcommand for single-plan analysis."""
     if not Path(args.plan_file).exists():
@@ -1477,10 +1706,10 @@ def handle_report_subcommand(args):
 
     # Parse custom ignore fields from CLI (additive to config)
     if args.ignore_fields:
-        for field_arg in args.ignore_fields:
-            # Support comma-separated values
-            fields = [f.strip() for f in field_arg.split(",")]
-            custom_ignore_fields.update(fields)
+        # Support comma-separated values
+        custom_ignore_fields.update(
+            f.strip() for field_arg in args.ignore_fields for f in field_arg.split(",")
+        )
 
     # Parse resource-specific ignores from CLI (additive to config)
     if args.resource_ignores:
@@ -1492,25 +1721,27 @@ def handle_report_subcommand(args):
 
             resource_type, fields_str = resource_ignore.split(":", 1)
             resource_type = resource_type.strip()
-            fields = {f.strip() for f in fields_str.split(",")}
-
-            if resource_type in resource_specific_ignores:
-                resource_specific_ignores[resource_type].update(fields)
-            else:
-                resource_specific_ignores[resource_type] = fields
+            resource_specific_ignores.setdefault(resource_type, set()).update(
+                f.strip() for f in fields_str.split(",")
+            )
 
     # Initialize HCL resolver if tf_dir specified or use default
+    try:
+        from src.core.hcl_value_resolver import HCLValueResolver
+    except ImportError:
+        HCLValueResolver = None  # Optional dependency
+
     hcl_resolver = None
     if HCLValueResolver:
         tf_dir = args.tf_dir
         if tf_dir is None:
             # Default to same directory as plan file
-            tf_dir = Path(args.plan_file).parent
+            tf_dir = os.path.dirname(args.plan_file) or "."
 
-        if Path(tf_dir).exists():
+        if os.path.exists(tf_dir):
             try:
                 print(f"Loading Terraform files from: {tf_dir}")
-                hcl_resolver = HCLValueResolver(str(tf_dir))
+                hcl_resolver = HCLValueResolver(tf_dir)
                 print(f"✅ Loaded {len(hcl_resolver.resources)} resources from HCL")
             except Exception as e:
                 print(f"Warning: Failed to load HCL files: {e}")
@@ -1530,25 +1761,7 @@ def handle_report_subcommand(args):
 
     # Show ignored fields if requested
     if args.show_ignores:
-        print("=" * 60)
-        print("IGNORED FIELDS")
-        print("=" * 60)
-        print("\nDefault ignored fields (global):")
-        for field in sorted(TerraformPlanAnalyzer.DEFAULT_IGNORE_FIELDS):
-            print(f"  - {field}")
-        if custom_ignore_fields:
-            print("\nCustom ignored fields (global):")
-            for field in sorted(custom_ignore_fields):
-                print(f"  - {field}")
-        if resource_specific_ignores:
-            print("\nResource-specific ignored fields:")
-            for resource_type in sorted(resource_specific_ignores.keys()):
-                fields = sorted(resource_specific_ignores[resource_type])
-                print(f"  {resource_type}:")
-                for field in fields:
-                    print(f"    - {field}")
-        print("=" * 60)
-        print()
+        analyzer.print_ignore_fields()
 
     analyzer.load_plan()
     results = analyzer.analyze()
@@ -1558,11 +1771,7 @@ def handle_report_subcommand(args):
         # Determine output path
         if args.html is True:
             # Default: replace .json extension with .html
-            plan_path = Path(args.plan_file)
-            if plan_path.suffix == ".json":
-                html_output = str(plan_path.with_suffix(".html"))
-            else:
-                html_output = str(plan_path) + ".html"
+            html_output = _derive_output_path(args.plan_file, ".html")
         else:
             # User specified a path
             html_output = args.html
@@ -1574,12 +1783,7 @@ def handle_report_subcommand(args):
         # Determine output path
         if args.json is True:
             # Default: <plan_file>.report.json
-            plan_path = Path(args.plan_file)
-            if plan_path.suffix == ".json":
-                # Remove .json and add .report.json
-                json_output = str(plan_path.with_suffix("")) + ".report.json"
-            else:
-                json_output = str(plan_path) + ".report.json"
+            json_output = _derive_output_path(args.plan_file, ".report.json")
         else:
             # User specified a path
             json_output = args.json
@@ -1594,6 +1798,15 @@ def handle_report_subcommand(args):
         analyzer.print_ignore_report()
 
 
+def _split_list_arg(value: str) -> List[str]:
+    """Split a comma-separated CLI value, dropping blank entries.
+
+    Blank entries (e.g. from "a,,b" or a trailing comma) are removed so they
+    surface as a count mismatch instead of an empty name or path.
+    """
+    return [item for item in map(str.strip, value.split(",")) if item]
+
+
 def handle_compare_subcommand(args):
     """Handle the 'compare' subcommand for multi-environment comparison."""
     from src.core.multi_env_comparator import EnvironmentPlan, MultiEnvReport
@@ -1609,16 +1822,16 @@ def handle_compare_subcommand(args):
         )
         sys.exit(1)
 
-    # Check all files exist
+    # Report a missing plan file before any other validation or output
     for plan_file in args.plan_files:
-        if not Path(plan_file).exists():
+        if not os.path.exists(plan_file):
             print(f"Error: File not found: {plan_file}")
             sys.exit(1)
 
     # Parse and validate tfvars files if provided
     tfvars_files = None
     if args.tfvars_files:
-        tfvars_files = [f.strip() for f in args.tfvars_files.split(",")]
+        tfvars_files = _split_list_arg(args.tfvars_files)
 
         # Validate count matches plan files
         if len(tfvars_files) != len(args.plan_files):
@@ -1629,16 +1842,10 @@ def handle_compare_subcommand(args):
             print(f"Provided plan files: {len(args.plan_files)}")
             sys.exit(1)
 
-        # Check tfvars files exist
-        for tfvars_file in tfvars_files:
-            if not Path(tfvars_file).exists():
-                print(f"Error: Tfvars file not found: {tfvars_file}")
-                sys.exit(1)
-
     # Create environment names
     if args.env_names:
         # Parse comma-separated names
-        env_names = [name.strip() for name in args.env_names.split(",")]
+        env_names = _split_list_arg(args.env_names)
 
         # Validate count matches
         if len(env_names) != len(args.plan_files):
@@ -1657,21 +1864,24 @@ def handle_compare_subcommand(args):
             env_names.append(name)
 
     # Validate for duplicate environment names
-    if len(env_names) != len(set(env_names)):
-        duplicates = [name for name in env_names if env_names.count(name) > 1]
-        print(
-            f"Error: Duplicate environment names detected: {', '.join(set(duplicates))}"
-        )
+    name_counts = Counter(env_names)
+    if len(name_counts) != len(env_names):
+        duplicates = [name for name, count in name_counts.items() if count > 1]
+        print(f"Error: Duplicate environment names detected: {', '.join(duplicates)}")
         print(
             "Each environment must have a unique name. Use --env-names to specify custom names."
         )
         sys.exit(1)
 
-    # Create EnvironmentPlan objects
+    # Create EnvironmentPlan objects, checking tfvars files along the way
     environments = []
+    missing_tfvars = []
     for idx, (name, plan_file) in enumerate(zip(env_names, args.plan_files)):
         # Get corresponding tfvars file if provided
         tfvars_file = tfvars_files[idx] if tfvars_files else None
+        if tfvars_file and not os.path.exists(tfvars_file):
+            missing_tfvars.append(tfvars_file)
+            continue
 
         env_plan = EnvironmentPlan(
             label=name,
@@ -1682,6 +1892,11 @@ def handle_compare_subcommand(args):
         )
         environments.append(env_plan)
 
+    if missing_tfvars:
+        for tfvars_file in missing_tfvars:
+            print(f"Error: Tfvars file not found: {tfvars_file}")
+        sys.exit(1)
+
     print(f"Comparing {len(args.plan_files)} environments: {', '.join(env_names)}")
 
     # Load ignore configuration if provided
@@ -1712,6 +1927,9 @@ def handle_compare_subcommand(args):
     # Load environments with error handling
     try:
         report.load_environments()
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e.filename}")
+        sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON in plan file: {e}")
         print("Ensure all plan files are valid Terraform JSON plan outputs.")
@@ -1750,24 +1968,44 @@ def handle_compare_subcommand(args):
         print(text_output)
 
 
+def _count_sensitive(marker: Any) -> int:
+    """Count the values marked sensitive in a before/after_sensitive structure.
+
+    Walks the marker with an explicit stack rather than recursion.
+    """
+    count = 0
+    stack = [marker]
+    while stack:
+        current = stack.pop()
+        if current is True:
+            count += 1
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return count
+
+
 def handle_obfuscate_subcommand(args):
     """Handle the 'obfuscate' subcommand for sensitive data obfuscation."""
     import time
 
-    # Check dependencies
-    if not all(
-        [
+    # Check dependencies; these are only needed by this subcommand, so they
+    # are imported here to keep them off the other subcommands' startup path
+    try:
+        from src.security.salt_manager import (
             generate_salt,
             generate_position_seed,
             store_salt,
             load_salt,
-            traverse_and_obfuscate,
-        ]
-    ):
+        )
+        from src.security.sensitive_obfuscator import traverse_and_obfuscate
+    except ImportError as e:
         print(
             "Error: Obfuscate subcommand requires salt_manager and sensitive_obfuscator modules",
             file=sys.stderr,
         )
+        print(f"  {e}", file=sys.stderr)
         print(
             "  Install cryptography: pip install 'cryptography>=41.0.0'",
             file=sys.stderr,
@@ -1776,11 +2014,7 @@ def handle_obfuscate_subcommand(args):
 
     start_time = time.time()
 
-    # Validate input file exists
     input_path = Path(args.plan_file)
-    if not input_path.exists():
-        print(f"Error: Input file not found: {args.plan_file}", file=sys.stderr)
-        sys.exit(1)
 
     # Determine output path
     if args.output:
@@ -1789,6 +2023,11 @@ def handle_obfuscate_subcommand(args):
         # Default: <input_stem>-obfuscated.json
         output_path = input_path.parent / f"{input_path.stem}-obfuscated.json"
 
+    # A missing input is reported before the output check
+    if not os.path.exists(input_path):
+        print(f"Error: Input file not found: {args.plan_file}", file=sys.stderr)
+        sys.exit(1)
+
     # Check if output file exists (unless --force)
     if output_path.exists() and not args.force:
         print(f"Error: Output file already exists: {output_path}", file=sys.stderr)
@@ -1800,8 +2039,10 @@ def handle_obfuscate_subcommand(args):
 
     # Load input plan
     try:
-        with open(input_path, "r") as f:
-            plan_data = json.load(f)
+        plan_data = load_json_file(input_path)
+    except FileNotFoundError:
+        print(f"Error: Input file not found: {args.plan_file}", file=sys.stderr)
+        sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"Error: Failed to parse JSON from {input_path}", file=sys.stderr)
         print(f"  {str(e)}", file=sys.stderr)
@@ -1837,67 +2078,35 @@ def handle_obfuscate_subcommand(args):
             resource_count += 1
             address = rc.get("address", f"resource_{resource_count}")
             change = rc.get("change", {})
-
-            # Get before and after data with sensitive markers
-            before_data = change.get("before")
-            after_data = change.get("after")
             before_sensitive = change.get("before_sensitive")
             after_sensitive = change.get("after_sensitive")
 
+            # Most resources carry no sensitive markers; skip them outright
+            if (before_sensitive is None or before_sensitive is False) and (
+                after_sensitive is None or after_sensitive is False
+            ):
+                continue
+
             try:
-                # Obfuscate before values if present
-                if (
-                    before_data is not None
-                    and before_sensitive is not None
-                    and before_sensitive is not False
+                # Obfuscate before and after values where sensitive markers exist
+                for phase, sensitive in (
+                    ("before", before_sensitive),
+                    ("after", after_sensitive),
                 ):
-                    obfuscated_before = traverse_and_obfuscate(
-                        before_data,
-                        before_sensitive,
-                        salt,
-                        position_seed,
-                        path=[address, "before"],
-                    )
-                    change["before"] = obfuscated_before
+                    data = change.get(phase)
+                    if data is None or sensitive is None or sensitive is False:
+                        continue
 
-                    # Count obfuscated values
-                    def count_sensitive(marker):
-                        if marker is True:
-                            return 1
-                        elif isinstance(marker, dict):
-                            return sum(count_sensitive(v) for v in marker.values())
-                        elif isinstance(marker, list):
-                            return sum(count_sensitive(v) for v in marker)
-                        return 0
-
-                    values_obfuscated += count_sensitive(before_sensitive)
-
-                # Obfuscate after values if present
-                if (
-                    after_data is not None
-                    and after_sensitive is not None
-                    and after_sensitive is not False
-                ):
-                    obfuscated_after = traverse_and_obfuscate(
-                        after_data,
-                        after_sensitive,
+                    change[phase] = traverse_and_obfuscate(
+                        data,
+                        sensitive,
                         salt,
                         position_seed,
-                        path=[address, "after"],
+                        path=[address, phase],
                     )
-                    change["after"] = obfuscated_after
 
                     # Count obfuscated values
-                    def count_sensitive(marker):
-                        if marker is True:
-                            return 1
-                        elif isinstance(marker, dict):
-                            return sum(count_sensitive(v) for v in marker.values())
-                        elif isinstance(marker, list):
-                            return sum(count_sensitive(v) for v in marker)
-                        return 0
-
-                    values_obfuscated += count_sensitive(after_sensitive)
+                    values_obfuscated += _count_sensitive(sensitive)
 
             except ValueError as e:
                 print(f"Error: Malformed sensitive_values structure", file=sys.stderr)
@@ -1914,8 +2123,7 @@ def handle_obfuscate_subcommand(args):
         # Write obfuscated plan to output file
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w") as f:
-                json.dump(plan_data, f, indent=2, ensure_ascii=False)
+            _write_json_file(plan_data, output_path, ensure_ascii=False)
         except Exception as e:
             print(f"Error: Failed to write output file: {output_path}", file=sys.stderr)
             print(f"  {str(e)}", file=sys.stderr)
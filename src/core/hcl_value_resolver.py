@@ -9,8 +9,142 @@ from variables.tf and .tfvars files.
 import re
 import json
 import os
+import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional dependency, speeds up parsing of plain lists
+
+# Patterns are compiled once here; the parse methods run for every file and
+# recurse into every nested block. Assignment values end at the first line
+# end: under MULTILINE a bare ``$`` already matches wherever the old
+# ``(?=\n...|$)`` lookaheads did, without testing each alternative per char.
+_VAR_BLOCK_RE = re.compile(
+    r'variable\s+"([^"]+)"\s*\{([^}]*)\}', re.MULTILINE | re.DOTALL
+)
+_DEFAULT_RE = re.compile(r"default\s*=\s*(.+?)(?:\n|$)", re.MULTILINE)
+_TFVARS_ASSIGN_RE = re.compile(r"(\w+)\s*=\s*(.+?)(?:\n|$)", re.MULTILINE)
+_LOCALS_BLOCK_RE = re.compile(r"locals\s*\{([^}]+)\}", re.MULTILINE | re.DOTALL)
+_LOCALS_ASSIGN_RE = re.compile(r"(\w+)\s*=\s*(.+?)$", re.MULTILINE | re.DOTALL)
+_RESOURCE_HEADER_RE = re.compile(r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{', re.MULTILINE)
+# Braces, plus single-line quoted strings so braces inside them are skipped
+_BRACE_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"|[{}]')
+_COMMENT_RE = re.compile(r"(?:#|//)[^\n]*")
+_MAP_ASSIGN_RE = re.compile(r"^\s*(\w+)\s*=\s*\{", re.MULTILINE)
+_BLOCK_RE = re.compile(r"^\s*(\w+)\s*\{", re.MULTILINE)
+_SIMPLE_ASSIGN_RE = re.compile(r"^\s*(\w+)\s*=\s*(.+?)$", re.MULTILINE | re.DOTALL)
+# Quoted strings (skipped whole) and the characters that nest or split lists
+_LIST_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}(),]')
+_VAR_REF_RE = re.compile(r"var\.(\w+)")
+_LOCAL_REF_RE = re.compile(r"local\.(\w+)")
+_MAP_KV_RE = re.compile(r'(\w+|"[^"]+")\s*=\s*(.+?)$', re.MULTILINE | re.DOTALL)
+
+
+def _in_spans(pos: int, starts: List[int], ends: List[int]) -> bool:
+    """Check whether pos falls inside one of the sorted, disjoint spans."""
+    i = bisect_right(starts, pos)
+    return i > 0 and pos <= ends[i - 1]
+
+
+def _add_span(start: int, end: int, starts: List[int], ends: List[int]) -> None:
+    """
+    Record the inclusive span start..end, keeping the spans sorted.
+
+    Blocks are brace-delimited, so a new span either lies outside every
+    recorded span or encloses some of them; enclosed spans are replaced.
+    """
+    i = bisect_left(starts, start)
+    j = bisect_right(starts, end)
+    if j > i:
+        end = max(end, ends[j - 1])
+    starts[i:j] = [start]
+    ends[i:j] = [end]
+
+
+def _split_list_items(content: str) -> List[str]:
+    """Split list content on the commas that are not nested or quoted."""
+    items = []
+    depth = 0
+    start = 0
+    for match in _LIST_TOKEN_RE.finditer(content):
+        token = match.group()
+        if token in ("[", "{", "("):
+            depth += 1
+        elif token in ("]", "}", ")"):
+            depth -= 1
+        elif token == "," and depth == 0:
+            items.append(content[start : match.start()])
+            start = match.end()
+    items.append(content[start:])
+    return items
+
+
+_NOT_LITERAL = object()
+_KEYWORD_LITERALS = {"true": True, "false": False, "null": None}
+
+
+@lru_cache(maxsize=10000)
+def _parse_literal(value_str: str) -> Any:
+    """
+    Parse a literal value, or return _NOT_LITERAL.
+
+    Literals do not depend on variables or locals and the results are
+    immutable, so repeated values such as "true" or a region name are
+    parsed once.
+    """
+    # Quoted string
+    if value_str.startswith('"') and value_str.endswith('"'):
+        return value_str[1:-1]
+
+    # Boolean or null
+    keyword = _KEYWORD_LITERALS.get(value_str, _NOT_LITERAL)
+    if keyword is not _NOT_LITERAL:
+        return keyword
+
+    # Number; int() and float() only accept these leading characters, so
+    # references and expressions skip the failing conversion
+    first_char = value_str[:1]
+    if first_char in "+-." or first_char.isdigit():
+        try:
+            if "." in value_str:
+                return float(value_str)
+            return int(value_str)
+        except ValueError:
+            pass
+
+    return _NOT_LITERAL
+
+
+def _parse_json_list(value_str: str) -> Optional[List[Any]]:
+    """
+    Parse a list literal that is also valid JSON, or return None.
+
+    Only flat lists of strings, integers, booleans and nulls are accepted;
+    those decode exactly as _parse_list would parse them. Escapes, floats
+    (JSON reads 1e5 as a number, HCL parsing keeps it as text) and nested
+    values are left to _parse_list.
+    """
+    if orjson is None or "\\" in value_str:
+        return None
+    try:
+        items = orjson.loads(value_str)
+    except orjson.JSONDecodeError:
+        return None
+    for item in items:
+        if item is not None and type(item) not in (str, int, bool):
+            return None
+    return items
+
+
+@lru_cache(maxsize=1024)
+def _split_attribute_path(attribute_path: str) -> Tuple[str, ...]:
+    """Split a dot-separated attribute path; callers repeat the same paths."""
+    return tuple(attribute_path.split("."))
 
 
 class HCLValueResolver:
@@ -28,44 +162,65 @@ class HCLValueResolver:
         self.variables: Dict[str, Any] = {}
         self.locals: Dict[str, Any] = {}
 
+        # Read each file once; variables, locals and resources all use them
+        tf_files, tfvars_files = self._read_config_files()
+
         # Load all definitions
-        self._load_variables()
-        self._load_locals()
-        self._load_resources()
+        self._load_variables(tf_files, tfvars_files)
+        self._load_locals(tf_files)
+        self._load_resources(tf_files)
+
+    def _read_config_files(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Read the .tf and .tfvars files in tf_dir with a single directory scan.
 
-    def _load_variables(self) -> None:
+        Matches what Path.glob("*.tf") and Path.glob("*.tfvars") would return;
+        a missing or unreadable directory yields no files.
+
+        Returns:
+            Tuple of (.tf contents, .tfvars contents), each keyed by file name
+        """
+        tf_files: Dict[str, str] = {}
+        tfvars_files: Dict[str, str] = {}
+        try:
+            with os.scandir(self.tf_dir) as entries:
+                names = [entry.name for entry in entries]
+        except OSError:
+            return tf_files, tfvars_files
+
+        for name in names:
+            if name.endswith(".tf"):
+                tf_files[name] = (self.tf_dir / name).read_text()
+            elif name.endswith(".tfvars"):
+                tfvars_files[name] = (self.tf_dir / name).read_text()
+
+        return tf_files, tfvars_files
+
+    def _load_variables(
+        self, tf_files: Dict[str, str], tfvars_files: Dict[str, str]
+    ) -> None:
         """Load variable definitions and values from variables.tf and .tfvars files."""
         # First, load defaults from variables.tf
-        for tf_file in self.tf_dir.glob("variables.tf"):
-            content = tf_file.read_text()
-            self._parse_variable_definitions(content)
+        if "variables.tf" in tf_files:
+            self._parse_variable_definitions(tf_files["variables.tf"])
 
         # Then, override with .tfvars values (higher priority)
-        for tfvars_file in self.tf_dir.glob("*.tfvars"):
-            content = tfvars_file.read_text()
+        for content in tfvars_files.values():
             self._parse_tfvars(content)
 
-        # Also check for terraform.tfvars specifically
-        terraform_tfvars = self.tf_dir / "terraform.tfvars"
-        if terraform_tfvars.exists():
-            content = terraform_tfvars.read_text()
-            self._parse_tfvars(content)
+        # terraform.tfvars is applied again so it wins over the other .tfvars
+        if "terraform.tfvars" in tfvars_files:
+            self._parse_tfvars(tfvars_files["terraform.tfvars"])
 
     def _parse_variable_definitions(self, content: str) -> None:
         """Parse variable blocks to extract default values."""
         # Pattern: variable "name" { default = "value" }
-        var_pattern = re.compile(
-            r'variable\s+"([^"]+)"\s*\{([^}]*)\}', re.MULTILINE | re.DOTALL
-        )
-
-        for match in var_pattern.finditer(content):
-            var_name = match.group(1)
+        for match in _VAR_BLOCK_RE.finditer(content):
+            var_name = sys.intern(match.group(1))
             var_block = match.group(2)
 
             # Extract default value
-            default_match = re.search(
-                r"default\s*=\s*(.+?)(?:\n|$)", var_block, re.MULTILINE
-            )
+            default_match = _DEFAULT_RE.search(var_block)
             if default_match:
                 default_value = self._parse_value(default_match.group(1).strip())
                 if (
@@ -76,53 +231,37 @@ class HCLValueResolver:
     def _parse_tfvars(self, content: str) -> None:
         """Parse .tfvars file for variable assignments."""
         # Pattern: variable_name = "value"
-        assignment_pattern = re.compile(r"(\w+)\s*=\s*(.+?)(?:\n|$)", re.MULTILINE)
-
-        for match in assignment_pattern.finditer(content):
-            var_name = match.group(1)
+        for match in _TFVARS_ASSIGN_RE.finditer(content):
+            var_name = sys.intern(match.group(1))
             value_str = match.group(2).strip()
             self.variables[var_name] = self._parse_value(value_str)
 
-    def _load_locals(self) -> None:
+    def _load_locals(self, tf_files: Dict[str, str]) -> None:
         """Load local values from all .tf files."""
-        for tf_file in self.tf_dir.glob("*.tf"):
-            content = tf_file.read_text()
+        for content in tf_files.values():
             self._parse_locals(content)
 
     def _parse_locals(self, content: str) -> None:
         """Parse locals blocks."""
         # Pattern: locals { name = value }
-        locals_pattern = re.compile(r"locals\s*\{([^}]+)\}", re.MULTILINE | re.DOTALL)
-
-        for match in locals_pattern.finditer(content):
+        for match in _LOCALS_BLOCK_RE.finditer(content):
             locals_block = match.group(1)
 
             # Parse each assignment in the locals block
-            assignment_pattern = re.compile(
-                r"(\w+)\s*=\s*(.+?)(?=\n\s*\w+\s*=|\n\s*\}|$)", re.MULTILINE | re.DOTALL
-            )
-
-            for assign_match in assignment_pattern.finditer(locals_block):
-                local_name = assign_match.group(1)
+            for assign_match in _LOCALS_ASSIGN_RE.finditer(locals_block):
+                local_name = sys.intern(assign_match.group(1))
                 value_str = assign_match.group(2).strip()
                 self.locals[local_name] = self._parse_value(value_str)
 
-    def _load_resources(self) -> None:
+    def _load_resources(self, tf_files: Dict[str, str]) -> None:
         """Load resource definitions from all .tf files."""
-        for tf_file in self.tf_dir.glob("*.tf"):
-            content = tf_file.read_text()
+        for content in tf_files.values():
             self._parse_resources(content)
 
     def _parse_resources(self, content: str) -> None:
         """Parse resource blocks and extract attributes."""
         # Pattern: resource "type" "name" { ... }
-        resource_pattern = re.compile(
-            r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{', re.MULTILINE
-        )
-
-        matches = list(resource_pattern.finditer(content))
-
-        for i, match in enumerate(matches):
+        for match in _RESOURCE_HEADER_RE.finditer(content):
             resource_type = match.group(1)
             resource_name = match.group(2)
             resource_address = f"{resource_type}.{resource_name}"
@@ -131,6 +270,12 @@ class HCLValueResolver:
             start_pos = match.end()
             resource_body = self._extract_block_content(content, start_pos)
 
+            # Remove comments once; nested blocks are sliced from this body.
+            # The substring tests are much cheaper than a regex scan of a
+            # body that has no comments.
+            if "#" in resource_body or "//" in resource_body:
+                resource_body = _COMMENT_RE.sub("", resource_body)
+
             # Parse the resource body into a dictionary
             attributes = self._parse_resource_body(resource_body)
 
@@ -139,70 +284,63 @@ class HCLValueResolver:
     def _extract_block_content(self, content: str, start_pos: int) -> str:
         """Extract content between matching braces."""
         brace_count = 1
-        pos = start_pos
 
-        while pos < len(content) and brace_count > 0:
-            char = content[pos]
-            if char == "{":
+        # Jump from brace to brace instead of stepping through every character
+        for match in _BRACE_RE.finditer(content, start_pos):
+            token = match.group()
+            if token == "{":
                 brace_count += 1
-            elif char == "}":
+            elif token == "}":
                 brace_count -= 1
-            pos += 1
+                if brace_count == 0:
+                    return content[start_pos : match.start()]
 
-        return content[start_pos : pos - 1]  # Exclude the closing brace
+        # Unbalanced block: keep everything but the final character
+        return content[start_pos : len(content) - 1]
 
     def _parse_resource_body(self, body: str) -> Dict[str, Any]:
-        """Parse resource body into a dictionary of attributes."""
-        attributes = {}
-
-        # Remove comments
-        body = re.sub(r"#[^\n]*", "", body)
-        body = re.sub(r"//[^\n]*", "", body)
-
-        # Pattern for assignments with map values: key = { ... }
-        map_assignment_pattern = re.compile(r"^\s*(\w+)\s*=\s*\{", re.MULTILINE)
+        """
+        Parse a comment-free resource body into a dictionary of attributes.
 
-        # Pattern for nested blocks (no equals): key { ... }
-        block_pattern = re.compile(r"^\s*(\w+)\s*\{", re.MULTILINE)
+        Attribute names are interned: the same few names repeat across every
+        resource, so the parsed dicts share one key object per name.
+        """
+        attributes = {}
 
-        # Track positions we've already processed
-        processed_positions: Set[int] = set()
+        # Track the spans we've already processed
+        span_starts: List[int] = []
+        span_ends: List[int] = []
 
         # First, find all map assignments (key = { ... })
-        for match in map_assignment_pattern.finditer(body):
-            if match.start() in processed_positions:
+        for match in _MAP_ASSIGN_RE.finditer(body):
+            if _in_spans(match.start(), span_starts, span_ends):
                 continue
 
-            attr_name = match.group(1)
+            attr_name = sys.intern(match.group(1))
             start_pos = match.end()
             map_content = self._extract_block_content(body, start_pos)
 
             # Mark this entire assignment as processed
-            for pos in range(match.start(), start_pos + len(map_content) + 1):
-                processed_positions.add(pos)
+            _add_span(
+                match.start(), start_pos + len(map_content), span_starts, span_ends
+            )
 
             # Parse as a map/object
             attributes[attr_name] = self._parse_map(map_content)
 
         # Then, find nested blocks (key { ... } without =)
-        for match in block_pattern.finditer(body):
-            if match.start() in processed_positions:
+        for match in _BLOCK_RE.finditer(body):
+            if _in_spans(match.start(), span_starts, span_ends):
                 continue
 
-            # Check if this is actually a map assignment (has = before {)
-            # Look backwards from match start to see if there's an =
-            before_match = body[max(0, match.start() - 50) : match.start()]
-            if "=" in before_match.split("\n")[-1]:
-                # This is a map assignment, already handled
-                continue
-
-            attr_name = match.group(1)
+            attr_name = sys.intern(match.group(1))
             start_pos = match.end()
             block_content = self._extract_block_content(body, start_pos)
 
             # Mark this entire block as processed
-            for pos in range(match.start(), start_pos + len(block_content) + 1):
-                processed_positions.add(pos)
+            _add_span(
+                match.start(), start_pos + len(block_content), span_starts, span_ends
+            )
 
             # Check if it's a list (multiple blocks with same name) or a map
             if attr_name in attributes:
@@ -215,16 +353,11 @@ class HCLValueResolver:
                 attributes[attr_name] = self._parse_resource_body(block_content)
 
         # Finally, find simple assignments (key = value, not maps)
-        simple_pattern = re.compile(
-            r"^\s*(\w+)\s*=\s*(.+?)(?=\n\s*\w+\s*=|\n\s*\}|\n\s*$|$)",
-            re.MULTILINE | re.DOTALL,
-        )
-
-        for match in simple_pattern.finditer(body):
-            if match.start() in processed_positions:
+        for match in _SIMPLE_ASSIGN_RE.finditer(body):
+            if _in_spans(match.start(), span_starts, span_ends):
                 continue
 
-            attr_name = match.group(1)
+            attr_name = sys.intern(match.group(1))
             value_str = match.group(2).strip()
 
             # Skip if this looks like a block opening
@@ -246,38 +379,24 @@ class HCLValueResolver:
         if value_str.endswith(","):
             value_str = value_str[:-1].strip()
 
-        # Quoted string
-        if value_str.startswith('"') and value_str.endswith('"'):
-            return value_str[1:-1]
-
-        # Boolean
-        if value_str == "true":
-            return True
-        if value_str == "false":
-            return False
-
-        # Null
-        if value_str == "null":
-            return None
-
-        # Number
-        try:
-            if "." in value_str:
-                return float(value_str)
-            return int(value_str)
-        except ValueError:
-            pass
+        # Quoted string, boolean, null or number
+        literal = _parse_literal(value_str)
+        if literal is not _NOT_LITERAL:
+            return literal
 
         # List [...]
         if value_str.startswith("[") and value_str.endswith("]"):
+            items = _parse_json_list(value_str)
+            if items is not None:
+                return items
             return self._parse_list(value_str[1:-1])
 
         # Map {...}
         if value_str.startswith("{") and value_str.endswith("}"):
             return self._parse_map(value_str[1:-1])
 
-        # Variable reference: var.name
-        var_match = re.match(r"var\.(\w+)", value_str)
+        # Variable reference: var.name (prefix test avoids a regex call per value)
+        var_match = value_str.startswith("var.") and _VAR_REF_RE.match(value_str)
         if var_match:
             var_name = var_match.group(1)
             if var_name in self.variables:
@@ -286,7 +405,7 @@ class HCLValueResolver:
                 return f"${{{value_str}}}"  # Keep as interpolation syntax
 
         # Local reference: local.name
-        local_match = re.match(r"local\.(\w+)", value_str)
+        local_match = value_str.startswith("local.") and _LOCAL_REF_RE.match(value_str)
         if local_match:
             local_name = local_match.group(1)
             if local_name in self.locals:
@@ -311,10 +430,7 @@ class HCLValueResolver:
             return []
 
         items = []
-        # Simple split by comma (doesn't handle nested structures perfectly)
-        # For now, use a simple approach
-        parts = content.split(",")
-        for part in parts:
+        for part in _split_list_items(content):
             part = part.strip()
             if part:
                 items.append(self._parse_value(part))
@@ -326,13 +442,9 @@ class HCLValueResolver:
         result = {}
 
         # Pattern: key = value
-        assignment_pattern = re.compile(
-            r'(\w+|"[^"]+")\s*=\s*(.+?)(?=\n\s*\w+\s*=|\n\s*"[^"]+"\s*=|$)',
-            re.MULTILINE | re.DOTALL,
-        )
-
-        for match in assignment_pattern.finditer(content):
-            key = match.group(1).strip().strip('"')
+        for match in _MAP_KV_RE.finditer(content):
+            # Interned like attribute names; map keys repeat across resources
+            key = sys.intern(match.group(1).strip().strip('"'))
             value_str = match.group(2).strip()
 
             # Remove trailing comma
@@ -344,14 +456,15 @@ class HCLValueResolver:
         return result
 
     def get_resource_attribute(
-        self, resource_address: str, attribute_path: str
+        self, resource_address: str, attribute_path: Union[str, Tuple[str, ...]]
     ) -> Optional[Any]:
         """
         Get a specific attribute value for a resource.
 
         Args:
             resource_address: Full resource address (e.g., "azurerm_windows_web_app.admin")
-            attribute_path: Dot-separated path to attribute (e.g., "app_settings")
+            attribute_path: Dot-separated path to attribute (e.g., "app_settings"),
+                or the path already split into a tuple of parts
 
         Returns:
             The resolved attribute value, or None if not found
@@ -360,10 +473,12 @@ class HCLValueResolver:
             return None
 
         resource = self.resources[resource_address]
+        if not isinstance(attribute_path, tuple):
+            attribute_path = _split_attribute_path(attribute_path)
 
         # Navigate the path
         current = resource
-        for part in attribute_path.split("."):
+        for part in attribute_path:
             if isinstance(current, dict) and part in current:
                 current = current[part]
             else:
@@ -6,27 +6,520 @@ Compares Terraform plan "before" states across multiple environments
 to identify configuration drift and ensure parity.
 """
 
+import hashlib
 import html
 import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any, Tuple
-from src.lib.ignore_utils import apply_ignore_config, get_ignored_attributes
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Any, Tuple
+from src.lib.ignore_utils import (
+    find_ignored_attributes,
+    get_ignore_attributes_for_type,
+    remove_ignored_attributes,
+)
 
 # Import shared HTML/CSS generation utilities
 import src.lib.html_generation
 from src.lib.diff_utils import highlight_char_diff, highlight_json_diff
+from src.lib.json_utils import load_json_file
+from src.lib.normalization_utils import normalize_attribute_value
+
+try:
+    from hcl_value_resolver import HCLValueResolver
+except ImportError:
+    HCLValueResolver = None  # HCL resolver not available, continue without it
+
+# Combined plan size from which environments are loaded in worker processes;
+# below it, process start-up and transfer cost more than parsing in turn
+_PARALLEL_LOAD_MIN_BYTES = 8 << 20
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional dependency, speeds up JSON encoding
+
+# Static part of the report <head>; the shared stylesheet is written between the
+# two halves
+_HTML_HEAD_OPEN = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Multi-Environment Terraform Comparison Report</title>
+"""
+
+_HTML_HEAD_SCRIPTS = """
+    <style>
+        /* Additional multi-env specific styles */
+        .hcl-resolved { background: #e7f5ff; color: #1971c2; padding: 4px 8px; border-radius: 3px; font-size: 11px; font-weight: 600; margin-left: 8px; }
+    </style>
+    <script>
+        function toggleAll() {
+            const contents = document.querySelectorAll(".resource-change-content");
+            const icons = document.querySelectorAll(".toggle-icon");
+            const anyHidden = Array.from(contents).some(c => c.classList.contains("hidden"));
+            contents.forEach(content => {
+                if (anyHidden) { content.classList.remove("hidden"); }
+                else { content.classList.add("hidden"); }
+            });
+            icons.forEach(icon => {
+                if (anyHidden) { icon.classList.remove("collapsed"); }
+                else { icon.classList.add("collapsed"); }
+            });
+        }
+        function toggleResource(element) {
+            const header = element.closest(".resource-change-header");
+            const content = header.nextElementSibling;
+            const icon = header.querySelector(".toggle-icon");
+            content.classList.toggle("hidden");
+            icon.classList.toggle("collapsed");
+        }
+        // Synchronized horizontal scrolling for value containers
+        document.addEventListener('DOMContentLoaded', function() {
+            document.querySelectorAll('.attribute-section').forEach(section => {
+                const containers = section.querySelectorAll('.value-container');
+                if (containers.length < 2) return;
+                let isScrolling = false;
+                containers.forEach(container => {
+                    container.addEventListener('scroll', function() {
+                        if (isScrolling) return;
+                        isScrolling = true;
+                        const scrollLeft = this.scrollLeft;
+                        containers.forEach(otherContainer => {
+                            if (otherContainer !== this) {
+                                otherContainer.scrollLeft = scrollLeft;
+                            }
+                        });
+                        setTimeout(() => { isScrolling = false; }, 10);
+                    });
+                });
+            });
+        });
+
+        // JSON sorting and diff re-rendering
+        function handleSortChange(selectElement) {
+            const attributeSection = selectElement.closest('.attribute-section');
+            const envColumns = attributeSection.querySelectorAll('.env-value-column[data-json-value]');
+            const sortOption = selectElement.value;  // Full option: 'sorted', 'unsorted', or 'field:xxx'
+
+            // Parse JSON data from all environments
+            const envData = [];
+            envColumns.forEach(column => {
+                try {
+                    const jsonValue = JSON.parse(column.getAttribute('data-json-value'));
+                    const envLabel = column.getAttribute('data-env');
+                    const isBaseline = column.getAttribute('data-is-baseline') === 'true';
+                    envData.push({ column, jsonValue, envLabel, isBaseline });
+                } catch (e) {
+                    console.error('Failed to parse JSON for re-sorting:', e);
+                }
+            });
+
+            if (envData.length === 0) return;
+
+            // Find baseline environment
+            const baseline = envData.find(e => e.isBaseline);
+            if (!baseline) return;
+
+            // Re-render each environment's value with new sort order
+            envData.forEach(env => {
+                const valueContainer = env.column.querySelector('.value-container');
+                if (!valueContainer) return;
+
+                if (env.isBaseline) {
+                    // For baseline, compare against first different env
+                    const otherEnv = envData.find(e => !e.isBaseline && jsonStringify(sortJson(e.jsonValue, sortOption)) !== jsonStringify(sortJson(baseline.jsonValue, sortOption)));
+                    if (otherEnv) {
+                        const [beforeHtml, _] = highlightJsonDiff(env.jsonValue, otherEnv.jsonValue, sortOption, true);
+                        valueContainer.innerHTML = beforeHtml;
+                    } else {
+                        // No differences, show plain JSON
+                        valueContainer.innerHTML = '<pre class="json-content">' + escapeHtml(jsonStringify(sortJson(env.jsonValue, sortOption))) + '</pre>';
+                    }
+                } else {
+                    // For non-baseline, compare against baseline
+                    const [_, afterHtml] = highlightJsonDiff(baseline.jsonValue, env.jsonValue, sortOption, true);
+                    valueContainer.innerHTML = afterHtml;
+                }
+            });
+        }
+
+        function sortJson(obj, sortOption) {
+            if (!sortOption || sortOption === 'unsorted') return obj;
+            if (obj === null || obj === undefined) return obj;
+            if (typeof obj !== 'object') return obj;
+            
+            // Handle arrays
+            if (Array.isArray(obj)) {
+                let sorted = [...obj];  // Clone array
+                
+                // Check if sorting by field
+                if (typeof sortOption === 'string' && sortOption.startsWith('field:')) {
+                    const fieldName = sortOption.substring(6);  // Remove 'field:' prefix
+                    // Only sort if array contains objects with the field
+                    if (sorted.length > 0 && typeof sorted[0] === 'object' && sorted[0] !== null && fieldName in sorted[0]) {
+                        sorted.sort((a, b) => {
+                            const aVal = a[fieldName];
+                            const bVal = b[fieldName];
+                            
+                            // Handle null/undefined (sort to end)
+                            if (aVal == null && bVal == null) return 0;
+                            if (aVal == null) return 1;
+                            if (bVal == null) return -1;
+                            
+                            // Type-safe comparison
+                            if (typeof aVal === 'number' && typeof bVal === 'number') {
+                                return aVal - bVal;
+                            }
+                            
+                            // String comparison (convert to string if needed)
+                            const aStr = String(aVal);
+                            const bStr = String(bVal);
+                            return aStr.localeCompare(bStr);
+                        });
+                    }
+                }
+                
+                // Recursively process nested structures
+                return sorted.map(item => sortJson(item, sortOption));
+            }
+            
+            // Handle objects - always sort keys to match Python's sort_keys=True
+            const sorted = {};
+            Object.keys(obj).sort().forEach(key => {
+                sorted[key] = sortJson(obj[key], sortOption);
+            });
+            return sorted;
+        }
+
+        function escapeHtml(text) {
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
+        }
+
+        // Custom JSON stringifier to match Python's json.dumps(indent=2, sort_keys=True)
+        function jsonStringify(obj) {
+            if (obj === null || obj === undefined) return 'null';
+            return JSON.stringify(obj, null, 2);
+        }
+
+        function highlightJsonDiff(before, after, sortOption, isBaselineComparison) {
+            const beforeStr = jsonStringify(sortJson(before, sortOption));
+            const afterStr = jsonStringify(sortJson(after, sortOption));
+
+            const removedClass = isBaselineComparison ? 'baseline-removed' : 'removed';
+            const addedClass = isBaselineComparison ? 'baseline-added' : 'added';
+
+            if (beforeStr === afterStr) {
+                const plain = '<pre class="json-content">' + escapeHtml(beforeStr) + '</pre>';
+                return [plain, plain];
+            }
+
+            const beforeLines = beforeStr.split('\\n');
+            const afterLines = afterStr.split('\\n');
+            const placeholderLine = '<span class="placeholder">&nbsp;</span>';
+
+            // Simple line-based diff using LCS algorithm
+            const diff = computeDiff(beforeLines, afterLines);
+
+            const beforeHtmlLines = [];
+            const afterHtmlLines = [];
+
+            diff.forEach(op => {
+                if (op.type === 'equal') {
+                    op.lines.forEach(line => {
+                        beforeHtmlLines.push('<span class="unchanged">' + escapeHtml(line) + '</span>');
+                        afterHtmlLines.push('<span class="unchanged">' + escapeHtml(line) + '</span>');
+                    });
+                } else if (op.type === 'delete') {
+                    op.lines.forEach(line => {
+                        beforeHtmlLines.push('<span class="' + removedClass + '">' + escapeHtml(line) + '</span>');
+                        afterHtmlLines.push(placeholderLine);
+                    });
+                } else if (op.type === 'insert') {
+                    op.lines.forEach(line => {
+                        beforeHtmlLines.push(placeholderLine);
+                        afterHtmlLines.push('<span class="' + addedClass + '">' + escapeHtml(line) + '</span>');
+                    });
+                } else if (op.type === 'replace') {
+                    // Character-level diff for similar lines
+                    for (let i = 0; i < Math.max(op.beforeLines.length, op.afterLines.length); i++) {
+                        const beforeLine = op.beforeLines[i];
+                        const afterLine = op.afterLines[i];
+                        
+                        if (beforeLine !== undefined && afterLine !== undefined) {
+                            const [beforeHighlight, afterHighlight] = highlightCharDiff(beforeLine, afterLine, isBaselineComparison);
+                            beforeHtmlLines.push('<span class="' + removedClass + '" style="background-color: rgba(187, 222, 251, 0.3);">' + beforeHighlight + '</span>');
+                            afterHtmlLines.push('<span class="' + addedClass + '" style="background-color: rgba(200, 230, 201, 0.3);">' + afterHighlight + '</span>');
+                        } else if (beforeLine !== undefined) {
+                            beforeHtmlLines.push('<span class="' + removedClass + '">' + escapeHtml(beforeLine) + '</span>');
+                            afterHtmlLines.push(placeholderLine);
+                        } else if (afterLine !== undefined) {
+                            beforeHtmlLines.push(placeholderLine);
+                            afterHtmlLines.push('<span class="' + addedClass + '">' + escapeHtml(afterLine) + '</span>');
+                        }
+                    }
+                }
+            });
+
+            const beforeHtml = '<pre class="json-content">' + beforeHtmlLines.join('<br>') + '</pre>';
+            const afterHtml = '<pre class="json-content">' + afterHtmlLines.join('<br>') + '</pre>';
+
+            return [beforeHtml, afterHtml];
+        }
+
+        // Simple LCS-based diff algorithm
+        function computeDiff(before, after) {
+            const n = before.length;
+            const m = after.length;
+            const lcs = Array(n + 1).fill(null).map(() => Array(m + 1).fill(0));
+
+            // Build LCS table
+            for (let i = 1; i <= n; i++) {
+                for (let j = 1; j <= m; j++) {
+                    if (before[i - 1] === after[j - 1]) {
+                        lcs[i][j] = lcs[i - 1][j - 1] + 1;
+                    } else {
+                        lcs[i][j] = Math.max(lcs[i - 1][j], lcs[i][j - 1]);
+                    }
+                }
+            }
+
+            // Backtrack to build diff operations
+            const result = [];
+            let i = n, j = m;
+            while (i > 0 || j > 0) {
+                if (i > 0 && j > 0 && before[i - 1] === after[j - 1]) {
+                    if (result.length === 0 || result[0].type !== 'equal') {
+                        result.unshift({ type: 'equal', lines: [] });
+                    }
+                    result[0].lines.unshift(before[i - 1]);
+                    i--; j--;
+                } else if (j > 0 && (i === 0 || lcs[i][j - 1] >= lcs[i - 1][j])) {
+                    if (result.length === 0 || result[0].type !== 'insert') {
+                        result.unshift({ type: 'insert', lines: [] });
+                    }
+                    result[0].lines.unshift(after[j - 1]);
+                    j--;
+                } else if (i > 0 && (j === 0 || lcs[i][j - 1] < lcs[i - 1][j])) {
+                    if (result.length === 0 || result[0].type !== 'delete') {
+                        result.unshift({ type: 'delete', lines: [] });
+                    }
+                    result[0].lines.unshift(before[i - 1]);
+                    i--;
+                }
+            }
+            
+            // Post-process: merge adjacent delete+insert into replace if lines are similar
+            const merged = [];
+            for (let k = 0; k < result.length; k++) {
+                const curr = result[k];
+                const next = result[k + 1];
+                
+                if (curr.type === 'delete' && next && next.type === 'insert') {
+                    // Check if lines are similar enough for char-level diff
+                    const maxLen = Math.max(curr.lines.length, next.lines.length);
+                    const beforeLines = curr.lines;
+                    const afterLines = next.lines;
+                    
+                    let shouldMerge = false;
+                    if (maxLen === 1 || (beforeLines.length === afterLines.length && beforeLines.length <= 3)) {
+                        // Check similarity of first pair
+                        if (beforeLines.length > 0 && afterLines.length > 0) {
+                            const similarity = computeSimilarity(beforeLines[0], afterLines[0]);
+                            shouldMerge = similarity > 0.5;
+                        }
+                    }
+                    
+                    if (shouldMerge) {
+                        merged.push({ type: 'replace', beforeLines, afterLines });
+                        k++; // Skip next
+                    } else {
+                        merged.push(curr);
+                    }
+                } else {
+                    merged.push(curr);
+                }
+            }
+            
+            return merged;
+        }
+
+        function computeSimilarity(str1, str2) {
+            const len1 = str1.length;
+            const len2 = str2.length;
+            if (len1 === 0 || len2 === 0) return 0;
+            
+            const lcs = Array(len1 + 1).fill(null).map(() => Array(len2 + 1).fill(0));
+            for (let i = 1; i <= len1; i++) {
+                for (let j = 1; j <= len2; j++) {
+                    if (str1[i - 1] === str2[j - 1]) {
+                        lcs[i][j] = lcs[i - 1][j - 1] + 1;
+                    } else {
+                        lcs[i][j] = Math.max(lcs[i - 1][j], lcs[i][j - 1]);
+                    }
+                }
+            }
+            return (2.0 * lcs[len1][len2]) / (len1 + len2);
+        }
+
+        function highlightCharDiff(beforeStr, afterStr, isBaselineComparison) {
+            const charRemovedClass = isBaselineComparison ? 'baseline-char-removed' : 'char-removed';
+            const charAddedClass = isBaselineComparison ? 'baseline-char-added' : 'char-added';
+            
+            const len1 = beforeStr.length;
+            const len2 = afterStr.length;
+            const lcs = Array(len1 + 1).fill(null).map(() => Array(len2 + 1).fill(0));
+            
+            for (let i = 1; i <= len1; i++) {
+                for (let j = 1; j <= len2; j++) {
+                    if (beforeStr[i - 1] === afterStr[j - 1]) {
+                        lcs[i][j] = lcs[i - 1][j - 1] + 1;
+                    } else {
+                        lcs[i][j] = Math.max(lcs[i - 1][j], lcs[i][j - 1]);
+                    }
+                }
+            }
+            
+            const beforeParts = [];
+            const afterParts = [];
+            let i = len1, j = len2;
+            
+            while (i > 0 || j > 0) {
+                if (i > 0 && j > 0 && beforeStr[i - 1] === afterStr[j - 1]) {
+                    beforeParts.unshift(escapeHtml(beforeStr[i - 1]));
+                    afterParts.unshift(escapeHtml(afterStr[j - 1]));
+                    i--; j--;
+                } else if (j > 0 && (i === 0 || lcs[i][j - 1] >= lcs[i - 1][j])) {
+                    afterParts.unshift('<span class="' + charAddedClass + '">' + escapeHtml(afterStr[j - 1]) + '</span>');
+                    j--;
+                } else if (i > 0) {
+                    beforeParts.unshift('<span class="' + charRemovedClass + '">' + escapeHtml(beforeStr[i - 1]) + '</span>');
+                    i--;
+                }
+            }
+            
+            return [beforeParts.join(''), afterParts.join('')];
+        }
+    </script>"""
+
+# Per-resource blocks of the comparison section, emitted once per resource.
+# ``badges`` holds the optional header badges, each prefixed with a newline
+_REGULAR_RESOURCE_TMPL = """\
+            <div class="resource-change">
+                <div class="resource-change-header" onclick="toggleResource(this)">
+                    <span class="toggle-icon collapsed">▼</span>
+                    <span class="resource-name">{resource_address}</span>
+                    <span class="resource-status {status_class}">{status_text}</span>\
+{badges}
+                </div>
+                <div class="resource-change-content">
+{attribute_table}
+                </div>
+            </div>"""
+
+_ENV_SPECIFIC_RESOURCE_TMPL = """\
+                    <div class="resource-change">
+                        <div class="resource-change-header" onclick="toggleResource(this)">
+                            <span class="toggle-icon collapsed">▼</span>
+                            <span class="resource-name">{resource_address}</span>
+                            <span class="env-specific-badge">{presence_badge}</span>
+                            <span class="resource-status {status_class}">{status_text}</span>\
+{badges}
+                        </div>
+                        <div class="resource-change-content">
+                            <div class="presence-info">
+                                <strong>Present in:</strong> {present_envs}
+<br>
+                                <strong>Missing from:</strong> {missing_envs}
+                            </div>
+{attribute_table}
+                        </div>
+                    </div>"""
+
+_FIRST_ENV_ONLY_RESOURCE_TMPL = """\
+                    <div class="resource-change">
+                        <div class="resource-change-header" onclick="toggleResource(this)">
+                            <span class="toggle-icon collapsed">▼</span>
+                            <span class="resource-name">{resource_address}</span>
+                            <span class="first-env-badge">Will be created in: {missing_envs}</span>\
+{badges}
+                        </div>
+                        <div class="resource-change-content">
+{attribute_table}
+                        </div>
+                    </div>"""
+
+# Per-attribute pieces of the attribute table, emitted once per attribute or
+# environment column
+_ATTRIBUTE_SECTION_CHANGED_OPEN = (
+    '                        <div class="attribute-section" style="background: #fff3cd;">'
+)
+_ATTRIBUTE_SECTION_OPEN = '                        <div class="attribute-section">'
+_ATTRIBUTE_HEADER_TMPL = """\
+                            <h3 class="attribute-header">
+                                <code>{attribute_name}</code>"""
+_SENSITIVE_BADGE_LINE = (
+    '                                <span class="sensitive-badge">🔒 SENSITIVE</span>'
+)
+_SORT_CONTROL_OPEN = """\
+                                <select class="json-sort-control" onchange="handleSortChange(this)">
+                                    <option value="sorted">Alphabetical (A-Z)</option>
+                                    <option value="unsorted">Insertion Order</option>"""
+_SORT_FIELD_SEPARATOR_LINE = (
+    "                                    <option disabled>──────────</option>"
+)
+_SORT_FIELD_OPTION_TMPL = (
+    '                                    <option value="field:{0}">Sort by: {0}</option>'
+)
+_ENV_VALUE_COLUMN_TMPL = """\
+                                <div class="env-value-column"{data_attrs}>
+                                    <div class="env-label">{env_label}</div>
+                                    <div class="value-container">
+                                        {value_html}
+                                    </div>
+                                </div>"""
+_NOTES_CONTAINER_TMPL = """\
+                            <div class="notes-container">
+                                <div>
+                                    <label class="note-label" for="note-q-{resource_id}-{attribute_id}">Question:</label>
+                                    <textarea class="note-field" id="note-q-{resource_id}-{attribute_id}" placeholder="Add a question..." oninput="debouncedSaveNote('{resource_address}', '{attribute_name}', 'question', this.value)" rows="4"></textarea>
+                                </div>
+                                <div class="note-answer">
+                                    <label class="note-label" for="note-a-{resource_id}-{attribute_id}">Answer:</label>
+                                    <textarea class="note-field" id="note-a-{resource_id}-{attribute_id}" placeholder="Add an answer..." oninput="debouncedSaveNote('{resource_address}', '{attribute_name}', 'answer', this.value)" rows="4"></textarea>
+                                </div>
+                            </div>"""
 
 
 class AttributeDiff:
     """Represents a single attribute's values across environments."""
 
+    # One instance per attribute per resource, so skip the per-instance __dict__
+    __slots__ = (
+        "attribute_name",
+        "env_values",
+        "is_different",
+        "attribute_type",
+        "ignored_due_to_normalization",
+        "normalized_values",
+        "env_values_raw",
+        "has_sensitive_value",
+    )
+
     def __init__(
         self,
         attribute_name: str,
         env_values: Dict[str, Any],
         is_different: bool,
         attribute_type: str,
+        has_sensitive_value: Optional[bool] = None,
     ):
         """
         Initialize an attribute diff.
@@ -36,11 +529,20 @@ class AttributeDiff:
             env_values: Map of environment label -> attribute value
             is_different: Whether the attribute differs across environments
             attribute_type: Type of the attribute ('primitive', 'object', 'array')
+            has_sensitive_value: Whether any value is a SENSITIVE marker string;
+                computed from env_values when not given
         """
         self.attribute_name = attribute_name
         self.env_values = env_values
         self.is_different = is_different
         self.attribute_type = attribute_type
+        if has_sensitive_value is None:
+            has_sensitive_value = any(
+                isinstance(val, str) and "SENSITIVE" in val
+                for val in env_values.values()
+            )
+        # Drives the SENSITIVE badge of the attribute header
+        self.has_sensitive_value = has_sensitive_value
         # Normalization tracking (feature 007)
         self.ignored_due_to_normalization = False
         self.normalized_values: Dict[str, Any] = {}
@@ -60,6 +562,162 @@ def _highlight_json_diff(before: Any, after: Any, is_baseline: bool = True) -> T
     return highlight_json_diff(before, after, is_known_after_apply=False, is_baseline_comparison=is_baseline)
 
 
+def _json_equal(a: Any, b: Any) -> bool:
+    """
+    Compare two JSON-like values the way their sorted json.dumps output would.
+
+    Walks both structures directly instead of serializing them, stopping at the
+    first difference. Types must match exactly, so 1, 1.0 and True stay
+    distinct, and floats are compared by repr (as json.dumps writes them).
+
+    Args:
+        a: First value
+        b: Second value
+
+    Returns:
+        True if json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+    """
+    if a is b:
+        return True
+    value_type = type(a)
+    if value_type is not type(b):
+        return False
+    if value_type is dict:
+        if len(a) != len(b):
+            return False
+        for key, value in a.items():
+            if key not in b or not _json_equal(value, b[key]):
+                return False
+        return True
+    if value_type is list:
+        if len(a) != len(b):
+            return False
+        for item_a, item_b in zip(a, b):
+            if not _json_equal(item_a, item_b):
+                return False
+        return True
+    if value_type is float:
+        return repr(a) == repr(b)
+    return a == b
+
+
+def _json_equal_cached(
+    a: Any, b: Any, cache: Dict[Tuple[int, int], Tuple[bool, Any, Any]]
+) -> bool:
+    """
+    Memoized _json_equal for values compared repeatedly while rendering.
+
+    Entries are keyed by object identity and keep both values alive, so an id
+    cannot be reused by another object while the cache exists.
+
+    Args:
+        a: First value
+        b: Second value
+        cache: Dict owned by the caller, shared across the comparisons
+
+    Returns:
+        Same result as _json_equal(a, b)
+    """
+    key = (id(a), id(b))
+    entry = cache.get(key)
+    if entry is None:
+        entry = cache[key] = (_json_equal(a, b), a, b)
+    return entry[0]
+
+
+def _find_baseline(
+    values: Dict[str, Any], env_labels: List[str]
+) -> Tuple[Optional[str], Any]:
+    """
+    Find the baseline of an attribute: the first environment with a value.
+
+    Args:
+        values: Attribute values keyed by environment label
+        env_labels: Environment labels in report order
+
+    Returns:
+        Tuple of (baseline_env, baseline_val), or (None, None) if no
+        environment has a value
+    """
+    for env in env_labels:
+        value = values.get(env)
+        if value is not None:
+            return env, value
+    return None, None
+
+
+def _compact_json(value: Any) -> str:
+    """
+    Encode a value as compact JSON for embedding in the HTML report.
+
+    Uses orjson when available, falling back to the standard library for
+    values orjson cannot encode (e.g. integers wider than 64 bits).
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON text with non-ASCII characters left unescaped
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _config_hash(config: Any) -> Optional[bytes]:
+    """
+    Hash a config's canonical JSON encoding for fast equality checks.
+
+    Equal hashes mean the configs are equal in the sense of _json_equal. Plan
+    JSON never contains NaN, which orjson would encode the same as null.
+
+    Args:
+        config: Parsed resource configuration
+
+    Returns:
+        16-byte digest, or None when orjson is unavailable or cannot encode
+        the config
+    """
+    if orjson is None:
+        return None
+    try:
+        encoded = orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _needs_masking(obj: Any, sensitive_map: Any) -> bool:
+    """
+    Check whether masking obj with a before_sensitive map would change it.
+
+    Follows the same paths as the masking walk in
+    EnvironmentPlan._process_sensitive_values without building anything.
+
+    Args:
+        obj: Resource configuration (or part of it)
+        sensitive_map: Matching before_sensitive structure
+
+    Returns:
+        True if a value is marked sensitive, or the map pads a list with None
+    """
+    stack = [(obj, sensitive_map)]
+    while stack:
+        obj, sensitive_map = stack.pop()
+        if sensitive_map is True:
+            return True
+        if isinstance(sensitive_map, dict) and isinstance(obj, dict):
+            stack.extend((v, sensitive_map.get(k, False)) for k, v in obj.items())
+        elif isinstance(sensitive_map, list) and isinstance(obj, list):
+            if len(sensitive_map) > len(obj):
+                return True
+            stack.extend(zip(obj, sensitive_map))
+    return False
+
+
 def _calculate_ignore_counts(
     config_ignored: Set[str], attr_diffs: List[AttributeDiff]
 ) -> Tuple[int, int]:
@@ -128,9 +786,54 @@ def _render_ignore_badge(
     return f'<span class="badge" style="background: #fbbf24; color: #78350f;" data-tooltip="{html.escape(tooltip_text)}">{badge_text}</span>'
 
 
+def _render_resource_badges(rc: "ResourceComparison", indent: str) -> str:
+    """
+    Render the optional ignore and sensitive badges of a resource header.
+
+    Args:
+        rc: Resource comparison being rendered
+        indent: Leading whitespace for each badge line
+
+    Returns:
+        Badge lines, each prefixed with a newline (empty if there are none)
+    """
+    badges = ""
+    normalized_attrs = [
+        diff.attribute_name
+        for diff in rc.attribute_diffs
+        if diff.ignored_due_to_normalization
+    ]
+    if rc.ignored_attributes or normalized_attrs:
+        config_count, norm_count = _calculate_ignore_counts(
+            rc.ignored_attributes, rc.attribute_diffs
+        )
+        badge_html = _render_ignore_badge(
+            config_count, norm_count, rc.ignored_attributes, normalized_attrs
+        )
+        if badge_html:
+            badges += f"\n{indent}{badge_html}"
+    if rc.has_sensitive_differences():
+        badges += f'\n{indent}<span class="sensitive-indicator">⚠️ SENSITIVE DIFF</span>'
+    return badges
+
+
 class EnvironmentPlan:
     """Represents a single environment's Terraform plan with extracted before state."""
 
+    __slots__ = (
+        "label",
+        "plan_file_path",
+        "tf_dir",
+        "tfvars_file",
+        "show_sensitive",
+        "plan_data",
+        "before_values",
+        "before_values_raw",
+        "before_sensitive_metadata",
+        "before_hashes",
+        "hcl_resolver",
+    )
+
     def __init__(
         self,
         label: str,
@@ -158,26 +861,25 @@ class EnvironmentPlan:
         self.before_values: Dict[str, Dict] = {}
         self.before_values_raw: Dict[str, Dict] = (
             {}
-        )  # Store unmasked versions for comparison
+        )  # Store unmasked versions for comparison (shared, do not mutate)
         self.before_sensitive_metadata: Dict[str, Any] = {}  # Store sensitive metadata for cross-env merging
+        self.before_hashes: Dict[str, bytes] = {}  # Hashes of raw values for fast equality
         self.hcl_resolver = None
 
     def load(self) -> None:
-        """Load and parse the plan JSON file, extract before values."""
-        with open(self.plan_file_path, "r") as f:
-            self.plan_data = json.load(f)
+        """Load and parse the plan JSON file, extract before values.
 
-        # Initialize HCL resolver if tf_dir provided
-        if self.tf_dir:
-            try:
-                from hcl_value_resolver import HCLValueResolver
+        before_values_raw holds the parsed plan objects themselves, and
+        before_values shares every unmasked subtree with them, so callers must
+        treat both as read-only.
+        """
+        self.plan_data = load_json_file(self.plan_file_path)
 
-                self.hcl_resolver = HCLValueResolver(
-                    tf_dir=self.tf_dir, tfvars_file=self.tfvars_file
-                )
-            except ImportError:
-                # HCL resolver not available, continue without it
-                pass
+        # Initialize HCL resolver if tf_dir provided
+        if self.tf_dir and HCLValueResolver is not None:
+            self.hcl_resolver = HCLValueResolver(
+                tf_dir=self.tf_dir, tfvars_file=self.tfvars_file
+            )
 
         # Extract before values from resource_changes
         resource_changes = self.plan_data.get("resource_changes", [])
@@ -191,11 +893,12 @@ class EnvironmentPlan:
                 if self.hcl_resolver:
                     before = self._resolve_hcl_values(address, before)
 
-                # Store raw version (before masking) for comparison
-                import copy
-
-                before_raw = copy.deepcopy(before)
-                self.before_values_raw[address] = before_raw
+                # Store raw version (before masking) for comparison. Masking
+                # builds new containers rather than mutating, so no copy is needed.
+                self.before_values_raw[address] = before
+                config_hash = _config_hash(before)
+                if config_hash is not None:
+                    self.before_hashes[address] = config_hash
 
                 # Store sensitive metadata for cross-environment merging
                 change = rc.get("change", {})
@@ -221,12 +924,7 @@ class EnvironmentPlan:
         if not self.hcl_resolver:
             return config
 
-        # Deep copy to avoid modifying original
-        import copy
-
-        resolved_config = copy.deepcopy(config)
-
-        # Recursively resolve values
+        # Recursively resolve values into new containers; config is not modified
         def resolve_recursive(obj):
             if isinstance(obj, dict):
                 return {k: resolve_recursive(v) for k, v in obj.items()}
@@ -242,7 +940,7 @@ class EnvironmentPlan:
             else:
                 return obj
 
-        return resolve_recursive(resolved_config)
+        return resolve_recursive(config)
 
     def _process_sensitive_values(self, config: Dict, resource_change: Dict) -> Dict:
         """
@@ -262,15 +960,13 @@ class EnvironmentPlan:
         change = resource_change.get("change", {})
         before_sensitive = change.get("before_sensitive", {})
 
-        if not before_sensitive:
+        # Terraform emits {} / [] placeholders for every nested block, so most
+        # maps mark nothing; skip rebuilding the containers for those
+        if not _needs_masking(config, before_sensitive):
             return config
 
-        # Deep copy to avoid modifying original
-        import copy
-
-        processed_config = copy.deepcopy(config)
-
-        # Recursively mask sensitive values
+        # Recursively mask sensitive values into new containers; unmarked
+        # values are shared with config, which is not modified
         def mask_sensitive(obj, sensitive_map):
             if isinstance(sensitive_map, bool) and sensitive_map:
                 return "[SENSITIVE]"
@@ -290,12 +986,30 @@ class EnvironmentPlan:
             else:
                 return obj
 
-        return mask_sensitive(processed_config, before_sensitive)
+        return mask_sensitive(config, before_sensitive)
 
 
 class ResourceComparison:
     """Represents a single resource address with configuration across all environments."""
 
+    __slots__ = (
+        "resource_address",
+        "resource_type",
+        "env_configs",
+        "env_configs_raw",
+        "is_present_in",
+        "has_differences",
+        "ignored_attributes",
+        "attribute_diffs",
+        "changed_attribute_diffs",
+        "normalization_config",
+        "verbose_normalization",
+        "merged_sensitive_metadata",
+        "env_config_hashes",
+        "has_masked_values",
+        "_sensitive_differences",
+    )
+
     def __init__(self, resource_address: str, resource_type: str):
         """
         Initialize a resource comparison.
@@ -316,14 +1030,28 @@ class ResourceComparison:
         self.attribute_diffs: List[AttributeDiff] = (
             []
         )  # Attribute-level diffs for HTML rendering
+        # Subset of attribute_diffs that still differ after normalization
+        self.changed_attribute_diffs: List[AttributeDiff] = []
         # Normalization config (feature 007)
         self.normalization_config = None
         self.verbose_normalization = False  # For verbose logging (T058)
         # Merged sensitive metadata from all environments
         self.merged_sensitive_metadata: Dict[str, Any] = {}
+        # Hashes of unfiltered raw configs, where known (see _config_hash)
+        self.env_config_hashes: Dict[str, Optional[bytes]] = {}
+        # Whether any environment's config differs from its raw config (masked)
+        self.has_masked_values = False
+        # Cached has_sensitive_differences() result, reset whenever the configs
+        # or has_differences are updated
+        self._sensitive_differences: Optional[bool] = None
 
     def add_environment_config(
-        self, env_label: str, config: Optional[Dict], config_raw: Optional[Dict] = None, sensitive_metadata: Optional[Dict] = None
+        self,
+        env_label: str,
+        config: Optional[Dict],
+        config_raw: Optional[Dict] = None,
+        sensitive_metadata: Optional[Dict] = None,
+        config_hash: Optional[bytes] = None,
     ) -> None:
         """
         Add configuration for an environment.
@@ -333,8 +1061,13 @@ class ResourceComparison:
             config: Configuration dict (possibly with masked sensitive values) or None if resource doesn't exist
             config_raw: Unmasked configuration for comparison purposes
             sensitive_metadata: Sensitive field metadata from this environment's plan
+            config_hash: Hash of the raw configuration before ignore filtering
         """
+        self._sensitive_differences = None
         self.env_configs[env_label] = config
+        self.env_config_hashes[env_label] = config_hash
+        if config_raw is not None and config is not config_raw:
+            self.has_masked_values = True
         self.env_configs_raw[env_label] = (
             config_raw if config_raw is not None else config
         )
@@ -418,6 +1151,7 @@ class ResourceComparison:
 
     def detect_differences(self) -> None:
         """Detect if configurations differ across environments using RAW unmasked values."""
+        self._sensitive_differences = None
         # Get all non-None RAW configs for accurate comparison
         raw_configs = [cfg for cfg in self.env_configs_raw.values() if cfg is not None]
 
@@ -431,16 +1165,24 @@ class ResourceComparison:
             self.has_differences = False
             return
 
+        # Configs that were identical before ignore filtering still are after it
+        hashes = list(self.env_config_hashes.values())
+        if None not in hashes and hashes.count(hashes[0]) == len(hashes):
+            self.has_differences = False
+            return
+
         # Compare first config with all others using RAW values
-        baseline = json.dumps(raw_configs[0], sort_keys=True)
+        baseline = raw_configs[0]
         for cfg in raw_configs[1:]:
-            if json.dumps(cfg, sort_keys=True) != baseline:
+            if not _json_equal(cfg, baseline):
                 self.has_differences = True
                 return
 
         self.has_differences = False
 
-    def compute_attribute_diffs(self) -> None:
+    def compute_attribute_diffs(
+        self, attr_name_cache: Optional[Dict[Tuple, Tuple[str, ...]]] = None
+    ) -> None:
         """
         Compute attribute-level diffs for rendering in HTML reports.
 
@@ -450,13 +1192,17 @@ class ResourceComparison:
         
         Applies normalization if normalization_config is set (feature 007).
         Performance measurement included to ensure ≤10% overhead (SC-007).
+
+        Args:
+            attr_name_cache: Optional dict shared across resources that maps the
+                configs' key layout to the sorted attribute names, so resources
+                of the same shape skip the set union and sort
         """
-        import time  # For performance measurement (T060)
-        
         start_time = time.perf_counter()
         normalization_start_time = 0.0
         normalization_total_time = 0.0
         
+        self._sensitive_differences = None
         self.attribute_diffs = []
 
         # Get all non-None configs
@@ -468,49 +1214,71 @@ class ResourceComparison:
         if not present_configs:
             return
 
-        # Extract all unique top-level attribute names across all environments
-        all_attributes: Set[str] = set()
-        for config in present_configs.values():
-            if isinstance(config, dict):
-                all_attributes.update(config.keys())
-
-        # Remove ignored attributes
-        all_attributes = all_attributes - self.ignored_attributes
+        signature = None
+        attr_names = None
+        if attr_name_cache is not None:
+            signature = (
+                tuple(
+                    tuple(config)
+                    for config in present_configs.values()
+                    if isinstance(config, dict)
+                ),
+                frozenset(self.ignored_attributes),
+            )
+            attr_names = attr_name_cache.get(signature)
+
+        if attr_names is None:
+            # Extract all unique top-level attribute names across all environments
+            all_attributes: Set[str] = set()
+            for config in present_configs.values():
+                if isinstance(config, dict):
+                    all_attributes.update(config.keys())
+
+            # Remove ignored attributes
+            all_attributes = all_attributes - self.ignored_attributes
+            attr_names = tuple(sorted(all_attributes))
+            if signature is not None:
+                attr_name_cache[signature] = attr_names
+
+        # Bind each environment's lookups once; missing configs use an empty dict
+        no_config = {}.get
+        env_getters = []
+        for env_label in env_labels:
+            config = self.env_configs.get(env_label)
+            config_raw = self.env_configs_raw.get(env_label)
+            env_getters.append(
+                (
+                    env_label,
+                    config.get if isinstance(config, dict) else no_config,
+                    config_raw.get if isinstance(config_raw, dict) else no_config,
+                )
+            )
 
         # Build AttributeDiff for each attribute
-        for attr_name in sorted(all_attributes):
+        for attr_name in attr_names:
             env_values: Dict[str, Any] = {}
             env_values_raw: Dict[str, Any] = {}
             baseline_value = None
             is_different = False
+            has_sensitive_value = False
 
             # Collect values from each environment (both masked and raw)
-            for env_label in env_labels:
-                config = self.env_configs.get(env_label)
-                config_raw = self.env_configs_raw.get(env_label)
-                
-                if config is not None and isinstance(config, dict):
-                    value = config.get(attr_name, None)
-                    env_values[env_label] = value
-
-                    # Check if this attribute differs from baseline
-                    if baseline_value is None and value is not None:
+            for env_label, get_value, get_raw_value in env_getters:
+                value = get_value(attr_name)
+                env_values[env_label] = value
+                if isinstance(value, str) and "SENSITIVE" in value:
+                    has_sensitive_value = True
+
+                # Check if this attribute differs from baseline
+                if value is not None:
+                    if baseline_value is None:
                         baseline_value = value
-                    elif value is not None and baseline_value is not None:
-                        # Compare serialized versions for deep equality
-                        if json.dumps(value, sort_keys=True) != json.dumps(
-                            baseline_value, sort_keys=True
-                        ):
-                            is_different = True
-                else:
-                    env_values[env_label] = None
-                
+                    elif not is_different and not _json_equal(value, baseline_value):
+                        # Deep equality with serialized-comparison semantics
+                        is_different = True
+
                 # Also collect raw unmasked values
-                if config_raw is not None and isinstance(config_raw, dict):
-                    value_raw = config_raw.get(attr_name, None)
-                    env_values_raw[env_label] = value_raw
-                else:
-                    env_values_raw[env_label] = None
+                env_values_raw[env_label] = get_raw_value(attr_name)
 
             # Determine attribute type
             attr_type = "primitive"
@@ -521,7 +1289,9 @@ class ResourceComparison:
                     attr_type = "array"
 
             # Create AttributeDiff
-            attr_diff = AttributeDiff(attr_name, env_values, is_different, attr_type)
+            attr_diff = AttributeDiff(
+                attr_name, env_values, is_different, attr_type, has_sensitive_value
+            )
             # Store raw unmasked values for applying merged sensitive metadata
             attr_diff.env_values_raw = env_values_raw
             
@@ -529,8 +1299,6 @@ class ResourceComparison:
             if is_different and self.normalization_config is not None:
                 norm_start = time.perf_counter()
                 
-                from src.lib.normalization_utils import normalize_attribute_value
-                
                 # Normalize all environment values
                 normalized_values = {}
                 for env_label, value in env_values.items():
@@ -555,9 +1323,7 @@ class ResourceComparison:
                             normalized_baseline = norm_value
                         else:
                             # Compare normalized values
-                            if json.dumps(norm_value, sort_keys=True) != json.dumps(
-                                normalized_baseline, sort_keys=True
-                            ):
+                            if not _json_equal(norm_value, normalized_baseline):
                                 all_normalized_equal = False
                                 break
                 
@@ -578,13 +1344,14 @@ class ResourceComparison:
         
         # Update has_differences based on remaining non-normalized differences
         # After normalization filtering, check if any attribute diffs remain
-        has_any_unignored_diff = any(
-            diff.is_different and not diff.ignored_due_to_normalization
+        self.changed_attribute_diffs = [
+            diff
             for diff in self.attribute_diffs
-        )
+            if diff.is_different and not diff.ignored_due_to_normalization
+        ]
         
         # If all differences were normalized away, update has_differences
-        if not has_any_unignored_diff and self.has_differences:
+        if not self.changed_attribute_diffs and self.has_differences:
             # Only update if we actually had normalization applied
             if any(diff.ignored_due_to_normalization for diff in self.attribute_diffs):
                 self.has_differences = False
@@ -594,7 +1361,10 @@ class ResourceComparison:
         Mark sensitive values that changed between environments with (changed) indicator.
         Compares RAW configs to detect changes, then updates masked configs.
         """
-        if not self.has_differences:
+        self._sensitive_differences = None
+
+        # Nothing was masked (or show_sensitive is set), so there is nothing to mark
+        if not self.has_differences or not self.has_masked_values:
             return
 
         # Get baseline (first environment)
@@ -617,16 +1387,20 @@ class ResourceComparison:
             if not other_raw or not other_masked:
                 continue
 
-            # Recursively mark changed sensitive values
-            self.env_configs[env_label] = self._mark_changed_recursive(
+            # Mark changed sensitive values
+            self.env_configs[env_label] = self._mark_changed_values(
                 baseline_raw, other_raw, baseline_masked, other_masked
             )
 
-    def _mark_changed_recursive(
+    def _mark_changed_values(
         self, baseline_raw: Any, other_raw: Any, baseline_masked: Any, other_masked: Any
     ) -> Any:
         """
-        Recursively compare raw and masked values, marking changed sensitive fields.
+        Compare raw and masked values, marking changed sensitive fields.
+
+        Walks the values with an explicit stack rather than recursion. Changed
+        containers are copied from other_masked and their entries overwritten in
+        place, so key order and shape match other_masked.
 
         Args:
             baseline_raw: Unmasked baseline value
@@ -637,90 +1411,118 @@ class ResourceComparison:
         Returns:
             Updated masked value with (changed) indicators
         """
-        # If the masked value is [SENSITIVE] and raw values differ, mark as changed
-        if isinstance(other_masked, str) and other_masked == "[SENSITIVE]":
-            if baseline_raw != other_raw:
-                return "[SENSITIVE] (changed)"
-            return other_masked
-
-        # Recursively process dictionaries
-        if isinstance(other_masked, dict) and isinstance(baseline_masked, dict):
-            result = {}
-            for key in other_masked.keys():
-                baseline_raw_val = (
-                    baseline_raw.get(key) if isinstance(baseline_raw, dict) else None
-                )
-                other_raw_val = (
-                    other_raw.get(key) if isinstance(other_raw, dict) else None
-                )
-                baseline_masked_val = baseline_masked.get(key)
-                other_masked_val = other_masked.get(key)
-
-                result[key] = self._mark_changed_recursive(
-                    baseline_raw_val,
-                    other_raw_val,
-                    baseline_masked_val,
-                    other_masked_val,
-                )
-            return result
+        root = [other_masked]
+        # Each entry writes its result to parent[slot], which holds other_masked
+        stack = [(root, 0, baseline_raw, other_raw, baseline_masked, other_masked)]
+        while stack:
+            parent, slot, baseline_raw, other_raw, baseline_masked, other_masked = (
+                stack.pop()
+            )
 
-        # Recursively process lists
-        if isinstance(other_masked, list) and isinstance(baseline_masked, list):
-            result = []
-            for i in range(len(other_masked)):
-                baseline_raw_val = (
-                    baseline_raw[i]
-                    if isinstance(baseline_raw, list) and i < len(baseline_raw)
-                    else None
-                )
-                other_raw_val = (
-                    other_raw[i]
-                    if isinstance(other_raw, list) and i < len(other_raw)
-                    else None
-                )
-                baseline_masked_val = (
-                    baseline_masked[i] if i < len(baseline_masked) else None
-                )
-                other_masked_val = other_masked[i]
-
-                result.append(
-                    self._mark_changed_recursive(
-                        baseline_raw_val,
-                        other_raw_val,
-                        baseline_masked_val,
-                        other_masked_val,
+            # Identical raw values cannot contain a changed sensitive field
+            if baseline_raw == other_raw:
+                continue
+
+            # If the masked value is [SENSITIVE] and raw values differ, mark as changed
+            if isinstance(other_masked, str) and other_masked == "[SENSITIVE]":
+                parent[slot] = "[SENSITIVE] (changed)"
+
+            # Process dictionaries key by key
+            elif isinstance(other_masked, dict) and isinstance(baseline_masked, dict):
+                result = dict(other_masked)
+                parent[slot] = result
+                baseline_is_dict = isinstance(baseline_raw, dict)
+                other_is_dict = isinstance(other_raw, dict)
+                for key, other_masked_val in other_masked.items():
+                    stack.append(
+                        (
+                            result,
+                            key,
+                            baseline_raw.get(key) if baseline_is_dict else None,
+                            other_raw.get(key) if other_is_dict else None,
+                            baseline_masked.get(key),
+                            other_masked_val,
+                        )
                     )
+
+            # Process lists item by item
+            elif isinstance(other_masked, list) and isinstance(baseline_masked, list):
+                result = list(other_masked)
+                parent[slot] = result
+                baseline_len = (
+                    len(baseline_raw) if isinstance(baseline_raw, list) else 0
                 )
-            return result
+                other_len = len(other_raw) if isinstance(other_raw, list) else 0
+                for i, other_masked_val in enumerate(other_masked):
+                    stack.append(
+                        (
+                            result,
+                            i,
+                            baseline_raw[i] if i < baseline_len else None,
+                            other_raw[i] if i < other_len else None,
+                            baseline_masked[i] if i < len(baseline_masked) else None,
+                            other_masked_val,
+                        )
+                    )
 
-        return other_masked
+        return root[0]
 
     def has_sensitive_differences(self) -> bool:
         """
         Check if any configs contain [SENSITIVE] markers that differ.
 
+        The result is cached until the configs are updated through this class,
+        since every report format asks for it once per resource.
+
         Returns:
             True if sensitive values differ across environments
         """
-
-        def contains_sensitive(obj):
-            """Recursively check if object contains [SENSITIVE] marker."""
-            if isinstance(obj, str):
-                return obj == "[SENSITIVE]"
-            elif isinstance(obj, dict):
-                return any(contains_sensitive(v) for v in obj.values())
-            elif isinstance(obj, list):
-                return any(contains_sensitive(item) for item in obj)
+        if not self.has_differences:
+            return False
+        if self._sensitive_differences is not None:
+            return self._sensitive_differences
+
+        def contains_sensitive(root):
+            """Check if object contains [SENSITIVE] marker, walking it with a stack."""
+            stack = [root]
+            while stack:
+                obj = stack.pop()
+                if isinstance(obj, str):
+                    if obj == "[SENSITIVE]":
+                        return True
+                elif isinstance(obj, dict):
+                    stack.extend(obj.values())
+                elif isinstance(obj, list):
+                    stack.extend(obj)
             return False
 
         # Check if any config has sensitive values
-        has_any_sensitive = any(
+        self._sensitive_differences = any(
             contains_sensitive(cfg)
             for cfg in self.env_configs.values()
             if cfg is not None
         )
+        return self._sensitive_differences
 
-        return has_any_sensitive and self.has_differences
+
+def _load_environment(env: EnvironmentPlan) -> Tuple[Dict, Dict, Dict, Dict]:
+    """
+    Load an environment plan in a worker process.
+
+    Args:
+        env: Environment plan to load
+
+    Returns:
+        Tuple of (before_values, before_values_raw, before_sensitive_metadata,
+        before_hashes); the parsed plan_data stays in the worker
+    """
+    env.load()
+    return (
+        env.before_values,
+        env.before_values_raw,
+        env.before_sensitive_metadata,
+        env.before_hashes,
+    )
 
 
 class MultiEnvReport:
@@ -750,6 +1552,12 @@ class MultiEnvReport:
         self.ignore_config = ignore_config
         self.verbose_normalization = verbose_normalization
         self.resource_comparisons: List[ResourceComparison] = []
+        # Partitions of the shown (diff_only-filtered) comparisons, set by
+        # build_comparisons and shared by every report format
+        self._shown_rcs: List[ResourceComparison] = []
+        self._regular_rcs: List[ResourceComparison] = []
+        self._env_specific_rcs: List[ResourceComparison] = []
+        self._first_env_only_rcs: List[ResourceComparison] = []
         self.summary_stats: Dict[str, int] = {}
         self.ignore_statistics: Dict[str, Any] = {
             "total_ignored_attributes": 0,
@@ -760,21 +1568,52 @@ class MultiEnvReport:
         }
 
     def load_environments(self) -> None:
-        """Load all environment plan files."""
-        for env in self.environments:
-            env.load()
+        """Load all environment plan files.
+
+        Large plans are loaded in parallel, one worker process per environment.
+        Their plan_data is then not kept; only the extracted values are.
+        """
+        workers = min(len(self.environments), os.cpu_count() or 1)
+        try:
+            total_size = sum(
+                os.path.getsize(env.plan_file_path) for env in self.environments
+            )
+        except OSError:
+            total_size = 0  # Let the sequential load report the missing file
+
+        if workers < 2 or total_size < _PARALLEL_LOAD_MIN_BYTES:
+            for env in self.environments:
+                env.load()
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_load_environment, self.environments))
+        for env, (values, values_raw, sensitive_metadata, hashes) in zip(
+            self.environments, results
+        ):
+            env.before_values = values
+            env.before_values_raw = values_raw
+            env.before_sensitive_metadata = sensitive_metadata
+            env.before_hashes = hashes
 
     def build_comparisons(self) -> None:
         """Build ResourceComparison objects for each unique resource address."""
-        # Extract all unique resource addresses
-        all_addresses: Set[str] = set()
+        # Index configs by address once instead of probing every environment
+        configs_by_address: Dict[str, Dict[str, Dict]] = {}
         for env in self.environments:
-            all_addresses.update(env.before_values.keys())
+            for address, config in env.before_values.items():
+                configs_by_address.setdefault(address, {})[env.label] = config
+
+        # Sorted attribute names shared by resources with the same key layout
+        attr_name_cache: Dict[Tuple, Tuple[str, ...]] = {}
+        # Attribute names removed by the ignore rules, per resource type
+        ignore_attributes_by_type: Dict[str, Set[str]] = {}
 
         # Build comparison for each address
-        for address in sorted(all_addresses):
+        for address in sorted(configs_by_address):
+            env_configs = configs_by_address[address]
             # Extract resource type from address (e.g., "aws_instance.web" -> "aws_instance")
-            resource_type = address.split(".")[0] if "." in address else address
+            resource_type = address.split(".", 1)[0]
 
             comparison = ResourceComparison(address, resource_type)
             
@@ -783,34 +1622,52 @@ class MultiEnvReport:
                 comparison.normalization_config = self.ignore_config["normalization_config"]
                 comparison.verbose_normalization = self.verbose_normalization
 
+            # Ignore rules depend only on the resource type
+            ignore_attributes = ignore_attributes_by_type.get(resource_type)
+            if ignore_attributes is None:
+                ignore_attributes = (
+                    get_ignore_attributes_for_type(self.ignore_config, resource_type)
+                    if self.ignore_config
+                    else set()
+                )
+                ignore_attributes_by_type[resource_type] = ignore_attributes
+
             # Track which attributes were actually ignored for this resource
             ignored_for_resource: Set[str] = set()
 
             # Add config from each environment (with ignore config applied)
             for env in self.environments:
-                config = env.before_values.get(address)
+                config = env_configs.get(env.label)
                 config_raw = env.before_values_raw.get(address)
                 sensitive_metadata = env.before_sensitive_metadata.get(address)
+                # Unmasked configs are the raw config object itself
+                is_masked = config is not config_raw
 
                 # Apply ignore filtering if config exists
-                if config is not None and self.ignore_config:
+                if config is not None and ignore_attributes:
                     # Track what gets ignored before filtering
-                    ignored_attrs = get_ignored_attributes(
-                        config, self.ignore_config, resource_type
+                    ignored_for_resource.update(
+                        find_ignored_attributes(config, ignore_attributes)
                     )
-                    ignored_for_resource.update(ignored_attrs)
 
                     # Apply filtering
-                    config = apply_ignore_config(
-                        config, self.ignore_config, resource_type
-                    )
-
-                if config_raw is not None and self.ignore_config:
-                    config_raw = apply_ignore_config(
-                        config_raw, self.ignore_config, resource_type
+                    config = remove_ignored_attributes(config, ignore_attributes)
+
+                if config_raw is not None and ignore_attributes:
+                    # Filter once when masking left the config unchanged
+                    config_raw = (
+                        remove_ignored_attributes(config_raw, ignore_attributes)
+                        if is_masked
+                        else config
                     )
 
-                comparison.add_environment_config(env.label, config, config_raw, sensitive_metadata)
+                comparison.add_environment_config(
+                    env.label,
+                    config,
+                    config_raw,
+                    sensitive_metadata,
+                    env.before_hashes.get(address),
+                )
 
             # Store ignored attributes for this resource
             comparison.ignored_attributes = ignored_for_resource
@@ -819,7 +1676,7 @@ class MultiEnvReport:
             comparison.detect_differences()
 
             # Compute attribute-level diffs for HTML rendering
-            comparison.compute_attribute_diffs()
+            comparison.compute_attribute_diffs(attr_name_cache)
 
             # Mark changed sensitive values with (changed) indicator
             comparison.mark_changed_sensitive_values()
@@ -851,6 +1708,35 @@ class MultiEnvReport:
 
             self.resource_comparisons.append(comparison)
 
+        self._partition_comparisons()
+
+    def _partition_comparisons(self) -> None:
+        """Split the comparisons to show into the report sections (v2.0 feature)."""
+        self._shown_rcs = self.resource_comparisons
+        if self.diff_only:
+            self._shown_rcs = [
+                rc for rc in self.resource_comparisons if rc.has_differences
+            ]
+
+        self._regular_rcs = []
+        self._env_specific_rcs = []
+        self._first_env_only_rcs = []
+
+        # Get the first environment label (baseline)
+        first_env = self.environments[0].label if self.environments else None
+        n_envs = len(self.environments)
+
+        for rc in self._shown_rcs:
+            # Resources present in all environments are "regular"
+            if len(rc.is_present_in) == n_envs:
+                self._regular_rcs.append(rc)
+            # Check if resource only exists in first environment (will be created in others)
+            elif first_env and rc.is_present_in == {first_env}:
+                self._first_env_only_rcs.append(rc)
+            else:
+                # Resources missing from one or more environments are "env-specific"
+                self._env_specific_rcs.append(rc)
+
     def _detect_sortable_fields(self, attr_diff) -> List[str]:
         """
         Detect common fields across array-of-object values for field-based sorting.
@@ -930,438 +1816,77 @@ class MultiEnvReport:
     def generate_html(self, output_path: str) -> None:
         """Generate HTML comparison report.
 
+        The report is streamed to the output file line by line instead of being
+        collected into a list and joined. It is always encoded as UTF-8, the
+        charset declared in its <head>, whatever the locale.
+
         Args:
             output_path: Path to write the HTML report
         """
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            self._write_html(f.write)
+
+    def _write_html(self, write: Callable[[str], Any]) -> None:
+        """Write the HTML comparison report through the given write function.
+
+        Args:
+            write: Callable receiving successive chunks of the report
+        """
+
+        def emit(line: str) -> None:
+            # Lines are newline-separated with no trailing newline
+            write("\n")
+            write(line)
+
         # Build environment labels list
         env_labels = [env.label for env in self.environments]
+        # Labels and addresses are user-controlled, so they are HTML-escaped;
+        # each label only once for the whole report
+        esc_labels = {label: html.escape(label) for label in env_labels}
 
         # Build HTML content
-        html_parts = []
-        html_parts.append("<!DOCTYPE html>")
-        html_parts.append('<html lang="en">')
-        html_parts.append("<head>")
-        html_parts.append('    <meta charset="UTF-8">')
-        html_parts.append(
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">'
-        )
-        html_parts.append(
-            "    <title>Multi-Environment Terraform Comparison Report</title>"
-        )
-        html_parts.append(f"    {src.lib.html_generation.generate_full_styles()}")
-        html_parts.append("    <style>")
-        html_parts.append("        /* Additional multi-env specific styles */")
-        html_parts.append(
-            "        .hcl-resolved { background: #e7f5ff; color: #1971c2; padding: 4px 8px; border-radius: 3px; font-size: 11px; font-weight: 600; margin-left: 8px; }"
-        )
-        html_parts.append("    </style>")
-        html_parts.append("    <script>")
-        html_parts.append("        function toggleAll() {")
-        html_parts.append(
-            '            const contents = document.querySelectorAll(".resource-change-content");'
-        )
-        html_parts.append(
-            '            const icons = document.querySelectorAll(".toggle-icon");'
-        )
-        html_parts.append(
-            '            const anyHidden = Array.from(contents).some(c => c.classList.contains("hidden"));'
+        write(_HTML_HEAD_OPEN)
+        write(f"    {src.lib.html_generation.generate_full_styles()}")
+        write(_HTML_HEAD_SCRIPTS)
+        emit("    <script>")
+        emit(f"    {src.lib.html_generation.get_notes_javascript()}")
+        emit("    </script>")
+        emit("</head>")
+        emit("<body>")
+        emit('    <div class="container">')
+        emit("        <header>")
+        emit("            <h1>Multi-Environment Terraform Plan Comparison</h1>")
+        emit(
+            f'            <p>Comparing {len(env_labels)} environments: {", ".join(esc_labels.values())}</p>'
         )
-        html_parts.append("            contents.forEach(content => {")
-        html_parts.append(
-            '                if (anyHidden) { content.classList.remove("hidden"); }'
-        )
-        html_parts.append('                else { content.classList.add("hidden"); }')
-        html_parts.append("            });")
-        html_parts.append("            icons.forEach(icon => {")
-        html_parts.append(
-            '                if (anyHidden) { icon.classList.remove("collapsed"); }'
-        )
-        html_parts.append(
-            '                else { icon.classList.add("collapsed"); }'
-        )
-        html_parts.append("            });")
-        html_parts.append("        }")
-        html_parts.append("        function toggleResource(element) {")
-        html_parts.append(
-            '            const header = element.closest(".resource-change-header");'
-        )
-        html_parts.append("            const content = header.nextElementSibling;")
-        html_parts.append(
-            '            const icon = header.querySelector(".toggle-icon");'
-        )
-        html_parts.append('            content.classList.toggle("hidden");')
-        html_parts.append('            icon.classList.toggle("collapsed");')
-        html_parts.append("        }")
-        html_parts.append("        // Synchronized horizontal scrolling for value containers")
-        html_parts.append("        document.addEventListener('DOMContentLoaded', function() {")
-        html_parts.append("            document.querySelectorAll('.attribute-section').forEach(section => {")
-        html_parts.append("                const containers = section.querySelectorAll('.value-container');")
-        html_parts.append("                if (containers.length < 2) return;")
-        html_parts.append("                let isScrolling = false;")
-        html_parts.append("                containers.forEach(container => {")
-        html_parts.append("                    container.addEventListener('scroll', function() {")
-        html_parts.append("                        if (isScrolling) return;")
-        html_parts.append("                        isScrolling = true;")
-        html_parts.append("                        const scrollLeft = this.scrollLeft;")
-        html_parts.append("                        containers.forEach(otherContainer => {")
-        html_parts.append("                            if (otherContainer !== this) {")
-        html_parts.append("                                otherContainer.scrollLeft = scrollLeft;")
-        html_parts.append("                            }")
-        html_parts.append("                        });")
-        html_parts.append("                        setTimeout(() => { isScrolling = false; }, 10);")
-        html_parts.append("                    });")
-        html_parts.append("                });")
-        html_parts.append("            });")
-        html_parts.append("        });")
-        html_parts.append("")
-        html_parts.append("        // JSON sorting and diff re-rendering")
-        html_parts.append("        function handleSortChange(selectElement) {")
-        html_parts.append("            const attributeSection = selectElement.closest('.attribute-section');")
-        html_parts.append("            const envColumns = attributeSection.querySelectorAll('.env-value-column[data-json-value]');")
-        html_parts.append("            const sortOption = selectElement.value;  // Full option: 'sorted', 'unsorted', or 'field:xxx'")
-        html_parts.append("")
-        html_parts.append("            // Parse JSON data from all environments")
-        html_parts.append("            const envData = [];")
-        html_parts.append("            envColumns.forEach(column => {")
-        html_parts.append("                try {")
-        html_parts.append("                    const jsonValue = JSON.parse(column.getAttribute('data-json-value'));")
-        html_parts.append("                    const envLabel = column.getAttribute('data-env');")
-        html_parts.append("                    const isBaseline = column.getAttribute('data-is-baseline') === 'true';")
-        html_parts.append("                    envData.push({ column, jsonValue, envLabel, isBaseline });")
-        html_parts.append("                } catch (e) {")
-        html_parts.append("                    console.error('Failed to parse JSON for re-sorting:', e);")
-        html_parts.append("                }")
-        html_parts.append("            });")
-        html_parts.append("")
-        html_parts.append("            if (envData.length === 0) return;")
-        html_parts.append("")
-        html_parts.append("            // Find baseline environment")
-        html_parts.append("            const baseline = envData.find(e => e.isBaseline);")
-        html_parts.append("            if (!baseline) return;")
-        html_parts.append("")
-        html_parts.append("            // Re-render each environment's value with new sort order")
-        html_parts.append("            envData.forEach(env => {")
-        html_parts.append("                const valueContainer = env.column.querySelector('.value-container');")
-        html_parts.append("                if (!valueContainer) return;")
-        html_parts.append("")
-        html_parts.append("                if (env.isBaseline) {")
-        html_parts.append("                    // For baseline, compare against first different env")
-        html_parts.append("                    const otherEnv = envData.find(e => !e.isBaseline && jsonStringify(sortJson(e.jsonValue, sortOption)) !== jsonStringify(sortJson(baseline.jsonValue, sortOption)));")
-        html_parts.append("                    if (otherEnv) {")
-        html_parts.append("                        const [beforeHtml, _] = highlightJsonDiff(env.jsonValue, otherEnv.jsonValue, sortOption, true);")
-        html_parts.append("                        valueContainer.innerHTML = beforeHtml;")
-        html_parts.append("                    } else {")
-        html_parts.append("                        // No differences, show plain JSON")
-        html_parts.append('                        valueContainer.innerHTML = \'<pre class="json-content">\' + escapeHtml(jsonStringify(sortJson(env.jsonValue, sortOption))) + \'</pre>\';')
-        html_parts.append("                    }")
-        html_parts.append("                } else {")
-        html_parts.append("                    // For non-baseline, compare against baseline")
-        html_parts.append("                    const [_, afterHtml] = highlightJsonDiff(baseline.jsonValue, env.jsonValue, sortOption, true);")
-        html_parts.append("                    valueContainer.innerHTML = afterHtml;")
-        html_parts.append("                }")
-        html_parts.append("            });")
-        html_parts.append("        }")
-        html_parts.append("")
-        html_parts.append("        function sortJson(obj, sortOption) {")
-        html_parts.append("            if (!sortOption || sortOption === 'unsorted') return obj;")
-        html_parts.append("            if (obj === null || obj === undefined) return obj;")
-        html_parts.append("            if (typeof obj !== 'object') return obj;")
-        html_parts.append("            ")
-        html_parts.append("            // Handle arrays")
-        html_parts.append("            if (Array.isArray(obj)) {")
-        html_parts.append("                let sorted = [...obj];  // Clone array")
-        html_parts.append("                ")
-        html_parts.append("                // Check if sorting by field")
-        html_parts.append("                if (typeof sortOption === 'string' && sortOption.startsWith('field:')) {")
-        html_parts.append("                    const fieldName = sortOption.substring(6);  // Remove 'field:' prefix")
-        html_parts.append("                    // Only sort if array contains objects with the field")
-        html_parts.append("                    if (sorted.length > 0 && typeof sorted[0] === 'object' && sorted[0] !== null && fieldName in sorted[0]) {")
-        html_parts.append("                        sorted.sort((a, b) => {")
-        html_parts.append("                            const aVal = a[fieldName];")
-        html_parts.append("                            const bVal = b[fieldName];")
-        html_parts.append("                            ")
-        html_parts.append("                            // Handle null/undefined (sort to end)")
-        html_parts.append("                            if (aVal == null && bVal == null) return 0;")
-        html_parts.append("                            if (aVal == null) return 1;")
-        html_parts.append("                            if (bVal == null) return -1;")
-        html_parts.append("                            ")
-        html_parts.append("                            // Type-safe comparison")
-        html_parts.append("                            if (typeof aVal === 'number' && typeof bVal === 'number') {")
-        html_parts.append("                                return aVal - bVal;")
-        html_parts.append("                            }")
-        html_parts.append("                            ")
-        html_parts.append("                            // String comparison (convert to string if needed)")
-        html_parts.append("                            const aStr = String(aVal);")
-        html_parts.append("                            const bStr = String(bVal);")
-        html_parts.append("                            return aStr.localeCompare(bStr);")
-        html_parts.append("                        });")
-        html_parts.append("                    }")
-        html_parts.append("                }")
-        html_parts.append("                ")
-        html_parts.append("                // Recursively process nested structures")
-        html_parts.append("                return sorted.map(item => sortJson(item, sortOption));")
-        html_parts.append("            }")
-        html_parts.append("            ")
-        html_parts.append("            // Handle objects - always sort keys to match Python's sort_keys=True")
-        html_parts.append("            const sorted = {};")
-        html_parts.append("            Object.keys(obj).sort().forEach(key => {")
-        html_parts.append("                sorted[key] = sortJson(obj[key], sortOption);")
-        html_parts.append("            });")
-        html_parts.append("            return sorted;")
-        html_parts.append("        }")
-        html_parts.append("")
-        html_parts.append("        function escapeHtml(text) {")
-        html_parts.append("            const div = document.createElement('div');")
-        html_parts.append("            div.textContent = text;")
-        html_parts.append("            return div.innerHTML;")
-        html_parts.append("        }")
-        html_parts.append("")
-        html_parts.append("        // Custom JSON stringifier to match Python's json.dumps(indent=2, sort_keys=True)")
-        html_parts.append("        function jsonStringify(obj) {")
-        html_parts.append("            if (obj === null || obj === undefined) return 'null';")
-        html_parts.append("            return JSON.stringify(obj, null, 2);")
-        html_parts.append("        }")
-        html_parts.append("")
-        html_parts.append("        function highlightJsonDiff(before, after, sortOption, isBaselineComparison) {")
-        html_parts.append("            const beforeStr = jsonStringify(sortJson(before, sortOption));")
-        html_parts.append("            const afterStr = jsonStringify(sortJson(after, sortOption));")
-        html_parts.append("")
-        html_parts.append("            const removedClass = isBaselineComparison ? 'baseline-removed' : 'removed';")
-        html_parts.append("            const addedClass = isBaselineComparison ? 'baseline-added' : 'added';")
-        html_parts.append("")
-        html_parts.append("            if (beforeStr === afterStr) {")
-        html_parts.append('                const plain = \'<pre class="json-content">\' + escapeHtml(beforeStr) + \'</pre>\';')
-        html_parts.append("                return [plain, plain];")
-        html_parts.append("            }")
-        html_parts.append("")
-        html_parts.append("            const beforeLines = beforeStr.split('\\n');")
-        html_parts.append("            const afterLines = afterStr.split('\\n');")
-        html_parts.append("            const placeholderLine = '<span class=\"placeholder\">&nbsp;</span>';")
-        html_parts.append("")
-        html_parts.append("            // Simple line-based diff using LCS algorithm")
-        html_parts.append("            const diff = computeDiff(beforeLines, afterLines);")
-        html_parts.append("")
-        html_parts.append("            const beforeHtmlLines = [];")
-        html_parts.append("            const afterHtmlLines = [];")
-        html_parts.append("")
-        html_parts.append("            diff.forEach(op => {")
-        html_parts.append("                if (op.type === 'equal') {")
-        html_parts.append("                    op.lines.forEach(line => {")
-        html_parts.append('                        beforeHtmlLines.push(\'<span class="unchanged">\' + escapeHtml(line) + \'</span>\');')
-        html_parts.append('                        afterHtmlLines.push(\'<span class="unchanged">\' + escapeHtml(line) + \'</span>\');')
-        html_parts.append("                    });")
-        html_parts.append("                } else if (op.type === 'delete') {")
-        html_parts.append("                    op.lines.forEach(line => {")
-        html_parts.append('                        beforeHtmlLines.push(\'<span class="\' + removedClass + \'">\' + escapeHtml(line) + \'</span>\');')
-        html_parts.append("                        afterHtmlLines.push(placeholderLine);")
-        html_parts.append("                    });")
-        html_parts.append("                } else if (op.type === 'insert') {")
-        html_parts.append("                    op.lines.forEach(line => {")
-        html_parts.append("                        beforeHtmlLines.push(placeholderLine);")
-        html_parts.append('                        afterHtmlLines.push(\'<span class="\' + addedClass + \'">\' + escapeHtml(line) + \'</span>\');')
-        html_parts.append("                    });")
-        html_parts.append("                } else if (op.type === 'replace') {")
-        html_parts.append("                    // Character-level diff for similar lines")
-        html_parts.append("                    for (let i = 0; i < Math.max(op.beforeLines.length, op.afterLines.length); i++) {")
-        html_parts.append("                        const beforeLine = op.beforeLines[i];")
-        html_parts.append("                        const afterLine = op.afterLines[i];")
-        html_parts.append("                        ")
-        html_parts.append("                        if (beforeLine !== undefined && afterLine !== undefined) {")
-        html_parts.append("                            const [beforeHighlight, afterHighlight] = highlightCharDiff(beforeLine, afterLine, isBaselineComparison);")
-        html_parts.append('                            beforeHtmlLines.push(\'<span class="\' + removedClass + \'" style="background-color: rgba(187, 222, 251, 0.3);">\' + beforeHighlight + \'</span>\');')
-        html_parts.append('                            afterHtmlLines.push(\'<span class="\' + addedClass + \'" style="background-color: rgba(200, 230, 201, 0.3);">\' + afterHighlight + \'</span>\');')
-        html_parts.append("                        } else if (beforeLine !== undefined) {")
-        html_parts.append('                            beforeHtmlLines.push(\'<span class="\' + removedClass + \'">\' + escapeHtml(beforeLine) + \'</span>\');')
-        html_parts.append("                            afterHtmlLines.push(placeholderLine);")
-        html_parts.append("                        } else if (afterLine !== undefined) {")
-        html_parts.append("                            beforeHtmlLines.push(placeholderLine);")
-        html_parts.append('                            afterHtmlLines.push(\'<span class="\' + addedClass + \'">\' + escapeHtml(afterLine) + \'</span>\');')
-        html_parts.append("                        }")
-        html_parts.append("                    }")
-        html_parts.append("                }")
-        html_parts.append("            });")
-        html_parts.append("")
-        html_parts.append('            const beforeHtml = \'<pre class="json-content">\' + beforeHtmlLines.join(\'<br>\') + \'</pre>\';')
-        html_parts.append('            const afterHtml = \'<pre class="json-content">\' + afterHtmlLines.join(\'<br>\') + \'</pre>\';')
-        html_parts.append("")
-        html_parts.append("            return [beforeHtml, afterHtml];")
-        html_parts.append("        }")
-        html_parts.append("")
-        html_parts.append("        // Simple LCS-based diff algorithm")
-        html_parts.append("        function computeDiff(before, after) {")
-        html_parts.append("            const n = before.length;")
-        html_parts.append("            const m = after.length;")
-        html_parts.append("            const lcs = Array(n + 1).fill(null).map(() => Array(m + 1).fill(0));")
-        html_parts.append("")
-        html_parts.append("            // Build LCS table")
-        html_parts.append("            for (let i = 1; i <= n; i++) {")
-        html_parts.append("                for (let j = 1; j <= m; j++) {")
-        html_parts.append("                    if (before[i - 1] === after[j - 1]) {")
-        html_parts.append("                        lcs[i][j] = lcs[i - 1][j - 1] + 1;")
-        html_parts.append("                    } else {")
-        html_parts.append("                        lcs[i][j] = Math.max(lcs[i - 1][j], lcs[i][j - 1]);")
-        html_parts.append("                    }")
-        html_parts.append("                }")
-        html_parts.append("            }")
-        html_parts.append("")
-        html_parts.append("            // Backtrack to build diff operations")
-        html_parts.append("            const result = [];")
-        html_parts.append("            let i = n, j = m;")
-        html_parts.append("            while (i > 0 || j > 0) {")
-        html_parts.append("                if (i > 0 && j > 0 && before[i - 1] === after[j - 1]) {")
-        html_parts.append("                    if (result.length === 0 || result[0].type !== 'equal') {")
-        html_parts.append("                        result.unshift({ type: 'equal', lines: [] });")
-        html_parts.append("                    }")
-        html_parts.append("                    result[0].lines.unshift(before[i - 1]);")
-        html_parts.append("                    i--; j--;")
-        html_parts.append("                } else if (j > 0 && (i === 0 || lcs[i][j - 1] >= lcs[i - 1][j])) {")
-        html_parts.append("                    if (result.length === 0 || result[0].type !== 'insert') {")
-        html_parts.append("                        result.unshift({ type: 'insert', lines: [] });")
-        html_parts.append("                    }")
-        html_parts.append("                    result[0].lines.unshift(after[j - 1]);")
-        html_parts.append("                    j--;")
-        html_parts.append("                } else if (i > 0 && (j === 0 || lcs[i][j - 1] < lcs[i - 1][j])) {")
-        html_parts.append("                    if (result.length === 0 || result[0].type !== 'delete') {")
-        html_parts.append("                        result.unshift({ type: 'delete', lines: [] });")
-        html_parts.append("                    }")
-        html_parts.append("                    result[0].lines.unshift(before[i - 1]);")
-        html_parts.append("                    i--;")
-        html_parts.append("                }")
-        html_parts.append("            }")
-        html_parts.append("            ")
-        html_parts.append("            // Post-process: merge adjacent delete+insert into replace if lines are similar")
-        html_parts.append("            const merged = [];")
-        html_parts.append("            for (let k = 0; k < result.length; k++) {")
-        html_parts.append("                const curr = result[k];")
-        html_parts.append("                const next = result[k + 1];")
-        html_parts.append("                ")
-        html_parts.append("                if (curr.type === 'delete' && next && next.type === 'insert') {")
-        html_parts.append("                    // Check if lines are similar enough for char-level diff")
-        html_parts.append("                    const maxLen = Math.max(curr.lines.length, next.lines.length);")
-        html_parts.append("                    const beforeLines = curr.lines;")
-        html_parts.append("                    const afterLines = next.lines;")
-        html_parts.append("                    ")
-        html_parts.append("                    let shouldMerge = false;")
-        html_parts.append("                    if (maxLen === 1 || (beforeLines.length === afterLines.length && beforeLines.length <= 3)) {")
-        html_parts.append("                        // Check similarity of first pair")
-        html_parts.append("                        if (beforeLines.length > 0 && afterLines.length > 0) {")
-        html_parts.append("                            const similarity = computeSimilarity(beforeLines[0], afterLines[0]);")
-        html_parts.append("                            shouldMerge = similarity > 0.5;")
-        html_parts.append("                        }")
-        html_parts.append("                    }")
-        html_parts.append("                    ")
-        html_parts.append("                    if (shouldMerge) {")
-        html_parts.append("                        merged.push({ type: 'replace', beforeLines, afterLines });")
-        html_parts.append("                        k++; // Skip next")
-        html_parts.append("                    } else {")
-        html_parts.append("                        merged.push(curr);")
-        html_parts.append("                    }")
-        html_parts.append("                } else {")
-        html_parts.append("                    merged.push(curr);")
-        html_parts.append("                }")
-        html_parts.append("            }")
-        html_parts.append("            ")
-        html_parts.append("            return merged;")
-        html_parts.append("        }")
-        html_parts.append("")
-        html_parts.append("        function computeSimilarity(str1, str2) {")
-        html_parts.append("            const len1 = str1.length;")
-        html_parts.append("            const len2 = str2.length;")
-        html_parts.append("            if (len1 === 0 || len2 === 0) return 0;")
-        html_parts.append("            ")
-        html_parts.append("            const lcs = Array(len1 + 1).fill(null).map(() => Array(len2 + 1).fill(0));")
-        html_parts.append("            for (let i = 1; i <= len1; i++) {")
-        html_parts.append("                for (let j = 1; j <= len2; j++) {")
-        html_parts.append("                    if (str1[i - 1] === str2[j - 1]) {")
-        html_parts.append("                        lcs[i][j] = lcs[i - 1][j - 1] + 1;")
-        html_parts.append("                    } else {")
-        html_parts.append("                        lcs[i][j] = Math.max(lcs[i - 1][j], lcs[i][j - 1]);")
-        html_parts.append("                    }")
-        html_parts.append("                }")
-        html_parts.append("            }")
-        html_parts.append("            return (2.0 * lcs[len1][len2]) / (len1 + len2);")
-        html_parts.append("        }")
-        html_parts.append("")
-        html_parts.append("        function highlightCharDiff(beforeStr, afterStr, isBaselineComparison) {")
-        html_parts.append("            const charRemovedClass = isBaselineComparison ? 'baseline-char-removed' : 'char-removed';")
-        html_parts.append("            const charAddedClass = isBaselineComparison ? 'baseline-char-added' : 'char-added';")
-        html_parts.append("            ")
-        html_parts.append("            const len1 = beforeStr.length;")
-        html_parts.append("            const len2 = afterStr.length;")
-        html_parts.append("            const lcs = Array(len1 + 1).fill(null).map(() => Array(len2 + 1).fill(0));")
-        html_parts.append("            ")
-        html_parts.append("            for (let i = 1; i <= len1; i++) {")
-        html_parts.append("                for (let j = 1; j <= len2; j++) {")
-        html_parts.append("                    if (beforeStr[i - 1] === afterStr[j - 1]) {")
-        html_parts.append("                        lcs[i][j] = lcs[i - 1][j - 1] + 1;")
-        html_parts.append("                    } else {")
-        html_parts.append("                        lcs[i][j] = Math.max(lcs[i - 1][j], lcs[i][j - 1]);")
-        html_parts.append("                    }")
-        html_parts.append("                }")
-        html_parts.append("            }")
-        html_parts.append("            ")
-        html_parts.append("            const beforeParts = [];")
-        html_parts.append("            const afterParts = [];")
-        html_parts.append("            let i = len1, j = len2;")
-        html_parts.append("            ")
-        html_parts.append("            while (i > 0 || j > 0) {")
-        html_parts.append("                if (i > 0 && j > 0 && beforeStr[i - 1] === afterStr[j - 1]) {")
-        html_parts.append("                    beforeParts.unshift(escapeHtml(beforeStr[i - 1]));")
-        html_parts.append("                    afterParts.unshift(escapeHtml(afterStr[j - 1]));")
-        html_parts.append("                    i--; j--;")
-        html_parts.append("                } else if (j > 0 && (i === 0 || lcs[i][j - 1] >= lcs[i - 1][j])) {")
-        html_parts.append('                    afterParts.unshift(\'<span class="\' + charAddedClass + \'">\' + escapeHtml(afterStr[j - 1]) + \'</span>\');')
-        html_parts.append("                    j--;")
-        html_parts.append("                } else if (i > 0) {")
-        html_parts.append('                    beforeParts.unshift(\'<span class="\' + charRemovedClass + \'">\' + escapeHtml(beforeStr[i - 1]) + \'</span>\');')
-        html_parts.append("                    i--;")
-        html_parts.append("                }")
-        html_parts.append("            }")
-        html_parts.append("            ")
-        html_parts.append("            return [beforeParts.join(''), afterParts.join('')];")
-        html_parts.append("        }")
-        html_parts.append("    </script>")
-        html_parts.append("    <script>")
-        html_parts.append(f"    {src.lib.html_generation.get_notes_javascript()}")
-        html_parts.append("    </script>")
-        html_parts.append("</head>")
-        html_parts.append("<body>")
-        html_parts.append('    <div class="container">')
-        html_parts.append("        <header>")
-        html_parts.append(
-            "            <h1>Multi-Environment Terraform Plan Comparison</h1>"
-        )
-        html_parts.append(
-            f'            <p>Comparing {len(env_labels)} environments: {", ".join(env_labels)}</p>'
-        )
-        html_parts.append("        </header>")
+        emit("        </header>")
 
         # Summary cards
-        html_parts.append('        <div class="summary">')
-        html_parts.append('            <div class="summary-card total">')
-        html_parts.append(
+        emit('        <div class="summary">')
+        emit('            <div class="summary-card total">')
+        emit(
             f'                <div class="number">{self.summary_stats["total_unique_resources"]}</div>'
         )
-        html_parts.append('                <div class="label">Total Resources</div>')
-        html_parts.append("            </div>")
-        html_parts.append('            <div class="summary-card total">')
-        html_parts.append(
+        emit('                <div class="label">Total Resources</div>')
+        emit("            </div>")
+        emit('            <div class="summary-card total">')
+        emit(
             f'                <div class="number">{self.summary_stats["total_environments"]}</div>'
         )
-        html_parts.append('                <div class="label">Environments</div>')
-        html_parts.append("            </div>")
-        html_parts.append('            <div class="summary-card updated">')
-        html_parts.append(
+        emit('                <div class="label">Environments</div>')
+        emit("            </div>")
+        emit('            <div class="summary-card updated">')
+        emit(
             f'                <div class="number">{self.summary_stats["resources_with_differences"]}</div>'
         )
-        html_parts.append('                <div class="label">With Differences</div>')
-        html_parts.append("            </div>")
-        html_parts.append('            <div class="summary-card created">')
-        html_parts.append(
+        emit('                <div class="label">With Differences</div>')
+        emit("            </div>")
+        emit('            <div class="summary-card created">')
+        emit(
             f'                <div class="number">{self.summary_stats["resources_consistent"]}</div>'
         )
-        html_parts.append('                <div class="label">Consistent</div>')
-        html_parts.append("            </div>")
+        emit('                <div class="label">Consistent</div>')
+        emit("            </div>")
 
         # Show ignore statistics if any ignoring was applied
         if (
@@ -1371,317 +1896,149 @@ class MultiEnvReport:
         ):
             # Config-ignored attributes
             if self.ignore_statistics["total_ignored_attributes"] > 0:
-                html_parts.append(
+                emit(
                     '            <div class="summary-card total" style="background: #fff4e6; border-left: 4px solid #f59e0b;">'
                 )
-                html_parts.append(
+                emit(
                     f'                <div class="number">{self.ignore_statistics["total_ignored_attributes"]}</div>'
                 )
-                html_parts.append(
-                    '                <div class="label">Config Ignored</div>'
-                )
-                html_parts.append("            </div>")
+                emit('                <div class="label">Config Ignored</div>')
+                emit("            </div>")
             
             # Normalization-ignored attributes (US3 - feature 007)
             if self.ignore_statistics["normalization_ignored_attributes"] > 0:
-                html_parts.append(
+                emit(
                     '            <div class="summary-card total" style="background: #e0f2fe; border-left: 4px solid #0284c7;">'
                 )
-                html_parts.append(
+                emit(
                     f'                <div class="number">{self.ignore_statistics["normalization_ignored_attributes"]}</div>'
                 )
-                html_parts.append(
-                    '                <div class="label">Normalized</div>'
-                )
-                html_parts.append("            </div>")
+                emit('                <div class="label">Normalized</div>')
+                emit("            </div>")
             
-            html_parts.append(
+            emit(
                 '            <div class="summary-card created" style="background: #ecfdf5; border-left: 4px solid #10b981;">'
             )
-            html_parts.append(
+            emit(
                 f'                <div class="number">{self.ignore_statistics["all_changes_ignored"]}</div>'
             )
-            html_parts.append(
-                '                <div class="label">All Changes Ignored</div>'
-            )
-            html_parts.append("            </div>")
+            emit('                <div class="label">All Changes Ignored</div>')
+            emit("            </div>")
 
-        html_parts.append("        </div>")
+        emit("        </div>")
 
         # Comparison section with collapsible resource blocks
-        html_parts.append('        <div class="section">')
-        html_parts.append("            <h2>Resource Comparison</h2>")
-        html_parts.append(
+        emit('        <div class="section">')
+        emit("            <h2>Resource Comparison</h2>")
+        emit(
             '            <button class="toggle-all" onclick="toggleAll()">Expand/Collapse All</button>'
         )
 
-        # Filter if diff_only is enabled
-        comparisons_to_show = self.resource_comparisons
-        if self.diff_only:
-            comparisons_to_show = [
-                rc for rc in self.resource_comparisons if rc.has_differences
-            ]
+        # Sections were partitioned (and diff_only applied) by build_comparisons
+        regular_resources = self._regular_rcs
+        env_specific_resources = self._env_specific_rcs
+        first_env_only_resources = self._first_env_only_rcs
 
-        # Separate regular resources from environment-specific resources (v2.0 feature)
-        regular_resources = []
-        env_specific_resources = []
-        first_env_only_resources = []
-        
         # Get the first environment label (baseline)
         first_env = env_labels[0] if env_labels else None
-        
-        for rc in comparisons_to_show:
-            # Resources present in all environments are "regular"
-            if len(rc.is_present_in) == len(env_labels):
-                regular_resources.append(rc)
-            else:
-                # Check if resource only exists in first environment (will be created in others)
-                if first_env and rc.is_present_in == {first_env}:
-                    first_env_only_resources.append(rc)
-                else:
-                    # Resources missing from one or more environments are "env-specific"
-                    env_specific_resources.append(rc)
+        env_set = frozenset(env_labels)
 
         # Render regular resources first
         for rc in regular_resources:
             is_identical = not rc.has_differences
-            status_class = "identical" if is_identical else "different"
-            status_text = "✓ Identical" if is_identical else "⚠ Different"
-
-            # Check for sensitive value differences
-            has_sensitive_diff = rc.has_sensitive_differences()
-
-            html_parts.append('            <div class="resource-change">')
-            html_parts.append(
-                '                <div class="resource-change-header" onclick="toggleResource(this)">'
-            )
-            html_parts.append(
-                '                    <span class="toggle-icon collapsed">▼</span>'
-            )
-            html_parts.append(
-                f'                    <span class="resource-name">{rc.resource_address}</span>'
-            )
-            html_parts.append(
-                f'                    <span class="resource-status {status_class}">{status_text}</span>'
-            )
-
-            # Show combined ignore badge (US3 - feature 007)
-            if rc.ignored_attributes or any(diff.ignored_due_to_normalization for diff in rc.attribute_diffs):
-                # Collect normalized attribute names
-                normalized_attrs = [
-                    diff.attribute_name 
-                    for diff in rc.attribute_diffs 
-                    if diff.ignored_due_to_normalization
-                ]
-                
-                # Calculate separate counts
-                config_count, norm_count = _calculate_ignore_counts(rc.ignored_attributes, rc.attribute_diffs)
-                
-                # Render badge with breakdown
-                badge_html = _render_ignore_badge(config_count, norm_count, rc.ignored_attributes, normalized_attrs)
-                if badge_html:
-                    html_parts.append(f'                    {badge_html}')
-            
-
-            if has_sensitive_diff:
-                html_parts.append(
-                    '                    <span class="sensitive-indicator">⚠️ SENSITIVE DIFF</span>'
+            emit(
+                _REGULAR_RESOURCE_TMPL.format(
+                    resource_address=html.escape(rc.resource_address),
+                    status_class="identical" if is_identical else "different",
+                    status_text="✓ Identical" if is_identical else "⚠ Different",
+                    badges=_render_resource_badges(rc, " " * 20),
+                    attribute_table=self._render_attribute_table(
+                        rc, env_labels, env_set, esc_labels
+                    ),
                 )
-
-            html_parts.append("                </div>")
-            html_parts.append('                <div class="resource-change-content">')
-
-            # Render attribute table instead of full JSON
-            attribute_table_html = self._render_attribute_table(rc, env_labels)
-            html_parts.append(attribute_table_html)
-
-            html_parts.append("                </div>")
-            html_parts.append("            </div>")
+            )
 
         # Render environment-specific resources in collapsible section (v2.0 feature)
         if env_specific_resources:
             env_count = len(env_specific_resources)
-            html_parts.append(
-                '            <details open class="env-specific-section">'
-            )
-            html_parts.append(
-                '                <summary class="env-specific-header">'
-            )
-            html_parts.append(
-                f'                    <span>⚠️ Environment-Specific Resources</span>'
-            )
-            html_parts.append(
-                f'                    <span class="resource-count">{env_count}</span>'
-            )
-            html_parts.append("                </summary>")
-            html_parts.append('                <div class="env-specific-content">')
+            emit('            <details open class="env-specific-section">')
+            emit('                <summary class="env-specific-header">')
+            emit(f'                    <span>⚠️ Environment-Specific Resources</span>')
+            emit(f'                    <span class="resource-count">{env_count}</span>')
+            emit("                </summary>")
+            emit('                <div class="env-specific-content">')
             
             for rc in env_specific_resources:
                 is_identical = not rc.has_differences
-                status_class = "identical" if is_identical else "different"
-                status_text = "✓ Identical" if is_identical else "⚠ Different"
-                has_sensitive_diff = rc.has_sensitive_differences()
-                
+
                 # Determine which environments have this resource
                 present_envs = sorted(rc.is_present_in)
-                missing_envs = sorted(set(env_labels) - rc.is_present_in)
-                
-                html_parts.append('                    <div class="resource-change">')
-                html_parts.append(
-                    '                        <div class="resource-change-header" onclick="toggleResource(this)">'
-                )
-                html_parts.append(
-                    '                            <span class="toggle-icon collapsed">▼</span>'
-                )
-                html_parts.append(
-                    f'                            <span class="resource-name">{rc.resource_address}</span>'
-                )
-                
-                # Add environment-specific badge
+                missing_envs = sorted(env_set - rc.is_present_in)
+                present_envs_html = ", ".join(esc_labels[env] for env in present_envs)
                 if len(present_envs) == 1:
-                    html_parts.append(
-                        f'                            <span class="env-specific-badge">{present_envs[0]} only</span>'
-                    )
+                    presence_badge = f"{present_envs_html} only"
                 else:
-                    env_list = ", ".join(present_envs)
-                    html_parts.append(
-                        f'                            <span class="env-specific-badge">Present in: {env_list}</span>'
-                    )
-                
-                html_parts.append(
-                    f'                            <span class="resource-status {status_class}">{status_text}</span>'
-                )
-                
-                # Render combined ignore badge (US3 - feature 007)
-                if rc.ignored_attributes or any(diff.ignored_due_to_normalization for diff in rc.attribute_diffs):
-                    # Collect normalized attribute names
-                    normalized_attrs = [
-                        diff.attribute_name 
-                        for diff in rc.attribute_diffs 
-                        if diff.ignored_due_to_normalization
-                    ]
-                    
-                    # Calculate separate counts
-                    config_count, norm_count = _calculate_ignore_counts(rc.ignored_attributes, rc.attribute_diffs)
-                    
-                    # Render badge with breakdown
-                    badge_html = _render_ignore_badge(config_count, norm_count, rc.ignored_attributes, normalized_attrs)
-                    if badge_html:
-                        html_parts.append(f'                            {badge_html}')
-                
-                
-                if has_sensitive_diff:
-                    html_parts.append(
-                        '                            <span class="sensitive-indicator">⚠️ SENSITIVE DIFF</span>'
+                    presence_badge = f"Present in: {present_envs_html}"
+
+                # Attribute table shows ALL environments (empty for missing)
+                emit(
+                    _ENV_SPECIFIC_RESOURCE_TMPL.format(
+                        resource_address=html.escape(rc.resource_address),
+                        presence_badge=presence_badge,
+                        status_class="identical" if is_identical else "different",
+                        status_text="✓ Identical" if is_identical else "⚠ Different",
+                        badges=_render_resource_badges(rc, " " * 28),
+                        present_envs=present_envs_html,
+                        missing_envs=", ".join(esc_labels[env] for env in missing_envs),
+                        attribute_table=self._render_attribute_table(
+                            rc, env_labels, env_set, esc_labels
+                        ),
                     )
-                
-                html_parts.append("                        </div>")
-                html_parts.append(
-                    '                        <div class="resource-change-content">'
-                )
-                
-                # Add presence info box
-                html_parts.append('                            <div class="presence-info">')
-                html_parts.append(
-                    f'                                <strong>Present in:</strong> {", ".join(present_envs)}'
                 )
-                html_parts.append("<br>")
-                html_parts.append(
-                    f'                                <strong>Missing from:</strong> {", ".join(missing_envs)}'
-                )
-                html_parts.append("                            </div>")
-                
-                # Render attribute table with ALL environments (show empty for missing)
-                attribute_table_html = self._render_attribute_table(rc, env_labels)
-                html_parts.append(attribute_table_html)
-                
-                html_parts.append("                        </div>")
-                html_parts.append("                    </div>")
-            
-            html_parts.append("                </div>")
-            html_parts.append("            </details>")
+
+            emit("                </div>")
+            emit("            </details>")
 
         # Render first-env-only resources in green collapsible section (new resources to be created) - at the bottom
         if first_env_only_resources:
             resource_count = len(first_env_only_resources)
             missing_envs = [env for env in env_labels if env != first_env]
-            missing_envs_str = ", ".join(missing_envs)
+            missing_envs_str = ", ".join(esc_labels[env] for env in missing_envs)
             
-            html_parts.append(
-                '            <details class="first-env-only-section">'
-            )
-            html_parts.append(
-                '                <summary class="first-env-only-header">'
+            emit('            <details class="first-env-only-section">')
+            emit('                <summary class="first-env-only-header">')
+            emit(
+                f'                    <span>🆕 Resources in {esc_labels[first_env]} ({resource_count} will be created in {missing_envs_str})</span>'
             )
-            html_parts.append(
-                f'                    <span>🆕 Resources in {first_env} ({resource_count} will be created in {missing_envs_str})</span>'
-            )
-            html_parts.append("                </summary>")
-            html_parts.append('                <div class="first-env-only-content">')
+            emit("                </summary>")
+            emit('                <div class="first-env-only-content">')
             
             for rc in first_env_only_resources:
-                is_identical = not rc.has_differences
-                status_class = "identical" if is_identical else "different"
-                status_text = "✓ Identical" if is_identical else "⚠ Different"
-                has_sensitive_diff = rc.has_sensitive_differences()
-                
-                html_parts.append('                    <div class="resource-change">')
-                html_parts.append(
-                    '                        <div class="resource-change-header" onclick="toggleResource(this)">'
-                )
-                html_parts.append(
-                    '                            <span class="toggle-icon collapsed">▼</span>'
-                )
-                html_parts.append(
-                    f'                            <span class="resource-name">{rc.resource_address}</span>'
-                )
-                html_parts.append(
-                    f'                            <span class="first-env-badge">Will be created in: {missing_envs_str}</span>'
-                )
-                
-                # Render combined ignore badge
-                if rc.ignored_attributes or any(diff.ignored_due_to_normalization for diff in rc.attribute_diffs):
-                    normalized_attrs = [
-                        diff.attribute_name 
-                        for diff in rc.attribute_diffs 
-                        if diff.ignored_due_to_normalization
-                    ]
-                    config_count, norm_count = _calculate_ignore_counts(rc.ignored_attributes, rc.attribute_diffs)
-                    badge_html = _render_ignore_badge(config_count, norm_count, rc.ignored_attributes, normalized_attrs)
-                    if badge_html:
-                        html_parts.append(f'                            {badge_html}')
-                
-                if has_sensitive_diff:
-                    html_parts.append(
-                        '                            <span class="sensitive-indicator">⚠️ SENSITIVE DIFF</span>'
+                emit(
+                    _FIRST_ENV_ONLY_RESOURCE_TMPL.format(
+                        resource_address=html.escape(rc.resource_address),
+                        missing_envs=missing_envs_str,
+                        badges=_render_resource_badges(rc, " " * 28),
+                        attribute_table=self._render_attribute_table(
+                            rc, env_labels, env_set, esc_labels
+                        ),
                     )
-                
-                html_parts.append("                        </div>")
-                html_parts.append(
-                    '                        <div class="resource-change-content">'
                 )
-                
-                # Render attribute table
-                attribute_table_html = self._render_attribute_table(rc, env_labels)
-                html_parts.append(attribute_table_html)
-                
-                html_parts.append("                        </div>")
-                html_parts.append("                    </div>")
-            
-            html_parts.append("                </div>")
-            html_parts.append("            </details>")
 
-        html_parts.append("        </div>")
-        html_parts.append("    </div>")
-        html_parts.append("</body>")
-        html_parts.append("</html>")
+            emit("                </div>")
+            emit("            </details>")
 
-        # Write HTML file
-        with open(output_path, "w") as f:
-            f.write("\n".join(html_parts))
+        emit("        </div>")
+        emit("    </div>")
+        emit("</body>")
+        emit("</html>")
 
     def _render_attribute_table(
-        self, rc: "ResourceComparison", env_labels: List[str]
+        self,
+        rc: "ResourceComparison",
+        env_labels: List[str],
+        env_set: Optional[FrozenSet[str]] = None,
+        esc_labels: Optional[Dict[str, str]] = None,
     ) -> str:
         """
         Render attribute-level diff sections for a resource (v2.0).
@@ -1692,15 +2049,29 @@ class MultiEnvReport:
         Args:
             rc: ResourceComparison object with attribute_diffs
             env_labels: List of environment labels
+            env_set: Frozen set of env_labels, shared across resources by callers
+            esc_labels: Map of each label to its HTML-escaped form, likewise shared
 
         Returns:
             HTML string for the attribute sections
         """
+        if env_set is None:
+            env_set = frozenset(env_labels)
+        if esc_labels is None:
+            esc_labels = {label: html.escape(label) for label in env_labels}
+        # For env-specific resources (not present in all environments), show ALL
+        # attributes; for resources present everywhere, only changed attributes
+        is_env_specific = len(rc.is_present_in) < len(env_labels)
+
+        # Complex values are compared against the baseline once per column and
+        # again by the baseline column, so share the results across columns
+        equal_cache: Dict[Tuple[int, int], Tuple[bool, Any, Any]] = {}
+
         parts = []
         parts.append('                    <div class="attribute-table-container">')
 
         # Check if resource is present in all environments
-        if len(rc.is_present_in) < len(env_labels):
+        if is_env_specific:
             parts.append(
                 '                        <div style="padding: 15px; background: #fff4e6; border-left: 4px solid #f59e0b; margin-bottom: 15px;">'
             )
@@ -1708,11 +2079,11 @@ class MultiEnvReport:
                 "                            <strong>⚠️ Resource Presence Mismatch</strong><br>"
             )
             parts.append(
-                f'                            Present in: {", ".join(sorted(rc.is_present_in))}<br>'
+                f'                            Present in: {", ".join(esc_labels[env] for env in sorted(rc.is_present_in))}<br>'
             )
-            missing = set(env_labels) - rc.is_present_in
+            missing = env_set - rc.is_present_in
             parts.append(
-                f'                            Missing from: {", ".join(sorted(missing))}'
+                f'                            Missing from: {", ".join(esc_labels[env] for env in sorted(missing))}'
             )
             parts.append("                        </div>")
 
@@ -1724,45 +2095,41 @@ class MultiEnvReport:
             parts.append("                            ✓ No differences detected")
             parts.append("                        </div>")
         else:
+            # Env-specific and identical resources show ALL attributes; other
+            # resources only the ones that still differ after normalization
+            if is_env_specific or not rc.has_differences:
+                shown_attribute_diffs = rc.attribute_diffs
+            else:
+                shown_attribute_diffs = rc.changed_attribute_diffs
+
+            sanitized_resource = html.escape(
+                self._sanitize_for_html_id(rc.resource_address)
+            )
+            esc_address = html.escape(rc.resource_address)
+
             # Render attribute sections (v2.0 layout)
-            for attr_diff in rc.attribute_diffs:
+            for attr_diff in shown_attribute_diffs:
                 # Skip attributes that were normalized and became identical (hide them)
                 if attr_diff.ignored_due_to_normalization:
                     continue
-                
-                # For env-specific resources (not present in all environments), show ALL attributes
-                # For resources present in all environments, only show changed attributes
-                is_env_specific = len(rc.is_present_in) < len(env_labels)
-                if not is_env_specific and not attr_diff.is_different and rc.has_differences:
-                    continue
+
+                is_different = attr_diff.is_different
 
                 # Start attribute section
-                section_class = "attribute-section"
-                if attr_diff.is_different:
-                    parts.append(
-                        f'                        <div class="{section_class}" style="background: #fff3cd;">'
-                    )
+                if is_different:
+                    parts.append(_ATTRIBUTE_SECTION_CHANGED_OPEN)
                 else:
-                    parts.append(
-                        f'                        <div class="{section_class}">'
-                    )
+                    parts.append(_ATTRIBUTE_SECTION_OPEN)
 
                 # Attribute header (H3 with attribute name)
+                esc_attribute_name = html.escape(attr_diff.attribute_name)
                 parts.append(
-                    '                            <h3 class="attribute-header">'
-                )
-                parts.append(
-                    f"                                <code>{html.escape(attr_diff.attribute_name)}</code>"
+                    _ATTRIBUTE_HEADER_TMPL.format(attribute_name=esc_attribute_name)
                 )
 
                 # Add badge for sensitive attributes
-                if any(
-                    isinstance(val, str) and "SENSITIVE" in val
-                    for val in attr_diff.env_values.values()
-                ):
-                    parts.append(
-                        '                                <span class="sensitive-badge">🔒 SENSITIVE</span>'
-                    )
+                if attr_diff.has_sensitive_value:
+                    parts.append(_SENSITIVE_BADGE_LINE)
 
                 # Add sort control for JSON objects (dict/list)
                 has_json_values = any(
@@ -1773,24 +2140,14 @@ class MultiEnvReport:
                     # Detect sortable fields for array-of-object structures
                     sortable_fields = self._detect_sortable_fields(attr_diff)
                     
-                    parts.append(
-                        '                                <select class="json-sort-control" onchange="handleSortChange(this)">'
-                    )
-                    parts.append(
-                        '                                    <option value="sorted">Alphabetical (A-Z)</option>'
-                    )
-                    parts.append(
-                        '                                    <option value="unsorted">Insertion Order</option>'
-                    )
+                    parts.append(_SORT_CONTROL_OPEN)
                     
                     # Add field-based options if sortable fields detected
                     if sortable_fields:
-                        parts.append(
-                            '                                    <option disabled>──────────</option>'
-                        )
+                        parts.append(_SORT_FIELD_SEPARATOR_LINE)
                         for field in sortable_fields:
                             parts.append(
-                                f'                                    <option value="field:{html.escape(field)}">Sort by: {html.escape(field)}</option>'
+                                _SORT_FIELD_OPTION_TMPL.format(html.escape(field))
                             )
                     
                     parts.append(
@@ -1799,6 +2156,17 @@ class MultiEnvReport:
 
                 parts.append("                            </h3>")
 
+                # Baselines are the same for every column: the one used for diff
+                # highlighting, and the one marked as data-is-baseline for re-sorting
+                baseline = None
+                if is_different:
+                    baseline = _find_baseline(
+                        attr_diff.normalized_values or attr_diff.env_values, env_labels
+                    )
+                sort_baseline_env, _ = _find_baseline(
+                    attr_diff.normalized_values or attr_diff.env_values_raw, env_labels
+                )
+
                 # Attribute values container (flexbox)
                 parts.append(
                     '                            <div class="attribute-values">'
@@ -1806,6 +2174,7 @@ class MultiEnvReport:
 
                 # Value columns for each environment
                 for env_label in env_labels:
+                    esc_label = esc_labels[env_label]
                     # Start with raw unmasked value, then apply normalization if available, then merged masking
                     if attr_diff.normalized_values and env_label in attr_diff.normalized_values:
                         # Use normalized value
@@ -1821,60 +2190,43 @@ class MultiEnvReport:
                             value = rc._mask_sensitive_value(value, attr_sensitive)
                     
                     value_html = self._render_attribute_value(
-                        value, attr_diff, env_labels, env_label
+                        value, attr_diff, env_labels, env_label, equal_cache, baseline
                     )
                     
                     # Build data attributes for JSON objects to enable client-side re-sorting
                     data_attrs = ''
                     if isinstance(value, (dict, list)) and value is not None:
                         # Determine if this is the baseline environment
-                        is_baseline = False
-                        for env in env_labels:
-                            baseline_value = attr_diff.normalized_values.get(env) if attr_diff.normalized_values else attr_diff.env_values_raw.get(env)
-                            if baseline_value is not None:
-                                is_baseline = (env == env_label)
-                                break
-                        
+                        is_baseline = env_label == sort_baseline_env
+
                         # Store raw JSON data as data attributes (escape quotes for HTML)
-                        json_str = json.dumps(value, ensure_ascii=False)
-                        data_attrs = f' data-json-value="{html.escape(json_str, quote=True)}" data-env="{env_label}" data-is-baseline="{str(is_baseline).lower()}"'
+                        json_str = _compact_json(value)
+                        data_attrs = f' data-json-value="{html.escape(json_str, quote=True)}" data-env="{esc_label}" data-is-baseline="{str(is_baseline).lower()}"'
                     
+                    # Value is wrapped in a scrollable container (v2.0 feature)
                     parts.append(
-                        f'                                <div class="env-value-column"{data_attrs}>'
-                    )
-                    parts.append(
-                        f'                                    <div class="env-label">{env_label}</div>'
-                    )
-                    # Wrap value in scrollable container (v2.0 feature)
-                    parts.append(
-                        '                                    <div class="value-container">'
-                    )
-                    parts.append(
-                        f'                                        {value_html}'
-                    )
-                    parts.append(
-                        "                                    </div>"
-                    )
-                    parts.append(
-                        "                                </div>"
+                        _ENV_VALUE_COLUMN_TMPL.format(
+                            data_attrs=data_attrs,
+                            env_label=esc_label,
+                            value_html=value_html,
+                        )
                     )
 
                 parts.append("                            </div>")  # Close attribute-values
                 
                 # Add notes container (T015-T020: User Story 1 - Question field)
-                sanitized_resource = self._sanitize_for_html_id(rc.resource_address)
-                sanitized_attribute = self._sanitize_for_html_id(attr_diff.attribute_name)
+                sanitized_attribute = html.escape(
+                    self._sanitize_for_html_id(attr_diff.attribute_name)
+                )
                 
-                parts.append('                            <div class="notes-container">')
-                parts.append('                                <div>')
-                parts.append(f'                                    <label class="note-label" for="note-q-{sanitized_resource}-{sanitized_attribute}">Question:</label>')
-                parts.append(f'                                    <textarea class="note-field" id="note-q-{sanitized_resource}-{sanitized_attribute}" placeholder="Add a question..." oninput="debouncedSaveNote(\'{rc.resource_address}\', \'{attr_diff.attribute_name}\', \'question\', this.value)" rows="4"></textarea>')
-                parts.append('                                </div>')
-                parts.append('                                <div class="note-answer">')
-                parts.append(f'                                    <label class="note-label" for="note-a-{sanitized_resource}-{sanitized_attribute}">Answer:</label>')
-                parts.append(f'                                    <textarea class="note-field" id="note-a-{sanitized_resource}-{sanitized_attribute}" placeholder="Add an answer..." oninput="debouncedSaveNote(\'{rc.resource_address}\', \'{attr_diff.attribute_name}\', \'answer\', this.value)" rows="4"></textarea>')
-                parts.append('                                </div>')
-                parts.append('                            </div>')
+                parts.append(
+                    _NOTES_CONTAINER_TMPL.format(
+                        resource_id=sanitized_resource,
+                        attribute_id=sanitized_attribute,
+                        resource_address=esc_address,
+                        attribute_name=esc_attribute_name,
+                    )
+                )
                 
                 parts.append("                        </div>")  # Close attribute-section
 
@@ -1887,6 +2239,8 @@ class MultiEnvReport:
         attr_diff: AttributeDiff,
         env_labels: List[str],
         current_env: str,
+        equal_cache: Optional[Dict[Tuple[int, int], Tuple[bool, Any, Any]]] = None,
+        baseline: Optional[Tuple[Optional[str], Any]] = None,
     ) -> str:
         """
         Render a single attribute value with appropriate formatting and highlighting.
@@ -1896,6 +2250,10 @@ class MultiEnvReport:
             attr_diff: The AttributeDiff object containing all environment values
             env_labels: List of all environment labels
             current_env: Current environment being rendered
+            equal_cache: Optional cache for comparisons of complex values, shared
+                across the environment columns of a resource
+            baseline: Optional (baseline_env, baseline_val) precomputed by the
+                caller with _find_baseline; found here when omitted
 
         Returns:
             HTML string for the value
@@ -1907,7 +2265,7 @@ class MultiEnvReport:
         if isinstance(value, (str, int, float, bool)):
             # Check if this is a sensitive value
             if isinstance(value, str) and "SENSITIVE" in value:
-                return f'<code style="background: #f8d7da; padding: 2px 6px; border-radius: 3px;">{html.escape(str(value))}</code>'
+                return f'<code style="background: #f8d7da; padding: 2px 6px; border-radius: 3px;">{html.escape(value)}</code>'
 
             # For different values, apply character-level diff highlighting
             if attr_diff.is_different and attr_diff.attribute_type == "primitive":
@@ -1915,13 +2273,9 @@ class MultiEnvReport:
                 values_for_comparison = attr_diff.normalized_values if attr_diff.normalized_values else attr_diff.env_values
                 
                 # Get baseline value (first non-None value)
-                baseline_val = None
-                baseline_env = None
-                for env in env_labels:
-                    if values_for_comparison.get(env) is not None:
-                        baseline_val = values_for_comparison[env]
-                        baseline_env = env
-                        break
+                if baseline is None:
+                    baseline = _find_baseline(values_for_comparison, env_labels)
+                baseline_env, baseline_val = baseline
 
                 # If this IS the baseline environment, we need to compare against other envs
                 if current_env == baseline_env and baseline_val is not None:
@@ -1947,24 +2301,25 @@ class MultiEnvReport:
                         )
                         return f'<code class="baseline-added">{value_highlighted}</code>'
 
-            # Default: show value without highlighting
-            return f"<code>{html.escape(str(value))}</code>"
+            # Default: show value without highlighting. Numbers and booleans
+            # never contain markup characters, so only strings are escaped
+            if isinstance(value, str):
+                return f"<code>{html.escape(value)}</code>"
+            return f"<code>{value}</code>"
 
         # Handle complex objects (dict, list)
         if isinstance(value, (dict, list)):
+            if equal_cache is None:
+                equal_cache = {}
             # For objects/arrays with differences, apply JSON diff highlighting
             if attr_diff.is_different:
                 # Use normalized values for comparison if available, otherwise use original values
                 values_for_comparison = attr_diff.normalized_values if attr_diff.normalized_values else attr_diff.env_values
                 
                 # Get baseline value
-                baseline_val = None
-                baseline_env = None
-                for env in env_labels:
-                    if values_for_comparison.get(env) is not None:
-                        baseline_val = values_for_comparison[env]
-                        baseline_env = env
-                        break
+                if baseline is None:
+                    baseline = _find_baseline(values_for_comparison, env_labels)
+                baseline_env, baseline_val = baseline
                 
                 # If this IS the baseline environment, compare against other envs
                 if current_env == baseline_env and baseline_val is not None:
@@ -1973,7 +2328,9 @@ class MultiEnvReport:
                     for env in env_labels:
                         if env != baseline_env:
                             other_val = values_for_comparison.get(env)
-                            if other_val is not None and json.dumps(other_val, sort_keys=True) != json.dumps(baseline_val, sort_keys=True):
+                            if other_val is not None and not _json_equal_cached(
+                                other_val, baseline_val, equal_cache
+                            ):
                                 break
                     
                     if other_val is not None:
@@ -1981,7 +2338,9 @@ class MultiEnvReport:
                         return f'<pre class="json-content" style="margin: 0; font-size: 0.85em;">{baseline_highlighted}</pre>'
                 
                 # For non-baseline environments, compare against baseline
-                elif baseline_val is not None and json.dumps(value, sort_keys=True) != json.dumps(baseline_val, sort_keys=True):
+                elif baseline_val is not None and not _json_equal_cached(
+                    value, baseline_val, equal_cache
+                ):
                     _, value_highlighted = _highlight_json_diff(baseline_val, value)
                     return f'<pre class="json-content" style="margin: 0; font-size: 0.85em;">{value_highlighted}</pre>'
             
@@ -2001,8 +2360,6 @@ class MultiEnvReport:
         Returns:
             Formatted text report
         """
-        import shutil
-
         # Get terminal width, default to 100 if not available
         try:
             terminal_width = shutil.get_terminal_size().columns
@@ -2011,6 +2368,8 @@ class MultiEnvReport:
 
         # Build environment labels list
         env_labels = [env.label for env in self.environments]
+        n_envs = len(env_labels)
+        env_set = frozenset(env_labels)
 
         lines = []
 
@@ -2088,14 +2447,10 @@ class MultiEnvReport:
         lines.append("-" * terminal_width)
         lines.append("")
 
-        # Filter if diff_only is enabled
-        comparisons_to_show = self.resource_comparisons
-        if self.diff_only:
-            comparisons_to_show = [
-                rc for rc in self.resource_comparisons if rc.has_differences
-            ]
+        separator = "-" * terminal_width
 
-        for rc in comparisons_to_show:
+        # Filtered by diff_only in build_comparisons
+        for rc in self._shown_rcs:
             status = "✓ IDENTICAL" if not rc.has_differences else "⚠ DIFFERENT"
 
             # Resource header
@@ -2114,9 +2469,9 @@ class MultiEnvReport:
 
             # Environment presence
             present_envs = ", ".join(sorted(rc.is_present_in))
-            missing_envs = ", ".join(sorted(set(env_labels) - rc.is_present_in))
 
-            if len(rc.is_present_in) < len(env_labels):
+            if len(rc.is_present_in) < n_envs:
+                missing_envs = ", ".join(sorted(env_set - rc.is_present_in))
                 lines.append(f"Present in: {present_envs}")
                 lines.append(f"Missing from: {missing_envs}")
             else:
@@ -2133,12 +2488,12 @@ class MultiEnvReport:
                         lines.append("    NOT PRESENT")
                     else:
                         config_json = json.dumps(config, indent=4, sort_keys=True)
-                        # Indent each line
-                        for line in config_json.split("\n"):
-                            lines.append(f"    {line}")
+                        # Indent each line; json.dumps escapes newlines inside
+                        # strings, so every newline here is a line break
+                        lines.append("    " + config_json.replace("\n", "\n    "))
                     lines.append("")
 
-            lines.append("-" * terminal_width)
+            lines.append(separator)
             lines.append("")
 
         return "\n".join(lines)
@@ -8,7 +8,11 @@ with HTML formatting. Used across analyze_plan.py and multi_env_comparator.py.
 import html
 import json
 from difflib import SequenceMatcher
-from typing import Any, Tuple
+from typing import Any, Sequence, Tuple
+
+# Strings longer than this are diffed line by line; character-level matching
+# is quadratic in the worst case and stalls on large blobs
+CHAR_DIFF_MAX_LENGTH = 50_000
 
 
 def highlight_char_diff(
@@ -40,9 +44,10 @@ def highlight_char_diff(
         >>> # before: 'hello <span class="char-removed">world</span>'
         >>> # after: 'hello <span class="char-added">terra</span>'
     """
-    matcher = SequenceMatcher(None, before_str, after_str)
-    before_parts = []
-    after_parts = []
+    if before_str == after_str:
+        # Nothing to highlight; skip building the matcher
+        text = html.escape(before_str)
+        return text, text
 
     # Choose the CSS classes based on context
     if is_baseline_comparison:
@@ -55,34 +60,55 @@ def highlight_char_diff(
         char_removed_class = "char-removed"
         char_added_class = "char-added"
 
+    if len(before_str) > CHAR_DIFF_MAX_LENGTH or len(after_str) > CHAR_DIFF_MAX_LENGTH:
+        # Match whole lines instead, keeping line endings so the text round-trips
+        before_units: Sequence[str] = before_str.splitlines(keepends=True)
+        after_units: Sequence[str] = after_str.splitlines(keepends=True)
+    else:
+        before_units = before_str
+        after_units = after_str
+
+    matcher = SequenceMatcher(None, before_units, after_units)
+    before_parts = []
+    after_parts = []
+
     for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        before_text = _join_units(before_units, i1, i2)
+        after_text = _join_units(after_units, j1, j2)
         if tag == "equal":
             # Characters are the same
-            text = html.escape(before_str[i1:i2])
+            text = html.escape(before_text)
             before_parts.append(text)
             after_parts.append(text)
         elif tag == "delete":
             # Characters only in before
             before_parts.append(
-                f'<span class="{char_removed_class}">{html.escape(before_str[i1:i2])}</span>'
+                f'<span class="{char_removed_class}">{html.escape(before_text)}</span>'
             )
         elif tag == "insert":
             # Characters only in after
             after_parts.append(
-                f'<span class="{char_added_class}">{html.escape(after_str[j1:j2])}</span>'
+                f'<span class="{char_added_class}">{html.escape(after_text)}</span>'
             )
         elif tag == "replace":
             # Characters differ
             before_parts.append(
-                f'<span class="{char_removed_class}">{html.escape(before_str[i1:i2])}</span>'
+                f'<span class="{char_removed_class}">{html.escape(before_text)}</span>'
             )
             after_parts.append(
-                f'<span class="{char_added_class}">{html.escape(after_str[j1:j2])}</span>'
+                f'<span class="{char_added_class}">{html.escape(after_text)}</span>'
             )
 
     return "".join(before_parts), "".join(after_parts)
 
 
+def _join_units(units: Sequence[str], start: int, end: int) -> str:
+    """Return units[start:end] as text, whether units is a string or a list of lines."""
+    if isinstance(units, str):
+        return units[start:end]
+    return "".join(units[start:end])
+
+
 def highlight_json_diff(
     before: Any,
     after: Any,
@@ -265,12 +291,14 @@ def highlight_json_diff(
                         before_line = before_chunk[idx]
                         after_line = after_chunk[idx]
 
-                        # Check if lines are similar enough for character-level diff
-                        similarity = SequenceMatcher(
-                            None, before_line, after_line
-                        ).ratio()
+                        # Check if lines are similar enough for character-level diff.
+                        # The quick ratios are upper bounds of ratio(), so lines
+                        # they already rule out skip the full match.
+                        line_matcher = SequenceMatcher(None, before_line, after_line)
                         if (
-                            similarity > 0.5
+                            line_matcher.real_quick_ratio() > 0.5
+                            and line_matcher.quick_ratio() > 0.5
+                            and line_matcher.ratio() > 0.5
                         ):  # If more than 50% similar, show character diff
                             before_highlighted, after_highlighted = highlight_char_diff(
                                 before_line, after_line, is_known_after_apply, is_baseline_comparison
@@ -12,6 +12,8 @@ Functions:
     generate_full_styles() -> str: Returns complete <style> block combining all CSS
 """
 
+from functools import lru_cache
+
 
 def get_base_css() -> str:
     """
@@ -1162,10 +1164,14 @@ def get_notes_javascript() -> str:
 """
 
 
+@lru_cache(maxsize=None)
 def generate_full_styles() -> str:
     """
     Generate complete <style> block combining all CSS functions.
 
+    The stylesheet is static, so it is assembled once per process and the
+    same string is returned to every report.
+
     This is the main entry point for getting all CSS. It combines:
     - Base typography and layout (get_base_css)
     - Summary cards with semantic colors (get_summary_card_css)
@@ -118,30 +118,26 @@ def load_ignore_config(file_path: Path) -> Dict:
     return config
 
 
-def apply_ignore_config(
-    resource_config: Dict, ignore_rules: Dict, resource_type: str
-) -> Dict:
+def get_ignore_attributes_for_type(ignore_rules: Dict, resource_type: str) -> Set[str]:
     """
-    Apply ignore rules to a resource configuration, removing ignored attributes.
+    Collect the attribute names the ignore rules remove for one resource type.
+
+    The result depends only on the rules and the type, so callers filtering many
+    resources can compute it once per type and pass it to
+    remove_ignored_attributes and find_ignored_attributes.
 
     Args:
-        resource_config: The resource configuration dictionary to filter
         ignore_rules: The ignore configuration (from load_ignore_config)
         resource_type: The type of the resource (e.g., 'azurerm_monitor_metric_alert')
 
     Returns:
-        A new dictionary with ignored attributes removed
+        Set of attribute names, possibly in dot notation (e.g., 'identity.type')
 
     Example:
-        >>> config = {'name': 'test', 'tags': {'env': 'dev'}, 'location': 'eastus'}
-        >>> rules = {'global_ignores': ['tags']}
-        >>> apply_ignore_config(config, rules, 'azurerm_resource')
-        {'name': 'test', 'location': 'eastus'}
+        >>> rules = {'global_ignores': ['tags'], 'resource_ignores': {'aws_a': ['sku']}}
+        >>> sorted(get_ignore_attributes_for_type(rules, 'aws_a'))
+        ['sku', 'tags']
     """
-    # Deep copy to avoid modifying original
-    filtered_config = json.loads(json.dumps(resource_config))
-
-    # Collect all attributes to ignore
     ignore_attributes: Set[str] = set()
 
     # Add global ignores
@@ -160,6 +156,28 @@ def apply_ignore_config(
         elif isinstance(resource_ignores, dict):
             ignore_attributes.update(resource_ignores.keys())
 
+    return ignore_attributes
+
+
+def remove_ignored_attributes(
+    resource_config: Dict, ignore_attributes: Set[str]
+) -> Dict:
+    """
+    Remove attributes from a resource configuration without modifying it.
+
+    Only the dictionaries on the path to a removed attribute are copied; all
+    other values are shared with resource_config.
+
+    Args:
+        resource_config: The resource configuration dictionary to filter
+        ignore_attributes: Attribute names to remove, as returned by
+            get_ignore_attributes_for_type
+
+    Returns:
+        A new dictionary with the attributes removed
+    """
+    filtered_config = dict(resource_config)
+
     # Remove ignored attributes (handle both top-level and nested dot notation)
     for attr in ignore_attributes:
         if "." in attr:
@@ -172,6 +190,52 @@ def apply_ignore_config(
     return filtered_config
 
 
+def find_ignored_attributes(
+    resource_config: Dict, ignore_attributes: Set[str]
+) -> Set[str]:
+    """
+    Get the attribute names from ignore_attributes present in a configuration.
+
+    Args:
+        resource_config: The resource configuration dictionary
+        ignore_attributes: Candidate attribute names, as returned by
+            get_ignore_attributes_for_type
+
+    Returns:
+        Set of attribute names that exist in the resource configuration
+    """
+    return {
+        attr
+        for attr in ignore_attributes
+        if supports_dot_notation(attr, resource_config)
+    }
+
+
+def apply_ignore_config(
+    resource_config: Dict, ignore_rules: Dict, resource_type: str
+) -> Dict:
+    """
+    Apply ignore rules to a resource configuration, removing ignored attributes.
+
+    Args:
+        resource_config: The resource configuration dictionary to filter
+        ignore_rules: The ignore configuration (from load_ignore_config)
+        resource_type: The type of the resource (e.g., 'azurerm_monitor_metric_alert')
+
+    Returns:
+        A new dictionary with ignored attributes removed
+
+    Example:
+        >>> config = {'name': 'test', 'tags': {'env': 'dev'}, 'location': 'eastus'}
+        >>> rules = {'global_ignores': ['tags']}
+        >>> apply_ignore_config(config, rules, 'azurerm_resource')
+        {'name': 'test', 'location': 'eastus'}
+    """
+    return remove_ignored_attributes(
+        resource_config, get_ignore_attributes_for_type(ignore_rules, resource_type)
+    )
+
+
 def get_ignored_attributes(
     resource_config: Dict, ignore_rules: Dict, resource_type: str
 ) -> Set[str]:
@@ -195,33 +259,9 @@ def get_ignored_attributes(
         >>> get_ignored_attributes(config, rules, 'azurerm_resource')
         {'tags'}
     """
-    ignored_attributes: Set[str] = set()
-
-    # Collect all potential ignore rules
-    ignore_candidates: Set[str] = set()
-
-    # Add global ignores
-    if "global_ignores" in ignore_rules:
-        global_ignores = ignore_rules["global_ignores"]
-        if isinstance(global_ignores, list):
-            ignore_candidates.update(global_ignores)
-        elif isinstance(global_ignores, dict):
-            ignore_candidates.update(global_ignores.keys())
-
-    # Add resource-specific ignores
-    if "resource_ignores" in ignore_rules:
-        resource_ignores = ignore_rules["resource_ignores"].get(resource_type, {})
-        if isinstance(resource_ignores, list):
-            ignore_candidates.update(resource_ignores)
-        elif isinstance(resource_ignores, dict):
-            ignore_candidates.update(resource_ignores.keys())
-
-    # Check which attributes are actually present in the config
-    for attr in ignore_candidates:
-        if supports_dot_notation(attr, resource_config):
-            ignored_attributes.add(attr)
-
-    return ignored_attributes
+    return find_ignored_attributes(
+        resource_config, get_ignore_attributes_for_type(ignore_rules, resource_type)
+    )
 
 
 def supports_dot_notation(attribute_path: str, config: Dict) -> bool:
@@ -267,7 +307,9 @@ def _remove_nested_attribute(config: Dict, attribute_path: str) -> None:
     """
     Remove a nested attribute from a configuration dictionary.
 
-    Internal helper function that modifies the dictionary in place.
+    Internal helper function that modifies config in place. Nested dictionaries
+    on the path are replaced by copies before they are changed, so values
+    shared with another configuration are left untouched.
 
     Args:
         config: The configuration dictionary to modify
@@ -279,13 +321,15 @@ def _remove_nested_attribute(config: Dict, attribute_path: str) -> None:
         config.pop(parts[0], None)
         return
 
-    # Navigate to parent of target attribute
+    # Navigate to parent of target attribute, copying each level
     current = config
     for part in parts[:-1]:
-        if not isinstance(current, dict) or part not in current:
+        child = current.get(part)
+        if not isinstance(child, dict):
             return  # Path doesn't exist, nothing to remove
-        current = current[part]
+        child = dict(child)
+        current[part] = child
+        current = child
 
     # Remove the final attribute
-    if isinstance(current, dict):
-        current.pop(parts[-1], None)
+    current.pop(parts[-1], None)
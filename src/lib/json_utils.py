@@ -8,6 +8,11 @@ eliminating duplicate file handling patterns across the codebase.
 import json
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional dependency, speeds up JSON parsing
+
 
 def load_json_file(file_path: str) -> Dict[str, Any]:
     """
@@ -16,6 +21,10 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
     Provides a standardized way to load JSON files with consistent error handling
     and encoding. Used throughout the codebase to replace inline file reading patterns.
 
+    Parsing uses orjson when it is installed. Input orjson rejects (e.g. integers
+    wider than 64 bits) is re-parsed with the standard library, so invalid files
+    still raise json.JSONDecodeError.
+
     Args:
         file_path: Path to the JSON file to load
 
@@ -31,8 +40,14 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
         >>> plan_data = load_json_file('test_data/dev-plan.json')
         >>> resource_changes = plan_data.get('resource_changes', [])
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        content = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content.decode("utf-8"))
 
 
 def format_json_for_display(data: Any, indent: int = 2, sort_keys: bool = True) -> str:
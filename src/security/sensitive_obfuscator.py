@@ -139,6 +139,11 @@ def traverse_and_obfuscate(
                     f"expected boolean or nested object, got {type(marker_value).__name__}"
                 )
 
+            # Unmarked fields are copied as-is without descending into them
+            if marker_value is False or marker_value is None:
+                result[key] = value
+                continue
+
             result[key] = traverse_and_obfuscate(
                 value, marker_value, salt, position_seed, path + [key]
             )
@@ -164,6 +169,9 @@ def traverse_and_obfuscate(
         # Create new list with obfuscated values
         result = []
         for i, (item_data, item_marker) in enumerate(zip(data, sensitive_marker)):
+            if item_marker is False or item_marker is None:
+                result.append(item_data)
+                continue
             result.append(
                 traverse_and_obfuscate(
                     item_data, item_marker, salt, position_seed, path + [f"[{i}]"]
@@ -156,6 +156,28 @@ class TestMultiEnvComparison:
         assert result.returncode == 1
         assert "File not found" in result.stdout
 
+    def test_compare_nonexistent_file_reported_first(self, tmp_path):
+        """A missing plan is reported before the banner and config errors."""
+        bad_config = tmp_path / "bad-config.json"
+        bad_config.write_text("{not json")
+
+        result = subprocess.run(
+            [
+                "python3",
+                "src/cli/analyze_plan.py",
+                "compare",
+                "tests/fixtures/dev-plan.json",
+                "nonexistent.json",
+                "--config",
+                str(bad_config),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 1
+        assert result.stdout.startswith("Error: File not found: nonexistent.json")
+        assert "Comparing" not in result.stdout
+
     def test_compare_five_environments(self):
         """Test comparing five environments to verify variable environment count support."""
         import os
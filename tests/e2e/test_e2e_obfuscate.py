@@ -254,6 +254,17 @@ def test_file_not_found():
     assert "Input file not found" in stderr
 
 
+def test_file_not_found_with_existing_output(tmp_path):
+    """T027: A missing input is reported even if the default output exists."""
+    (tmp_path / "missing-obfuscated.json").write_text("{}")
+
+    returncode, stdout, stderr = run_obfuscate([str(tmp_path / "missing.json")])
+
+    assert returncode == 1
+    assert "Input file not found" in stderr
+    assert "Output file already exists" not in stderr
+
+
 def test_not_terraform_plan(tmp_path):
     """T027: Test with JSON that's not a Terraform plan."""
     not_plan = tmp_path / "not-plan.json"
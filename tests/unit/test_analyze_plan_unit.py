@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TerraformPlanAnalyzer helper methods.
+
+Covers the small value-inspection helpers used while building reports.
+"""
+
+import json
+
+import pytest
+import src.cli.analyze_plan as analyze_plan
+from src.cli.analyze_plan import TerraformPlanAnalyzer
+from src.lib.json_utils import load_json_file
+
+
+class TestContainsHclInterp:
+    """Unit tests for _contains_hcl_interp."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "${var.location}",
+            {"settings": {"name": "prefix-${local.env}"}},
+            [{"a": 1}, ["x", "${var.y}"]],
+            {"${each.key}": "value"},
+        ],
+    )
+    def test_detects_interpolation(self, value):
+        """Interpolations are found in nested strings and keys."""
+        assert TerraformPlanAnalyzer._contains_hcl_interp(value) is True
+
+    @pytest.mark.parametrize(
+        "value",
+        [None, 42, True, "plain", {"a": ["b", {"c": "$ {x}"}]}, []],
+    )
+    def test_ignores_values_without_interpolation(self, value):
+        """Values without ${ are not treated as HCL."""
+        assert TerraformPlanAnalyzer._contains_hcl_interp(value) is False
+
+
+class TestHasSensitiveFields:
+    """Unit tests for _has_sensitive_fields."""
+
+    @pytest.mark.parametrize(
+        "value, sensitivity_map",
+        [
+            ("secret", True),
+            ("plain", False),
+            ({"a": 1, "b": "x"}, {"b": True}),
+            ({"a": 1}, {"b": True}),
+            ([{"k": "v"}, {"k": "w"}], [{}, {"k": True}]),
+            (["a", "b"], [False]),
+            ({"nested": {"deep": [1, 2]}}, {"nested": {"deep": [False, True]}}),
+            ({"a": 1}, []),
+            ({"a": 1}, {"b": {"c": True}}),
+            ({"a": {"b": "x"}}, {"a": {}}),
+            (["a"], [False, True]),
+            ("plain", {"a": True}),
+            ({"a": [{"b": 1}]}, {"a": [{"b": 1}]}),
+        ],
+    )
+    def test_matches_redaction_walk(self, value, sensitivity_map):
+        """The short-circuit check agrees with the full redaction walk."""
+        analyzer = TerraformPlanAnalyzer("plan.json")
+        _, sensitivity_info = analyzer._redact_sensitive_fields(value, sensitivity_map)
+        assert analyzer._has_sensitive_fields(value, sensitivity_map) == bool(
+            sensitivity_info
+        )
+
+
+class TestBuildUpdatedChanges:
+    """Unit tests for _build_updated_changes."""
+
+    def _results(self):
+        return {
+            "config_changes": [
+                {
+                    "address": "azurerm_key_vault.main",
+                    "changed_attributes": {
+                        "name": ("kv-old", "kv-${var.env}", False, False),
+                        "secret": ("a", "b", True, True),
+                    },
+                }
+            ]
+        }
+
+    def test_classifies_changes(self):
+        """Sensitive values are redacted and HCL references are kept."""
+        analyzer = TerraformPlanAnalyzer("plan.json")
+        (item,) = analyzer._build_updated_changes(self._results())
+        name, secret = item["changes"]
+
+        assert item["address"] == "azurerm_key_vault.main"
+        assert name["is_known_after_apply"] is True
+        assert name["after_hcl_reference"] == "kv-${var.env}"
+        assert name["before_hcl_reference"] is None
+        assert secret["is_sensitive"] is True
+        assert secret["after"] != "b"
+
+    def test_reuses_result_for_same_results(self):
+        """The processed changes are cached per results dict."""
+        analyzer = TerraformPlanAnalyzer("plan.json")
+        results = self._results()
+        first = analyzer._build_updated_changes(results)
+        assert analyzer._build_updated_changes(results) is first
+        assert analyzer._build_updated_changes(self._results()) is not first
+
+
+class TestIgnoredTotal:
+    """Unit tests for the running ignored change count."""
+
+    def test_counts_each_recorded_address(self):
+        """ignored_total matches the addresses recorded in ignored_changes."""
+        analyzer = TerraformPlanAnalyzer("plan.json", custom_ignore_fields={"sku"})
+        for address in ("azurerm_a.one", "azurerm_a.two"):
+            change = {
+                "before": {"sku": "S1", "name": "x"},
+                "after": {"sku": "S2", "name": "y"},
+            }
+            analyzer._get_changed_attributes(change, address)
+
+        recorded = sum(
+            len(resources)
+            for fields in analyzer.ignored_changes.values()
+            for resources in fields.values()
+        )
+        assert analyzer.ignored_total == recorded == 2
+
+
+class TestIgnoredChangesByField:
+    """Unit tests for _ignored_changes_by_field."""
+
+    def test_regroups_after_new_ignored_changes(self):
+        """The grouping is reused until another ignored change is recorded."""
+        analyzer = TerraformPlanAnalyzer("plan.json", custom_ignore_fields={"sku"})
+        change = {"before": {"sku": "S1"}, "after": {"sku": "S2"}}
+
+        analyzer._get_changed_attributes(change, "azurerm_a.one")
+        first = analyzer._ignored_changes_by_field()
+        assert first == {"sku": [("azurerm_a.one", "azurerm_a")]}
+        assert analyzer._ignored_changes_by_field() is first
+
+        analyzer._get_changed_attributes(change, "azurerm_b.two")
+        assert analyzer._ignored_changes_by_field() == {
+            "sku": [("azurerm_a.one", "azurerm_a"), ("azurerm_b.two", "azurerm_b")]
+        }
+
+
+class TestJsonFileHelpers:
+    """Unit tests for _write_json_file and load_json_file."""
+
+    REPORT = {
+        "summary": {"total": 2, "ignored_changes": 0},
+        "updated_resources": [
+            {"address": "azurerm_a.one", "changes": [{"before": 1.5, "after": None}]}
+        ],
+        "wide": 2**70,
+    }
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trips_with_and_without_orjson(
+        self, tmp_path, monkeypatch, use_orjson
+    ):
+        """The report decodes to the same data whichever encoder is used."""
+        if not use_orjson:
+            monkeypatch.setattr(analyze_plan, "orjson", None)
+        output = tmp_path / "report.json"
+
+        analyze_plan._write_json_file(self.REPORT, str(output))
+
+        assert load_json_file(str(output)) == self.REPORT
+        assert output.read_text().startswith('{\n  "summary": {')
+
+    def test_load_rejects_invalid_json(self, tmp_path):
+        """Invalid input raises the stdlib decode error either way."""
+        path = tmp_path / "bad.json"
+        path.write_text('{"resource_changes": [')
+
+        with pytest.raises(json.JSONDecodeError):
+            load_json_file(str(path))
+
+
+class TestCanonicalJson:
+    """Unit tests for _canonical_json."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_ignores_key_order(self, monkeypatch, use_orjson):
+        """Key order does not change the key; values do."""
+        if not use_orjson:
+            monkeypatch.setattr(analyze_plan, "orjson", None)
+        key = analyze_plan._canonical_json({"b": [1, "é"], "a": None})
+
+        assert key == analyze_plan._canonical_json({"a": None, "b": [1, "é"]})
+        assert key != analyze_plan._canonical_json({"a": None, "b": [1, "e"]})
+
+    def test_fallback_is_compact(self, monkeypatch):
+        """The stdlib fallback writes no separator whitespace."""
+        monkeypatch.setattr(analyze_plan, "orjson", None)
+        assert analyze_plan._canonical_json({"b": 1, "a": [2**70, "é"]}) == (
+            '{"a":[%d,"é"],"b":1}' % 2**70
+        )
+
+
+class TestCountSensitive:
+    """Unit tests for _count_sensitive."""
+
+    @pytest.mark.parametrize(
+        "marker, expected",
+        [
+            (True, 1),
+            (False, 0),
+            (None, 0),
+            ({"a": True, "b": False, "c": {"d": True}}, 2),
+            ([True, [True, {"x": True}], False], 3),
+            ({}, 0),
+        ],
+    )
+    def test_counts_true_markers(self, marker, expected):
+        """Every True leaf in the marker structure is counted."""
+        assert analyze_plan._count_sensitive(marker) == expected
+
+
+class TestDeriveOutputPath:
+    """Unit tests for _derive_output_path."""
+
+    @pytest.mark.parametrize(
+        "plan_file, suffix, expected",
+        [
+            ("plans/dev.json", ".html", "plans/dev.html"),
+            ("plans/dev.json", ".report.json", "plans/dev.report.json"),
+            ("plans/dev.tfplan", ".html", "plans/dev.tfplan.html"),
+            ("dev", ".report.json", "dev.report.json"),
+        ],
+    )
+    def test_replaces_json_extension(self, plan_file, suffix, expected):
+        """A .json extension is replaced, anything else is kept."""
+        assert analyze_plan._derive_output_path(plan_file, suffix) == expected
+
+
+class TestSplitListArg:
+    """Unit tests for _split_list_arg."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("dev,prod", ["dev", "prod"]),
+            (" dev , prod ", ["dev", "prod"]),
+            ("dev,,prod,", ["dev", "prod"]),
+            (" , ", []),
+        ],
+    )
+    def test_strips_and_drops_blanks(self, value, expected):
+        """Entries are stripped and blank ones removed."""
+        assert analyze_plan._split_list_arg(value) == expected
@@ -41,6 +41,9 @@ class TestComputeAttributeDiffs:
             assert len(location_diffs) == 1
             assert location_diffs[0].is_different is True
 
+            # Only the differing attribute is listed as changed
+            assert rc.changed_attribute_diffs == location_diffs
+
     def test_no_differences(self):
         """Test computing diffs when configs are identical."""
         rc = ResourceComparison("aws_instance.web", "aws_instance")
@@ -57,6 +60,7 @@ class TestComputeAttributeDiffs:
             if hasattr(rc, "attribute_diffs"):
                 for ad in rc.attribute_diffs:
                     assert ad.is_different is False
+                assert rc.changed_attribute_diffs == []
 
     def test_nested_object_attribute(self):
         """Test that nested objects are treated as single top-level attributes."""
@@ -115,3 +119,20 @@ class TestComputeAttributeDiffs:
                 assert len(region_diffs) == 1
                 assert bucket_diffs[0].is_different is True
                 assert region_diffs[0].is_different is True
+
+    def test_sensitive_value_flag(self):
+        """Attributes holding a SENSITIVE marker in any environment are flagged."""
+        rc = ResourceComparison(
+            "azurerm_key_vault_secret.s", "azurerm_key_vault_secret"
+        )
+
+        config1 = {"name": "secret", "value": "[SENSITIVE]"}
+        config2 = {"name": "secret", "value": "[SENSITIVE] (changed)"}
+
+        rc.add_environment_config("env1", config1, config1)
+        rc.add_environment_config("env2", config2, config2)
+        rc.detect_differences()
+        rc.compute_attribute_diffs()
+
+        flags = {ad.attribute_name: ad.has_sensitive_value for ad in rc.attribute_diffs}
+        assert flags == {"name": False, "value": True}
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for diff_utils module.
+
+Covers the character-level highlighter, including the line-level fallback
+for very long strings.
+"""
+
+import html
+import random
+import re
+import string
+
+from src.lib import diff_utils
+from src.lib.diff_utils import highlight_char_diff
+
+
+def _strip_spans(text: str) -> str:
+    """Remove highlight spans and unescape, leaving the original text."""
+    return html.unescape(re.sub(r"</?span[^>]*>", "", text))
+
+
+class TestHighlightCharDiff:
+    """Tests for highlight_char_diff."""
+
+    def test_identical_strings(self):
+        """Identical strings are escaped without any highlighting."""
+        assert highlight_char_diff("<a>", "<a>") == ("&lt;a&gt;", "&lt;a&gt;")
+        assert highlight_char_diff("", "") == ("", "")
+
+    def test_highlights_changed_characters(self):
+        """Only the differing characters are wrapped."""
+        before, after = highlight_char_diff("hello world", "hello terra")
+
+        assert before.startswith("hello ")
+        assert '<span class="char-removed">' in before
+        assert '<span class="char-added">' in after
+        assert _strip_spans(before) == "hello world"
+        assert _strip_spans(after) == "hello terra"
+
+    def test_long_strings_are_diffed_by_line(self, monkeypatch):
+        """Past the length limit whole lines are highlighted."""
+        monkeypatch.setattr(diff_utils, "CHAR_DIFF_MAX_LENGTH", 10)
+        before_str = "same line\nold value\nlast\n"
+        after_str = "same line\nnew value\nlast\n"
+
+        before, after = highlight_char_diff(
+            before_str, after_str, is_baseline_comparison=True
+        )
+
+        assert before == (
+            'same line\n<span class="baseline-char-removed">old value\n</span>last\n'
+        )
+        assert after == (
+            'same line\n<span class="baseline-char-added">new value\n</span>last\n'
+        )
+        assert _strip_spans(before) == before_str
+        assert _strip_spans(after) == after_str
+
+    def test_unrelated_long_values_round_trip(self):
+        """Unrelated long values (keys, certificates) are diffed with difflib."""
+        rng = random.Random(0)
+        alphabet = string.ascii_letters + string.digits + "+/"
+        before_str = "".join(rng.choice(alphabet) for _ in range(12_000))
+        after_str = "".join(rng.choice(alphabet) for _ in range(12_000))
+
+        before, after = highlight_char_diff(before_str, after_str)
+
+        assert _strip_spans(before) == before_str
+        assert _strip_spans(after) == after_str
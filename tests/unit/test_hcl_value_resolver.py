@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Unit tests for hcl_value_resolver module.
+
+Parses small Terraform directories written to tmp_path and checks the
+resolved resources, variables and locals.
+"""
+
+import pytest
+import src.core.hcl_value_resolver as hcl_value_resolver
+from src.core.hcl_value_resolver import (
+    HCLValueResolver,
+    _add_span,
+    _NOT_LITERAL,
+    _in_spans,
+    _parse_literal,
+    _split_list_items,
+)
+
+
+MAIN_TF = """\
+locals {
+  region    = var.location
+  retention = 30
+}
+
+resource "azurerm_windows_web_app" "admin" {
+  name     = "admin-app" # inline comment
+  location = local.region
+  ids      = ["a", "b"]
+  fn       = lower("ABC")
+
+  app_settings = {
+    "WEBSITE_RUN_FROM_PACKAGE" = "1"
+    SETTING_TWO                = var.sku
+  }
+
+  site_config {
+    always_on = true
+    ip_restriction {
+      priority = 100
+    }
+    ip_restriction {
+      priority = 200
+    }
+  }
+}
+"""
+
+
+@pytest.fixture
+def resolver(tmp_path):
+    """Resolver over a directory with variables, tfvars and one resource."""
+    (tmp_path / "variables.tf").write_text(
+        'variable "location" {\n  default = "westeurope"\n}\n'
+        'variable "sku" {\n  default = "S1"\n}\n'
+    )
+    (tmp_path / "terraform.tfvars").write_text('sku = "P1v2"\n')
+    (tmp_path / "main.tf").write_text(MAIN_TF)
+    return HCLValueResolver(str(tmp_path))
+
+
+class TestHCLValueResolver:
+    """Tests for HCLValueResolver parsing."""
+
+    def test_tfvars_override_defaults(self, resolver):
+        """Values from .tfvars take priority over variable defaults."""
+        assert resolver.variables == {"location": "westeurope", "sku": "P1v2"}
+        assert resolver.locals == {"region": "westeurope", "retention": 30}
+
+    def test_terraform_tfvars_wins_over_other_tfvars(self, tmp_path, resolver):
+        """terraform.tfvars is applied last whatever the glob order."""
+        (tmp_path / "zz.tfvars").write_text('sku = "B1"\nextra = 1\n')
+        resolver = HCLValueResolver(str(tmp_path))
+        assert resolver.variables["sku"] == "P1v2"
+        assert resolver.variables["extra"] == 1
+
+    def test_simple_assignments(self, resolver):
+        """Simple values end at the line end and references are resolved."""
+        resource = resolver.resources["azurerm_windows_web_app.admin"]
+        assert resource["name"] == "admin-app"
+        assert resource["location"] == "westeurope"
+        assert resource["ids"] == ["a", "b"]
+        assert resource["fn"] == '${lower("ABC")}'
+
+    def test_maps_and_nested_blocks(self, resolver):
+        """Map assignments, nested blocks and repeated blocks are parsed."""
+        resource = resolver.resources["azurerm_windows_web_app.admin"]
+        assert resource["app_settings"] == {
+            "WEBSITE_RUN_FROM_PACKAGE": "1",
+            "SETTING_TWO": "P1v2",
+        }
+        assert resource["site_config"] == {
+            "always_on": True,
+            "ip_restriction": [{"priority": 100}, {"priority": 200}],
+        }
+
+    def test_get_resource_attribute(self, resolver):
+        """Dotted paths walk nested dicts and miss with None."""
+        address = "azurerm_windows_web_app.admin"
+        assert resolver.get_resource_attribute(address, "site_config.always_on")
+        assert resolver.get_resource_attribute(address, "missing.path") is None
+        assert resolver.get_resource_attribute("unknown.res", "name") is None
+
+    def test_get_resource_attribute_accepts_split_path(self, resolver):
+        """A pre-split tuple path resolves like the dotted string."""
+        address = "azurerm_windows_web_app.admin"
+        assert resolver.get_resource_attribute(
+            address, ("app_settings", "SETTING_TWO")
+        ) == resolver.get_resource_attribute(address, "app_settings.SETTING_TWO")
+
+
+class TestExtractBlockContent:
+    """Tests for HCLValueResolver._extract_block_content."""
+
+    @pytest.mark.parametrize(
+        "content, start_pos, expected",
+        [
+            ("a { b } c", 3, " b "),
+            ("x { a { b } c } d", 3, " a { b } c "),
+            ("{}", 1, ""),
+            ("{ open { never closed", 1, " open { never close"),
+            ("", 0, ""),
+            ('{ a = "{" b } c', 1, ' a = "{" b '),
+            ('{ a = "\\"}" } c', 1, ' a = "\\"}" '),
+        ],
+    )
+    def test_matches_closing_brace(self, content, start_pos, expected):
+        """Content up to the matching brace is returned."""
+        resolver = HCLValueResolver.__new__(HCLValueResolver)
+        assert resolver._extract_block_content(content, start_pos) == expected
+
+    def test_brace_in_string_does_not_swallow_next_resource(self, tmp_path):
+        """A quoted brace does not extend the resource into the next one."""
+        (tmp_path / "main.tf").write_text(
+            'resource "a" "one" {\n  pattern = "^{"\n}\n'
+            'resource "a" "two" {\n  name = "x"\n}\n'
+        )
+        resolver = HCLValueResolver(str(tmp_path))
+        assert resolver.resources == {
+            "a.one": {"pattern": "^{"},
+            "a.two": {"name": "x"},
+        }
+
+
+class TestSpans:
+    """Tests for the processed-span helpers."""
+
+    def test_enclosing_span_replaces_inner_spans(self):
+        """A block recorded after its nested maps covers all of them."""
+        starts, ends = [], []
+        _add_span(20, 30, starts, ends)
+        _add_span(40, 45, starts, ends)
+        _add_span(60, 70, starts, ends)
+        _add_span(10, 50, starts, ends)
+
+        assert (starts, ends) == ([10, 60], [50, 70])
+        assert _in_spans(35, starts, ends)
+        assert _in_spans(50, starts, ends)
+        assert not _in_spans(9, starts, ends)
+        assert not _in_spans(55, starts, ends)
+        assert not _in_spans(0, [], [])
+
+
+class TestSplitListItems:
+    """Tests for _split_list_items."""
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            ('"a", "b"', ['"a"', ' "b"']),
+            ('"a,b", 1', ['"a,b"', " 1"]),
+            ("[1, 2], [3]", ["[1, 2]", " [3]"]),
+            ('join(",", var.x), "y"', ['join(",", var.x)', ' "y"']),
+            ('"say \\"hi, there\\"", 2', ['"say \\"hi, there\\""', " 2"]),
+        ],
+    )
+    def test_splits_top_level_commas(self, content, expected):
+        """Commas inside strings, brackets and calls do not split items."""
+        assert _split_list_items(content) == expected
+
+    def test_nested_lists_are_parsed(self):
+        """Nested lists become nested Python lists."""
+        resolver = HCLValueResolver.__new__(HCLValueResolver)
+        resolver.variables = {}
+        resolver.locals = {}
+        assert resolver._parse_value('[["a", "b"], "c,d"]') == [["a", "b"], "c,d"]
+
+
+class TestParseValue:
+    """Tests for HCLValueResolver._parse_value."""
+
+    @pytest.mark.parametrize(
+        "value_str, expected",
+        [
+            ('"text"', "text"),
+            ("true", True),
+            ("null", None),
+            ("42", 42),
+            ("-7", -7),
+            ("1.5", 1.5),
+            (".5", 0.5),
+            ("1_000", 1000),
+            ("var.sku", "S1"),
+            ("var.missing", "${var.missing}"),
+            ("local.env", "dev"),
+            ("azurerm_resource_group.main.name", "${azurerm_resource_group.main.name}"),
+            ('lower("A")', '${lower("A")}'),
+            ("1e5", "1e5"),
+            ("plain", "plain"),
+        ],
+    )
+    def test_parses_scalars_and_references(self, value_str, expected):
+        """Scalars are converted and unresolved references become interpolations."""
+        resolver = HCLValueResolver.__new__(HCLValueResolver)
+        resolver.variables = {"sku": "S1"}
+        resolver.locals = {"env": "dev"}
+        assert resolver._parse_value(value_str) == expected
+
+
+class TestParseLiteral:
+    """Tests for _parse_literal."""
+
+    @pytest.mark.parametrize("value_str", ["var.sku", "a.b", "[1]", "1e5", ""])
+    def test_non_literals_return_sentinel(self, value_str):
+        """References, collections and non-numbers are left to _parse_value."""
+        assert _parse_literal(value_str) is _NOT_LITERAL
+
+    def test_repeated_values_are_cached(self):
+        """The same literal is parsed once."""
+        _parse_literal.cache_clear()
+        assert _parse_literal('"westeurope"') == "westeurope"
+        assert _parse_literal('"westeurope"') == "westeurope"
+        assert _parse_literal.cache_info().hits == 1
+
+
+class TestParseJsonList:
+    """Tests for the JSON list fast path."""
+
+    @pytest.mark.parametrize(
+        "value_str",
+        [
+            '["a", "b", "c"]',
+            '["${var.sku}", 1, true, null]',
+            '["a", 1.5]',
+            '["a", 1e5]',
+            '["a\\"b"]',
+            '[["a"], "b"]',
+            '["a", var.sku]',
+            '["a",]',
+        ],
+    )
+    def test_matches_handwritten_list_parser(self, monkeypatch, value_str):
+        """The fast path never changes how a list is parsed."""
+        resolver = HCLValueResolver.__new__(HCLValueResolver)
+        resolver.variables = {"sku": "S1"}
+        resolver.locals = {}
+        fast = resolver._parse_value(value_str)
+
+        monkeypatch.setattr(hcl_value_resolver, "orjson", None)
+        assert repr(resolver._parse_value(value_str)) == repr(fast)
+
+    @pytest.mark.parametrize(
+        "value_str, expected",
+        [
+            ('["a", "b"]', ["a", "b"]),
+            ('["a", 1.5]', None),
+            ('[["a"]]', None),
+            ('["a\\"b"]', None),
+            ('["a", var.sku]', None),
+        ],
+    )
+    def test_accepts_only_flat_exact_lists(self, value_str, expected):
+        """Lists the fast path could decode differently are declined."""
+        if hcl_value_resolver.orjson is None:
+            pytest.skip("orjson not installed")
+        assert hcl_value_resolver._parse_json_list(value_str) == expected
@@ -16,6 +16,8 @@ from src.lib.ignore_utils import (
     load_ignore_config,
     apply_ignore_config,
     get_ignored_attributes,
+    get_ignore_attributes_for_type,
+    remove_ignored_attributes,
     supports_dot_notation,
 )
 
@@ -356,6 +358,53 @@ class TestApplyIgnoreConfig:
         assert "tags" in original  # Original unchanged
         assert "tags" not in result
 
+    def test_nested_removal_does_not_modify_original(self):
+        """Nested removals copy the dicts on the path and share the rest."""
+        original = {
+            "identity": {"type": "SystemAssigned", "ids": ["a"]},
+            "site_config": {"always_on": True},
+        }
+        rules = {"global_ignores": ["identity.type"]}
+
+        result = apply_ignore_config(original, rules, "azurerm_resource")
+
+        assert result == {
+            "identity": {"ids": ["a"]},
+            "site_config": {"always_on": True},
+        }
+        assert original["identity"] == {"type": "SystemAssigned", "ids": ["a"]}
+        assert result["site_config"] is original["site_config"]
+
+
+class TestGetIgnoreAttributesForType:
+    """Tests for get_ignore_attributes_for_type and remove_ignored_attributes."""
+
+    def test_collects_global_and_resource_specific(self):
+        """Global and matching resource-specific names are combined."""
+        rules = {
+            "global_ignores": {"tags": "Managed separately"},
+            "resource_ignores": {
+                "azurerm_resource": ["description"],
+                "azurerm_other": ["sku"],
+            },
+        }
+
+        assert get_ignore_attributes_for_type(rules, "azurerm_resource") == {
+            "tags",
+            "description",
+        }
+        assert get_ignore_attributes_for_type({}, "azurerm_resource") == set()
+
+    def test_precomputed_attributes_match_apply_ignore_config(self):
+        """Filtering with precomputed names gives the same result."""
+        config = {"name": "test", "tags": {"env": "dev"}, "identity": {"type": "x"}}
+        rules = {"global_ignores": ["tags", "identity.type"]}
+        attributes = get_ignore_attributes_for_type(rules, "azurerm_resource")
+
+        assert remove_ignored_attributes(config, attributes) == apply_ignore_config(
+            config, rules, "azurerm_resource"
+        )
+
 
 class TestGetIgnoredAttributes:
     """Tests for get_ignored_attributes function."""
@@ -47,6 +47,28 @@ class TestEnvironmentPlan:
         assert web_config is not None
         assert web_config.get("instance_type") == "t2.micro"
 
+    @pytest.mark.parametrize(
+        "before_sensitive, expected",
+        [
+            ({"tags": {}, "disks": [{}]}, None),
+            ({"tags": {"secret": True}}, {"tags": {"secret": "[SENSITIVE]"}}),
+            ({"disks": [{}, {}]}, {"disks": [{"size": 1}, None]}),
+        ],
+    )
+    def test_masking_only_rebuilds_when_needed(self, before_sensitive, expected):
+        """Maps that mark nothing leave the config object untouched."""
+        plan = EnvironmentPlan(label="dev", plan_file_path=Path("test.json"))
+        config = {"tags": {"secret": "x"}, "disks": [{"size": 1}]}
+        change = {"change": {"before_sensitive": before_sensitive}}
+
+        masked = plan._process_sensitive_values(config, change)
+
+        if expected is None:
+            assert masked is config
+        else:
+            for key, value in expected.items():
+                assert masked[key] == value
+
 
 class TestResourceComparison:
     """Unit tests for ResourceComparison class."""
@@ -123,6 +145,145 @@ class TestResourceComparison:
         # Should have differences if resource is missing in some environments
         assert rc.has_differences == True
 
+    def test_mark_changed_sensitive_values(self):
+        """Only sensitive fields whose raw values differ are marked as changed."""
+        rc = ResourceComparison(
+            resource_address="aws_instance.web", resource_type="aws_instance"
+        )
+        masked = {"password": "[SENSITIVE]", "token": "[SENSITIVE]", "size": 1}
+        rc.add_environment_config(
+            "dev", dict(masked), {"password": "a", "token": "t", "size": 1}
+        )
+        rc.add_environment_config(
+            "prod", dict(masked), {"password": "b", "token": "t", "size": 2}
+        )
+        rc.add_environment_config(
+            "test", dict(masked), {"password": "a", "token": "t", "size": 1}
+        )
+
+        rc.detect_differences()
+        rc.mark_changed_sensitive_values()
+
+        assert rc.env_configs["prod"] == {
+            "password": "[SENSITIVE] (changed)",
+            "token": "[SENSITIVE]",
+            "size": 1,
+        }
+        assert rc.env_configs["test"] == masked
+
+    def test_mark_changed_values_nested(self):
+        """Nested markers are updated in place of the masked structure's shape."""
+        rc = ResourceComparison(
+            resource_address="aws_instance.web", resource_type="aws_instance"
+        )
+        masked = {"z": [{"key": "[SENSITIVE]"}, "[SENSITIVE]"], "a": "[SENSITIVE]"}
+        result = rc._mark_changed_values(
+            {"z": [{"key": "1"}, "s"], "a": "x"},
+            {"z": [{"key": "2"}, "s"], "a": "x"},
+            masked,
+            masked,
+        )
+
+        assert list(result) == ["z", "a"]
+        assert result == {
+            "z": [{"key": "[SENSITIVE] (changed)"}, "[SENSITIVE]"],
+            "a": "[SENSITIVE]",
+        }
+        assert masked["z"][0]["key"] == "[SENSITIVE]"
+
+    def test_mark_changed_sensitive_values_skips_unmasked_configs(self):
+        """Configs that were never masked are left alone."""
+        rc = ResourceComparison(
+            resource_address="aws_instance.web", resource_type="aws_instance"
+        )
+        dev = {"password": "[SENSITIVE]"}
+        prod = {"password": "[SENSITIVE]", "size": 2}
+        rc.add_environment_config("dev", dev, dev)
+        rc.add_environment_config("prod", prod, prod)
+
+        rc.detect_differences()
+        rc.mark_changed_sensitive_values()
+
+        assert rc.has_masked_values == False
+        assert rc.env_configs["prod"] is prod
+
+    def test_has_sensitive_differences_finds_nested_marker(self):
+        """A [SENSITIVE] marker deep inside lists and dicts is found."""
+        rc = ResourceComparison(
+            resource_address="aws_instance.web", resource_type="aws_instance"
+        )
+        nested = {"a": [{"b": [1, {"c": "[SENSITIVE]"}]}]}
+        rc.add_environment_config("dev", nested)
+        rc.add_environment_config("prod", {"a": []})
+
+        assert rc.has_sensitive_differences() == False
+        rc.detect_differences()
+        assert rc.has_sensitive_differences() == True
+
+        rc.add_environment_config("dev", {"a": [{"b": [1, {"c": "SENSITIVE"}]}]})
+        assert rc.has_sensitive_differences() == False
+
+    def test_has_sensitive_differences_is_cached(self):
+        """The result is reused until the configs are updated."""
+        rc = ResourceComparison(
+            resource_address="aws_instance.web", resource_type="aws_instance"
+        )
+        rc.add_environment_config("dev", {"password": "[SENSITIVE]"})
+        rc.add_environment_config("prod", None)
+        rc.detect_differences()
+
+        assert rc.has_sensitive_differences() == True
+        rc.env_configs["dev"] = {}
+        assert rc.has_sensitive_differences() == True
+
+        rc.detect_differences()
+        assert rc.has_sensitive_differences() == False
+
+    def test_detect_differences_uses_matching_hashes(self):
+        """Matching config hashes settle the comparison without a walk."""
+        rc = ResourceComparison(
+            resource_address="aws_instance.web", resource_type="aws_instance"
+        )
+        # Configs differ but carry the same hash, so the hash must decide
+        rc.add_environment_config("dev", {"a": 1}, config_hash=b"same")
+        rc.add_environment_config("prod", {"a": 2}, config_hash=b"same")
+
+        rc.detect_differences()
+
+        assert rc.has_differences == False
+
+    def test_compute_attribute_diffs_shares_attribute_names(self):
+        """Resources with the same key layout reuse the cached attribute names."""
+        cache = {}
+        names = []
+        cases = [("a.one", set()), ("a.two", set()), ("a.three", {"b"})]
+        for address, ignored in cases:
+            rc = ResourceComparison(resource_address=address, resource_type="a")
+            rc.add_environment_config("dev", {"b": 1, "a": 2})
+            rc.add_environment_config("prod", {"b": 1, "a": 3})
+            rc.ignored_attributes = ignored
+            rc.compute_attribute_diffs(cache)
+            names.append([d.attribute_name for d in rc.attribute_diffs])
+
+        assert names == [["a", "b"], ["a", "b"], ["a"]]
+        assert len(cache) == 2
+
+    def test_detect_differences_falls_back_without_hashes(self):
+        """Differing or missing hashes fall back to comparing the configs."""
+        rc = ResourceComparison(
+            resource_address="aws_instance.web", resource_type="aws_instance"
+        )
+        rc.add_environment_config("dev", {"a": 1}, config_hash=b"dev")
+        rc.add_environment_config("prod", {"a": 1}, config_hash=b"prod")
+        rc.add_environment_config("test", {"a": 2})
+
+        rc.detect_differences()
+
+        assert rc.has_differences == True
+        del rc.env_configs_raw["test"], rc.env_config_hashes["test"]
+        rc.detect_differences()
+        assert rc.has_differences == False
+
 
 class TestMultiEnvReport:
     """Unit tests for MultiEnvReport class."""
@@ -158,6 +319,29 @@ class TestMultiEnvReport:
         assert len(env1.before_values) > 0
         assert len(env2.before_values) > 0
 
+    def test_load_environments_in_parallel(self, monkeypatch):
+        """Worker processes produce the same values as loading in turn."""
+        from src.core import multi_env_comparator
+
+        paths = ["tests/fixtures/dev-plan.json", "tests/fixtures/staging-plan.json"]
+        expected = []
+        for path in paths:
+            env = EnvironmentPlan(label=path, plan_file_path=Path(path))
+            env.load()
+            expected.append((env.before_values, env.before_values_raw))
+
+        monkeypatch.setattr(multi_env_comparator, "_PARALLEL_LOAD_MIN_BYTES", 0)
+        monkeypatch.setattr(multi_env_comparator.os, "cpu_count", lambda: 2)
+        envs = [EnvironmentPlan(label=p, plan_file_path=Path(p)) for p in paths]
+        MultiEnvReport(environments=envs).load_environments()
+
+        assert [(e.before_values, e.before_values_raw) for e in envs] == expected
+        # Unmasked configs still share one object with their raw config
+        for env in envs:
+            for address, config in env.before_values.items():
+                if "[SENSITIVE]" not in json.dumps(config):
+                    assert config is env.before_values_raw[address]
+
     def test_build_comparisons(self):
         """Test building resource comparisons."""
         env1 = EnvironmentPlan(
@@ -227,6 +411,86 @@ class TestMultiEnvReport:
         assert "dev" in html_content
         assert "staging" in html_content
 
+    def test_generate_text_verbose_indents_configs(self):
+        """Verbose text output indents every line of each configuration."""
+        env1 = EnvironmentPlan(
+            label="dev", plan_file_path=Path("tests/fixtures/dev-plan.json")
+        )
+        env2 = EnvironmentPlan(
+            label="staging", plan_file_path=Path("tests/fixtures/staging-plan.json")
+        )
+        report = MultiEnvReport(environments=[env1, env2])
+        report.load_environments()
+        report.build_comparisons()
+        report.calculate_summary()
+
+        text = report.generate_text(verbose=True)
+
+        config = report.resource_comparisons[0].env_configs["dev"]
+        expected = "\n".join(
+            "    " + line
+            for line in json.dumps(config, indent=4, sort_keys=True).split("\n")
+        )
+        assert f"  [dev]\n{expected}\n" in text
+
+    def test_generate_html_escapes_labels_and_addresses(self, tmp_path):
+        """Environment labels and resource addresses are HTML-escaped."""
+        env1 = EnvironmentPlan(
+            label="dev<1>", plan_file_path=Path("tests/fixtures/dev-plan.json")
+        )
+        env2 = EnvironmentPlan(
+            label="staging&co", plan_file_path=Path("tests/fixtures/staging-plan.json")
+        )
+        report = MultiEnvReport(environments=[env1, env2])
+        report.load_environments()
+        report.build_comparisons()
+        report.calculate_summary()
+        rc = report.resource_comparisons[0]
+        rc.resource_address = 'module.app["<web>"]'
+
+        output_file = tmp_path / "test_report.html"
+        report.generate_html(str(output_file))
+
+        html_content = output_file.read_text(encoding="utf-8")
+        assert "dev<1>" not in html_content
+        assert "staging&co" not in html_content
+        assert '<div class="env-label">dev&lt;1&gt;</div>' in html_content
+        assert "environments: dev&lt;1&gt;, staging&amp;co</p>" in html_content
+        assert (
+            '<span class="resource-name">module.app[&quot;&lt;web&gt;&quot;]</span>'
+            in html_content
+        )
+
+    @pytest.mark.parametrize("diff_only", [False, True])
+    def test_partition_comparisons(self, diff_only):
+        """Comparisons are split into report sections once, honouring diff_only."""
+        envs = [
+            EnvironmentPlan(label=label, plan_file_path=Path(f"{label}.json"))
+            for label in ("dev", "staging", "prod")
+        ]
+        report = MultiEnvReport(environments=envs, diff_only=diff_only)
+
+        def make_rc(address, present_in, different):
+            rc = ResourceComparison(resource_address=address, resource_type="t")
+            for label in present_in:
+                rc.add_environment_config(label, {"a": 1})
+            rc.has_differences = different
+            return rc
+
+        regular = make_rc("t.regular", ["dev", "staging", "prod"], False)
+        first_only = make_rc("t.first", ["dev"], True)
+        env_specific = make_rc("t.partial", ["dev", "prod"], True)
+        report.resource_comparisons = [regular, first_only, env_specific]
+
+        report._partition_comparisons()
+
+        assert report._regular_rcs == ([] if diff_only else [regular])
+        assert report._first_env_only_rcs == [first_only]
+        assert report._env_specific_rcs == [env_specific]
+        assert report._shown_rcs == (
+            [first_only, env_specific] if diff_only else report.resource_comparisons
+        )
+
 
 class TestIgnoreCounts:
     """Unit tests for US3 - Combined Normalization Ignore Tracking."""
@@ -303,3 +567,105 @@ class TestIgnoreCounts:
         assert "2 attributes ignored" in badge_html or "2 normalized" in badge_html, "Should show normalized count"
         assert "subscription_id" in badge_html, "Should list normalized attributes"
         assert "tenant_id" in badge_html, "Should list normalized attributes"
+
+
+class TestJsonEqual:
+    """Unit tests for _json_equal."""
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ({"a": 1, "b": [1, {"c": "x"}]}, {"b": [1, {"c": "x"}], "a": 1}),
+            ({"a": 1}, {"a": 1.0}),
+            ([True], [1]),
+            (0.0, -0.0),
+            (float("nan"), float("nan")),
+            ({"a": None}, {}),
+            ([1, 2], [2, 1]),
+            ("1", 1),
+        ],
+    )
+    def test_matches_sorted_json_comparison(self, a, b):
+        """Equality agrees with comparing sorted json.dumps output."""
+        from src.core.multi_env_comparator import _json_equal
+
+        expected = json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+        assert _json_equal(a, b) is expected
+        assert _json_equal(b, a) is expected
+
+    def test_cached_comparison_reuses_result(self):
+        """Repeated comparisons of the same objects are answered from the cache."""
+        from src.core.multi_env_comparator import _json_equal_cached
+
+        baseline, other = {"a": [1, 2]}, {"a": [1, 3]}
+        cache = {}
+
+        assert not _json_equal_cached(other, baseline, cache)
+        cache[(id(other), id(baseline))] = (True, other, baseline)
+        assert _json_equal_cached(other, baseline, cache)
+        assert _json_equal_cached(baseline, {"a": [1, 2]}, cache)
+        assert len(cache) == 2
+
+
+class TestFindBaseline:
+    """Unit tests for _find_baseline."""
+
+    def test_first_environment_with_a_value(self):
+        """The baseline is the first environment, in report order, with a value."""
+        from src.core.multi_env_comparator import _find_baseline
+
+        values = {"prod": [1], "dev": None, "staging": False}
+
+        assert _find_baseline(values, ["dev", "staging", "prod"]) == ("staging", False)
+        assert _find_baseline(values, ["dev", "test"]) == (None, None)
+
+
+class TestCompactJson:
+    """Unit tests for _compact_json."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"name": "web", "tags": {"env": "dev"}, "ports": [80, 443]},
+            ["ä", "日本", None, True, 1.5],
+            {"big": 2**70},
+        ],
+    )
+    def test_round_trips(self, value):
+        """Encoded values decode back to the original, non-ASCII unescaped."""
+        from src.core.multi_env_comparator import _compact_json
+
+        encoded = _compact_json(value)
+        assert json.loads(encoded) == value
+        assert "\\u" not in encoded
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_output_does_not_depend_on_orjson(self, monkeypatch, use_orjson):
+        """The stdlib fallback writes the same compact JSON as orjson."""
+        from src.core import multi_env_comparator
+
+        if not use_orjson:
+            monkeypatch.setattr(multi_env_comparator, "orjson", None)
+
+        assert multi_env_comparator._compact_json(
+            {"name": "wéb", "ports": [80, 443]}
+        ) == '{"name":"wéb","ports":[80,443]}'
+        assert multi_env_comparator._compact_json({"a": [2**70, None]}) == (
+            '{"a":[%d,null]}' % 2**70
+        )
+
+
+class TestConfigHash:
+    """Unit tests for _config_hash."""
+
+    def test_hash_follows_json_equality(self):
+        """Equal configs hash alike regardless of key order; 1 and 1.0 differ."""
+        from src.core import multi_env_comparator
+        from src.core.multi_env_comparator import _config_hash
+
+        if multi_env_comparator.orjson is None:
+            assert _config_hash({"a": 1}) is None
+            return
+        assert _config_hash({"a": 1, "b": [1]}) == _config_hash({"b": [1], "a": 1})
+        assert _config_hash({"a": 1}) != _config_hash({"a": 1.0})
+        assert _config_hash({"big": 2**70}) is None